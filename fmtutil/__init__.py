@@ -27,6 +27,8 @@ from .exceptions import (
     FormatterValueError,
 )
 from .formatter import (
+    CompiledAnyFormat,
+    CompiledFormat,
     Constant,
     ConstantType,
     Datetime,
@@ -36,6 +38,7 @@ from .formatter import (
     FormatterGroupType,
     FormatterType,
     Naming,
+    ParseFailure,
     ReturnFormattersType,
     ReturnPrioritiesType,
     Serial,
@@ -51,6 +54,9 @@ logging.getLogger(__name__)
 __all__ = (
     "Formatter",
     "FormatterType",
+    "CompiledFormat",
+    "CompiledAnyFormat",
+    "ParseFailure",
     "Serial",
     "Datetime",
     "Version",
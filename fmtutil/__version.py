@@ -758,7 +758,7 @@ class VersionPackage(BaseVersion):
         self.dev: str | None = None if dev is None else str(dev)
         self.local = None if local is None else str(local)
 
-    def __extract_tuple(self):
+    def __extract_tuple(self) -> tuple[Any, ...]:
         release: tuple[int, ...] = necessary_release(self.to_tuple()[1:4])
         if self.pre is None and self.post is None and self.dev is not None:
             pre = NegInf
@@ -977,6 +977,12 @@ class VersionPackage(BaseVersion):
             )
         return cmp(self.__extract_tuple(), other.__extract_tuple())
 
+    def sort_key(self) -> tuple[Any, ...]:
+        """Return a comparison key tuple of this Packaging version that use
+        in the compare method.
+        """
+        return self.__extract_tuple()
+
     def is_compatible(self, other: VersionPackage) -> bool:
         """Check the other version that compatible with this Packaging version.
 
@@ -15,24 +15,33 @@ import inspect
 import math
 import re
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from functools import lru_cache, partial, total_ordering, wraps
+from heapq import heappop, heappush
+from io import BufferedIOBase, RawIOBase, TextIOBase
 from itertools import tee, zip_longest
+from operator import methodcaller
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
+    Generic,
+    Literal,
     NoReturn,
     TypedDict,
+    TypeVar,
     Union,
     final,  # docs: https://github.com/python/mypy/issues/9953
 )
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
+    from dateutil.relativedelta import relativedelta
     from typing_extensions import Self, TypeAlias
 
 from .__type import (
@@ -63,6 +72,7 @@ from .utils import (
 )
 
 FormatterType = type["Formatter"]
+FormatterT = TypeVar("FormatterT", bound="Formatter")
 FormatterGroupType = type["FormatterGroup"]
 ConstantType = type["Constant"]
 
@@ -72,17 +82,97 @@ PriorityCallable: TypeAlias = Union[
     partial[Any],
 ]
 FormatterCallable: TypeAlias = Union[Callable[[], Any], partial[Any]]
+InferState: TypeAlias = tuple[
+    tuple[int, ...], int, tuple[str, ...], frozenset[str]
+]
+AnyFormatState: TypeAlias = tuple[
+    tuple[int, ...],
+    re.Pattern[str],
+    dict[str, tuple[int, tuple[tuple[str, str], ...]]],
+]
 
 
-def lazy_relativedelta():  # pragma: no cover
-    """Lazy import relativedelta object that use when install with [all] option."""
+@lru_cache(maxsize=None)
+def lazy_relativedelta() -> type[relativedelta] | None:  # pragma: no cover
+    """Lazy import relativedelta object that use when install with [all] option.
+    The result will cache at the first calling, so the import does not attempt
+    on every arithmetic operation.
+
+    :rtype: type[relativedelta] | None
+    :returns: A relativedelta class, or None if the dateutil package does not
+        install.
+    """
     try:
         from dateutil.relativedelta import relativedelta
     except ImportError:
-        relativedelta = None
+        return None
     return relativedelta
 
 
+class ConfigMeta(type):
+    """Meta-class of the formatter config object that keep a generation
+    counter of itself. This counter will increase when any attribute of the
+    config class was set or deleted after class creation, so any derived cache
+    that keyed on the generation will be invalidated safely.
+    """
+
+    def __init__(
+        cls,
+        name: str,
+        bases: tuple[type, ...],
+        attrs: dict[str, Any],
+    ) -> None:
+        super().__init__(name, bases, attrs)
+        type.__setattr__(cls, "_generation", 0)
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        type.__setattr__(cls, "_generation", cls.__dict__["_generation"] + 1)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        type.__setattr__(cls, "_generation", cls.__dict__["_generation"] + 1)
+
+    @property
+    def generation(cls) -> int:
+        """Return a generation number of this config class that sum from the
+        generation counter of itself and all parent config classes.
+
+        :rtype: int
+        """
+        return sum(
+            c.__dict__["_generation"]
+            for c in cls.__mro__
+            if isinstance(c, ConfigMeta)
+        )
+
+
+def config_cache(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Cache decorator function for the class-method that does not receive any
+    argument. The result will cache per class and the generation number of its
+    config class, ``cls.Config.generation``, so it will recompute when the
+    config was changed.
+
+    :param func: A class-method function that want to cache.
+    :type func: Callable[[Any], Any]
+
+    :rtype: Callable[[Any], Any]
+    """
+    caches: WeakKeyDictionary[type, tuple[int, Any]] = WeakKeyDictionary()
+
+    @wraps(func)
+    def wrapper(cls: type) -> Any:
+        generation: int = cls.Config.generation  # type: ignore[attr-defined]
+        if (cached := caches.get(cls)) is not None and cached[0] == generation:
+            return cached[1]
+        rs: Any = func(cls)
+        caches[cls] = (generation, rs)
+        return rs
+
+    wrapper.cache_clear = caches.clear  # type: ignore[attr-defined]
+    return wrapper
+
+
 class PriorityValue(TypedDict):
     """Type Dictionary for value of mapping of ``cls.priorities``"""
 
@@ -123,8 +213,12 @@ class SlotLevel:
     Attributes:
         * level: int
             A number of level that represent n-layer of this instance.
-        * slot: List[bool]
-            A list of boolean that have index equal the level attribute.
+        * mask: int
+            A bitmask of slot that the bit of index n is set when the level
+            number n + 1 was updated.
+        * slot: SlotView
+            A list of boolean that have index equal the level attribute. It
+            writes through to the slot bitmask when it sets an item.
         * count: int
             A counting number of True value in the slot.
         * value: int
@@ -133,6 +227,8 @@ class SlotLevel:
     Methods:
         * update: int | TupleInt | None -> SlotLevel
             Self that was updated level
+        * freeze: [] -> SlotLevel
+            Self that does not allow any change of its slot.
         * checker: [Union[int, TupleInt]] -> bool
             A True if all values in ``self.slot`` that match with index numbers
             are True.
@@ -144,30 +240,102 @@ class SlotLevel:
 
     __slots__ = (
         "level",
-        "slot",
+        "mask",
+        "_value",
+        "_count",
+        "_hash",
+        "_frozen",
     )
 
     def __init__(self, level: int) -> None:
-        """Main initialize of the slot object that define a slot list
-        with level input value length of False.
+        """Main initialize of the slot object that define a slot bitmask
+        with level input value length of zero bits.
         """
+        self._frozen: bool = False
         self.level = level
-        self.slot: list[bool] = [False] * level
+        self.mask: int = 0
+        self._value: int = 0
+        self._count: int = 0
+        self._hash: int | None = None
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(level={self.level})>"
 
+    def freeze(self) -> Self:
+        """Freeze this slot level object that make its slot be read-only, so
+        the updating or setting its slot will raise an AttributeError. This
+        method will call from the freezing of the owner formatter instance.
+
+        :rtype: Self
+        :returns: This slot level object itself.
+        """
+        self._frozen = True
+        return self
+
+    def __check_frozen(self) -> None:
+        """Raise an AttributeError if this slot level object was frozen."""
+        if self._frozen:
+            raise AttributeError(
+                f"cannot update the slot of frozen "
+                f"{self.__class__.__name__!r} instance"
+            )
+
     def __str__(self) -> str:
         return str(self.level)
 
     def __hash__(self) -> int:
-        return hash(tuple(self.slot))
+        if self._hash is None:
+            self._hash = hash(tuple(self.slot))
+        return self._hash
 
     def __eq__(self, other: Union[SlotLevel, Any]) -> bool:
-        return isinstance(other, self.__class__) and self.value == other.value
+        return isinstance(other, SlotLevel) and self._value == other._value
 
     def __lt__(self, other: SlotLevel) -> bool:
-        return self.value < other.value
+        return self._value < other._value
+
+    @property
+    def slot(self) -> SlotView:
+        """Return a list of boolean that have index equal the level attribute
+        that was generated from the slot bitmask. Setting an item of this
+        list will write through to the slot bitmask.
+
+        :rtype: SlotView
+        """
+        return SlotView(self)
+
+    @slot.setter
+    def slot(self, values: Iterable[bool]) -> None:
+        """Set the slot bitmask from a list of boolean that have index equal
+        the level attribute.
+
+        :param values: A list of boolean that has the level number of items.
+        :type values: Iterable[bool]
+
+        :raises FormatterValueError: If the number of items does not equal
+            the level attribute.
+        """
+        if len(_values := list(values)) != self.level:
+            raise FormatterValueError(
+                f"slot of the slot level object should have {self.level} "
+                f"items, but it has {len(_values)} items."
+            )
+        self._set_mask(sum(bool(v) << i for i, v in enumerate(_values)))
+
+    def _set_mask(self, mask: int) -> None:
+        """Set the slot bitmask and recompute the counting number and the
+        weighted value of this slot.
+
+        :param mask: A bitmask of slot.
+        :type mask: int
+
+        :raises AttributeError: If this slot level object was frozen.
+        """
+        self.__check_frozen()
+        self.mask = mask
+        self._count = _popcount(mask)
+        self._value = sum(i + 1 for i in range(self.level) if mask >> i & 1)
+        self._hash = None
 
     @property
     def count(self) -> int:
@@ -176,100 +344,2190 @@ class SlotLevel:
         :rtype: int
         :returns: A counting number of True value in the slot.
         """
-        return len(list(filter(lambda x: x is True, self.slot)))
+        return self._count
 
     @property
     def value(self) -> int:
         """Return a sum of weighted value from a True value in any slot
         position.
 
-        :rtype: int
-        :returns: A sum of weighted value from a True value in any slot
-            position.
+        :rtype: int
+        :returns: A sum of weighted value from a True value in any slot
+            position.
+        """
+        return self._value
+
+    def update(
+        self,
+        numbers: int | TupleInt | None = None,
+        strict: bool = True,
+    ) -> Self:
+        """Update boolean value in ``self.slot`` from False to True.
+
+        :param numbers: updated numbers of this SlotLevel object.
+        :type numbers: Union[int, TupleInt]
+        :param strict: a strict flag for raise error when pass out of
+            range numbers.
+        :type strict: bool(=True)
+
+        :raises FormatterValueError: if updated number does not exist in range.
+        :raises AttributeError: if this slot level object was frozen and the
+            updated number does not set in the slot.
+
+        :rtype: Self
+        :returns: Self that was updated level
+        """
+        bits, valid = _slot_mask(self.make_tuple(numbers or 0), self.level)
+        if not valid and strict:
+            raise FormatterValueError(
+                f"number for update the slot level object does not "
+                f"in range of 0 and {self.level}."
+            )
+        if new := bits & ~self.mask:
+            self.__check_frozen()
+            self.mask |= new
+            self._count += _popcount(new)
+            while new:
+                self._value += (low := new & -new).bit_length()
+                new ^= low
+            self._hash = None
+        return self
+
+    def checker(
+        self,
+        numbers: int | TupleInt,
+    ) -> bool:
+        """Return True if boolean value in ``self.slot`` is all True.
+
+        :param numbers: An index number values that want to check in slot.
+        :type numbers: Union[int, TupleInt]
+
+        :rtype: bool
+        :returns: A True if all values in ``self.slot`` that match with
+            index numbers are True.
+        """
+        bits, valid = _slot_mask(self.make_tuple(numbers), self.level)
+        return valid and (self.mask & bits) == bits
+
+    @staticmethod
+    def make_tuple(value: int | TupleInt) -> TupleInt:
+        """Return tuple of integer value that was created from input value
+        parameter if it is not tuple.
+
+        :param value: a tuple of integers or any integer
+        :type value: Union[int, TupleInt]
+
+        :rtype: TupleInt
+        :returns: A tuple of integer value that was created from input.
+        """
+        return (value,) if isinstance(value, int) else tuple(value)
+
+
+class SlotView(list[bool]):
+    """Slot View object that is a list of boolean of the slot bitmask of a
+    slot level object. Setting an item of this list will write through to the
+    slot bitmask, but the other mutating methods will raise an error because
+    the slot can not change its size.
+
+    :param owner: A slot level object of this view.
+    :type owner: SlotLevel
+    """
+
+    __slots__ = ("owner",)
+
+    def __init__(self, owner: SlotLevel) -> None:
+        super().__init__(bool(owner.mask >> i & 1) for i in range(owner.level))
+        self.owner: SlotLevel = owner
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        values: list[bool] = list(self)
+        values[index] = value
+        self.owner.slot = values
+        super().__setitem__(slice(None), self.owner.slot)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Reduce this view to a plain list of boolean that does not keep the
+        slot level object for pickling and copying.
+        """
+        return list, (list(self),)
+
+    def __unsupported(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise FormatterValueError(
+            "slot of the slot level object does not support any change "
+            "except setting an item."
+        )
+
+    __delitem__ = __iadd__ = __imul__ = __unsupported
+    append = extend = insert = pop = remove = clear = __unsupported
+    sort = reverse = __unsupported
+
+
+def _popcount(value: int) -> int:
+    """Return a number of one bits of a positive integer value."""
+    return bin(value).count("1")
+
+
+@lru_cache(maxsize=1024)
+def _slot_mask(numbers: TupleInt, level: int) -> tuple[int, bool]:
+    """Return a bitmask of slot numbers, and a flag that all numbers are in
+    the range of level. The zero number does not set any bit.
+
+    :param numbers: An index number values of slot.
+    :type numbers: TupleInt
+    :param level: A number of level of slot.
+    :type level: int
+
+    :rtype: tuple[int, bool]
+    """
+    bits: int = 0
+    valid: bool = True
+    for num in numbers:
+        if num == 0:
+            continue
+        elif 0 < num <= level:
+            bits |= 1 << (num - 1)
+            continue
+        valid = False
+    return bits, valid
+
+
+class PackedField:
+    """Packed Field descriptor that keep a numeric attribute of formatter
+    object as a bit field of the packed integer slot, ``_packed``, of an
+    instance instead of its own string slot. All packed fields of formatter
+    class share one integer object, and the getter produces the zero-padded
+    string value on demand, so it returns the same value type like the string
+    attribute. The zero bits of field mean that this attribute does not set.
+
+    :param bits: A number of bits of this field. It will be unbounded if it
+        set to None, so it must be the last packed field of formatter class.
+    :type bits: int | None(=None)
+    :param width: A width of the zero-padded string value.
+    :type width: int(=0)
+    :param choices: A tuple of string values that this field keeps only its
+        index instead of a number.
+    :type choices: tuple[str, ...] | None(=None)
+
+    Attributes:
+        * name: str
+            A name of attribute of formatter class.
+        * shift: int
+            A number of bits of all packed fields that was defined before
+            this field.
+        * mask: int
+            A bitmask of this field after shift the packed integer, it will
+            be -1 if this field is unbounded.
+        * table: tuple[str | None, ...] | None
+            A lookup table of the string values of a narrow field that share
+            the same string objects between all instances.
+    """
+
+    __slots__ = (
+        "name",
+        "shift",
+        "bits",
+        "mask",
+        "table",
+        "width",
+        "choices",
+    )
+
+    def __init__(
+        self,
+        bits: int | None = None,
+        *,
+        width: int = 0,
+        choices: tuple[str, ...] | None = None,
+    ) -> None:
+        self.name: str = ""
+        self.shift: int = 0
+        self.bits: int | None = bits
+        self.mask: int = -1 if bits is None else (1 << bits) - 1
+        self.width: int = width
+        self.choices: tuple[str, ...] | None = choices
+        self.table: tuple[str | None, ...] | None = None
+        if choices is not None:
+            self.table = (None, *choices)
+        elif bits is not None and bits <= 8:
+            self.table = (
+                None,
+                *(str(i).zfill(width) for i in range(self.mask)),
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}({self.name}, shift={self.shift}, "
+            f"bits={self.bits})>"
+        )
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if (shift := getattr(owner, "_packed_bits", 0)) is None:
+            raise TypeError(
+                f"The packed field, {name!r}, can not define after the "
+                f"unbounded packed field of {owner.__name__!r}."
+            )
+        self.name = name
+        self.shift = shift
+        owner._packed_bits = (  # type: ignore[attr-defined]
+            None if self.bits is None else shift + self.bits
+        )
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        num: int = ((instance._packed or 0) >> self.shift) & self.mask
+        if self.table is not None:
+            return self.table[num]
+        return str(num - 1).zfill(self.width) if num else None
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        num: int
+        if value is None or value == "":
+            num = 0
+        elif self.choices is not None:
+            if value not in self.choices:
+                raise FormatterValueError(
+                    f"The {self.name} field does not support for value, "
+                    f"{value!r}."
+                )
+            num = self.choices.index(value) + 1
+        else:
+            try:
+                num = int(value) + 1
+            except ValueError as err:
+                raise FormatterValueError(
+                    f"The {self.name} field does not support for value, "
+                    f"{value!r}."
+                ) from err
+            if num <= 0 or (num & self.mask) != num:
+                raise FormatterValueError(
+                    f"The {self.name} field does not support for value, "
+                    f"{value!r}, it is out of range."
+                )
+        object.__setattr__(
+            instance,
+            "_packed",
+            ((instance._packed or 0) & ~(self.mask << self.shift))
+            | (num << self.shift),
+        )
+
+
+@dataclass(frozen=True)
+class PriorityData:
+    """Priority Data class.
+
+    .. dataclass attributes::
+
+        - value: PriorityCallable
+        - level: int | TupleInt | None
+    """
+
+    value: PriorityCallable = field(default=itself, repr=False)
+    level: int | TupleInt | None = field(default=(0,))
+
+
+@dataclass(frozen=True)
+class PriorityStep:
+    """Priority Step data class that was compiled from an item of the
+    priorities value of formatter class. The ordered tuple of this step will
+    keep on the formatter class for setting up attributes in initialize layer.
+
+    .. dataclass attributes::
+
+        - name: str
+            A name of priority that be the key of parsing formats.
+        - attr: str
+            An attribute name that was split from the prefix of the name.
+        - value: PriorityCallable
+            A converter function or value of this priority.
+        - level: int | TupleInt | None
+            A level that will update to the slot level of instance.
+        - default: bool
+            A flag of default priority that ends with ``_default`` or ``_fix``.
+        - bound: bool
+            A flag of converter that receive an instance as the first argument.
+    """
+
+    name: str
+    attr: str
+    value: PriorityCallable = field(repr=False)
+    level: int | TupleInt | None
+    default: bool
+    bound: bool = field(default=False)
+
+    @classmethod
+    def from_priority(
+        cls,
+        name: str,
+        values: PriorityValue,
+        instance: Any,
+    ) -> PriorityStep:
+        """Return a priority step from an item of the priorities value that
+        was generated from an instance. A method that was bound to this
+        instance, or a partial object of this method, will resolve to its
+        unbound function that receives the instance explicitly when it
+        converts. Any other converter keeps as it is, so it should not
+        reference the instance.
+
+        :param name: A name of priority.
+        :type name: str
+        :param values: A priority value that have ``value`` and ``level`` keys.
+        :type values: PriorityValue
+        :param instance: An instance that generates the priorities value.
+        :type instance: Any
+
+        :rtype: PriorityStep
+        """
+        props = PriorityData(**values)
+        value: PriorityCallable = props.value
+        bound: bool = False
+        if inspect.ismethod(value) and value.__self__ is instance:
+            value, bound = value.__func__, True
+        elif (
+            isinstance(value, partial)
+            and inspect.ismethod(value.func)
+            and value.func.__self__ is instance
+        ):
+            func, args, keywords = value.func, value.args, value.keywords
+            value = partial(_call_unbound, func.__func__, args, keywords)
+            bound = True
+        return cls(
+            name=name,
+            # From: <prefix>_<body> -> TO: [<prefix>, <body>]
+            attr=name.split("_", maxsplit=1)[0],
+            value=value,
+            level=props.level,
+            default=name.endswith(("_default", "_fix")),
+            bound=bound,
+        )
+
+    def convert(self, instance: Any, *args: Any) -> Any:
+        """Return a value that was converted by the converter of this step
+        with an instance and arguments.
+
+        :param instance: An instance that set up attributes.
+        :type instance: Any
+        """
+        func: Callable[..., Any] = self.value
+        if self.bound:
+            return func(instance, *args)
+        return func(*args) if args else caller(func)
+
+
+def _plan_levels(plan: tuple[PriorityStep, ...]) -> dict[str, TupleInt]:
+    """Return a mapping of attribute and its levels from a priority plan. The
+    levels of attribute are the levels of the step that has the same name, or
+    all levels of the steps that do not default if it does not exist.
+
+    :param plan: An ordered tuple of priority steps.
+    :type plan: tuple[PriorityStep, ...]
+
+    :rtype: dict[str, TupleInt]
+    """
+    rs: dict[str, TupleInt] = {}
+    for step in plan:
+        if step.default:
+            rs.setdefault(step.attr, ())
+            continue
+        levels: TupleInt = SlotLevel.make_tuple(step.level or 0)
+        if step.name == step.attr:
+            rs[step.attr] = levels
+        elif not any(s.name == step.attr for s in plan):
+            rs[step.attr] = tuple(
+                dict.fromkeys((*rs.get(step.attr, ()), *levels))
+            )
+    return rs
+
+
+def _call_unbound(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    keywords: dict[str, Any],
+    other: Any,
+    *extras: Any,
+) -> Any:
+    """Call an unbound function of the partial object with other instance."""
+    return func(other, *args, *extras, **keywords)
+
+
+@dataclass(frozen=True)
+class FormatToken:
+    """Format Token data class that was tokenized from a format string value.
+
+    .. dataclass attributes::
+
+        - kind: str
+            A kind of this token that be ``literal``, ``code``, or ``escape``.
+        - value: str
+            A string value of this token.
+    """
+
+    kind: str
+    value: str
+
+
+@lru_cache(maxsize=1024)
+def tokenize_fmt(fmt: str) -> tuple[FormatToken, ...]:
+    """Return a tuple of format tokens that was tokenized from a format string
+    value with a single pass. The escaped format, ``%%``, will be the
+    ``escape`` token.
+
+    Examples:
+        >>> [t.kind for t in tokenize_fmt("%Y-%m %%d")]
+        ['code', 'literal', 'code', 'literal', 'escape', 'literal']
+
+    :param fmt: A format string value.
+    :type fmt: str
+
+    :rtype: tuple[FormatToken, ...]
+    """
+    tokens: list[FormatToken] = []
+    pos: int = 0
+    for match in re.finditer(r"%%|%[-+!*]?[A-Za-z]", fmt):
+        if (start := match.start()) > pos:
+            tokens.append(FormatToken("literal", fmt[pos:start]))
+        value: str = match.group()
+        tokens.append(
+            FormatToken("escape" if value == "%%" else "code", value)
+        )
+        pos = match.end()
+    if pos < len(fmt):
+        tokens.append(FormatToken("literal", fmt[pos:]))
+    return tuple(tokens)
+
+
+@dataclass(frozen=True)
+class RegexTemplate:
+    """Regex Template data class that was pre-split from a regular expression
+    string value of a format code at the named group slots. It uses for
+    renaming the named groups with the prefix, suffix, and index counter by
+    plain string joining.
+
+    .. dataclass attributes::
+
+        - parts: tuple[str, ...]
+            A tuple of regular expression string parts that was split by the
+            named groups. It has length more than the names one item.
+        - names: tuple[str, ...]
+            A tuple of named group of the regular expression.
+    """
+
+    parts: tuple[str, ...]
+    names: tuple[str, ...]
+
+    @classmethod
+    def from_regex(cls, regex: str) -> Self:
+        """Return a regex template that was split from a regular expression
+        string value.
+
+        Examples:
+            >>> RegexTemplate.from_regex("(?P<year>[0-9]{4})").names
+            ('year',)
+
+        :param regex: A regular expression string value.
+        :type regex: str
+
+        :rtype: Self
+        """
+        split: list[str] = re.split(r"\(\?P<(\w+)>", regex)
+        return cls(parts=tuple(split[::2]), names=tuple(split[1::2]))
+
+    def render(
+        self,
+        counter: dict[str, int],
+        *,
+        prefix: str = "",
+        suffix: str = "",
+        alias: bool = True,
+    ) -> str:
+        """Return a regular expression string value that was renamed the named
+        groups with prefix, suffix, and the index of its name from counter.
+
+        :param counter: A mapping of named group and its running index that
+            will increase after rendering.
+        :type counter: dict[str, int]
+        :param prefix: a prefix string value that will add to alias name.
+        :type prefix: str(='')
+        :param suffix: a suffix string value that will add to alias name.
+        :type suffix: str(='')
+        :param alias: an alias boolean flag that will pass alias name if it
+            true to the format string value.
+        :type alias: bool(=True)
+
+        :raises FormatterValueError: If the regular expression does not set
+            any named group.
+
+        :rtype: str
+        """
+        if not self.names:
+            raise FormatterValueError(
+                "Regex format string does not set group name for "
+                "parsing value to its class."
+            )
+        results: list[str] = [self.parts[0]]
+        for name, part in zip(self.names, self.parts[1:]):
+            if alias:
+                results.append(
+                    f"(?P<{prefix}{name}{scache(counter.get(name, 0))}{suffix}>"
+                )
+            else:
+                results.append("(")
+            counter[name] = counter.get(name, 0) + 1
+            results.append(part)
+        return "".join(results)
+
+
+def _strftime_unpad(fmt: str, dt: datetime) -> str:
+    """Return a string value that was formatted with a ``strftime`` directive
+    and removed its zero padding.
+    """
+    return str(remove_pad(dt.strftime(fmt)))
+
+
+# The separator of the ``strftime`` directives that split the fused result
+# back to the value of each format code, it does not exist in any result of
+# the ``strftime`` directives.
+STRFTIME_SEP: str = "\x1f"
+
+
+def _strftime_split(
+    fmt: str,
+    unpads: tuple[int, ...],
+    parts: tuple[str, ...],
+    dt: datetime,
+) -> str:
+    """Return a string value that was formatted with one ``strftime`` call of
+    the directives that join with ``STRFTIME_SEP``, and then removed the zero
+    padding of the values at the unpad indexes and joined with the literal
+    parts.
+    """
+    values: list[str] = dt.strftime(fmt).split(STRFTIME_SEP)
+    for i in unpads:
+        values[i] = str(remove_pad(values[i]))
+    results: list[str] = [parts[0]]
+    for value, part in zip(values, parts[1:]):
+        results.append(value)
+        results.append(part)
+    return "".join(results)
+
+
+def _write_strings(
+    strings: Iterable[str],
+    sink: Any,
+    sep: str = "\n",
+    chunksize: int = 1024,
+) -> int:
+    """Write any string values that end with a separator to a text or binary
+    sink by chunks, so it calls the ``write`` method of a sink once per chunk
+    instead of once per value. The strings will encode with ``utf-8`` if a
+    sink is a binary stream.
+
+    :param strings: An iterable of string values.
+    :type strings: Iterable[str]
+    :param sink: A text or binary sink object that has the ``write`` method.
+    :type sink: Any
+    :param sep: A separator string that write after each string value.
+    :type sep: str(='\\n')
+    :param chunksize: A number of string values of each writing.
+    :type chunksize: int(=1024)
+
+    :rtype: int
+    :returns: A number of string values that was written to a sink.
+    """
+    mode: Any = getattr(sink, "mode", None)
+    binary: bool = not isinstance(sink, TextIOBase) and (
+        isinstance(sink, (RawIOBase, BufferedIOBase))
+        or (isinstance(mode, str) and "b" in mode)
+    )
+    write: Callable[[Any], Any] = sink.write
+    count: int = 0
+    chunk: list[str] = []
+    for string in strings:
+        chunk.append(string)
+        if len(chunk) == chunksize:
+            data: str = sep.join(chunk) + sep
+            write(data.encode("utf-8") if binary else data)
+            count += chunksize
+            chunk.clear()
+    if chunk:
+        data = sep.join(chunk) + sep
+        write(data.encode("utf-8") if binary else data)
+        count += len(chunk)
+    return count
+
+
+@dataclass(frozen=True)
+class FormatTemplate:
+    """Format Template data class that was compiled from a format string value
+    of a formatter class. It keeps the literal parts between the format codes
+    and the renderer of each code, so the formatting calls the renderers of
+    the codes that exist in the format string only and joins them once.
+
+    .. dataclass attributes::
+
+        - parts: tuple[str, ...]
+            A tuple of literal string parts that was split by the format
+            codes. It has length more than the codes one item.
+        - codes: tuple[str, ...]
+            A tuple of format codes of the format string value.
+        - renderers: tuple[Callable[[Any], Any] | None, ...]
+            A tuple of renderer of each format code. It will be None if the
+            value of this code gets from the formatter value of an instance.
+        - fused: Callable[[Any], str] | None
+            A renderer that receives a prepared value and returns the whole
+            formatted string at once, like a single ``strftime`` call for
+            Datetime. It will be None if the formatter class can not fuse
+            all format codes of this template.
+    """
+
+    parts: tuple[str, ...]
+    codes: tuple[str, ...]
+    renderers: tuple[Callable[[Any], Any] | None, ...] = field(repr=False)
+    fused: Callable[[Any], str] | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_fmt(cls, formatter: FormatterType, fmt: str) -> Self:
+        """Return a format template of a format string value that was checked
+        its format codes with the ``code_renderers`` table of a formatter
+        class.
+
+        :param formatter: A formatter class.
+        :type formatter: FormatterType
+        :param fmt: A format string value.
+        :type fmt: str
+
+        :raises FormatterKeyError: If any format code does not support for
+            this formatter class.
+
+        :rtype: Self
+        """
+        renderers = formatter.code_renderers
+        parts: list[str] = [""]
+        codes: list[str] = []
+        for token in tokenize_fmt(fmt):
+            if token.kind != "code":
+                parts[-1] += "%" if token.kind == "escape" else token.value
+                continue
+            elif renderers is not None and token.value not in renderers:
+                raise FormatterKeyError(
+                    f"the format: {token.value!r} does not support for "
+                    f"{formatter.__name__!r}"
+                )
+            codes.append(token.value)
+            parts.append("")
+        return cls(
+            parts=tuple(parts),
+            codes=tuple(codes),
+            renderers=tuple(
+                None if renderers is None else renderers[code]
+                for code in codes
+            ),
+            fused=(
+                formatter._fused_renderer(tuple(parts), tuple(codes))
+                if codes
+                else None
+            ),
+        )
+
+    def render(self, instance: Formatter) -> str:
+        """Return a string value that was formatted from a formatter instance
+        with this format template.
+
+        :param instance: A formatter instance.
+        :type instance: Formatter
+
+        :raises FormatterKeyError: If any format code does not exist in the
+            formatter value of an instance.
+
+        :rtype: str
+        """
+        return self.render_value(instance, instance.value)
+
+    def render_value(
+        self,
+        formatter: Union[Formatter, FormatterType],
+        value: Any,
+    ) -> str:
+        """Return a string value that was formatted from a value with the
+        ``prepare_value`` and ``formatter`` methods of a formatter class or
+        instance, so a native value can format without creating an instance.
+
+        :param formatter: A formatter class or instance.
+        :type formatter: Formatter | FormatterType
+        :param value: A value that able to pass to the ``formatter`` method.
+        :type value: Any
+
+        :raises FormatterKeyError: If any format code does not exist in the
+            formatter value of this value.
+
+        :rtype: str
+        """
+        if not self.codes:
+            return self.parts[0]
+        elif self.fused is not None:
+            return self.fused(formatter.prepare_value(value))
+        prepared: Any = None
+        formatters: ReturnFormattersType | None = None
+        results: list[str] = [self.parts[0]]
+        for code, renderer, part in zip(
+            self.codes, self.renderers, self.parts[1:]
+        ):
+            if renderer is not None:
+                if prepared is None:
+                    prepared = formatter.prepare_value(value)
+                results.append(renderer(prepared))
+            else:
+                if formatters is None:
+                    formatters = formatter.formatter(value)
+                try:
+                    results.append(caller(formatters[code]["value"]))
+                except KeyError as err:
+                    name: str = (
+                        formatter
+                        if isinstance(formatter, type)
+                        else formatter.__class__
+                    ).__name__
+                    raise FormatterKeyError(
+                        f"the format: {code!r} does not support for {name!r}"
+                    ) from err
+            results.append(part)
+        return "".join(results)
+
+    def render_many(
+        self,
+        formatter: FormatterType,
+        values: Iterable[Any],
+    ) -> Iterator[str]:
+        """Format any formatter instances or native values with this format
+        template lazily. An instance of a formatter class formats from its
+        value, and other values pass to the formatter methods directly like
+        ``formatter.formatter(value)`` without creating an instance.
+
+        :param formatter: A formatter class of this format template.
+        :type formatter: FormatterType
+        :param values: An iterable of formatter instances or native values.
+        :type values: Iterable[Any]
+
+        :rtype: Iterator[str]
+        """
+        render_value = self.render_value
+        for value in values:
+            if isinstance(value, formatter):
+                yield render_value(value, value.value)
+            else:
+                yield render_value(formatter, value)
+
+
+class FormatterValues(Mapping[str, str]):
+    """Lazy mapping view of format string, and it's string value of a value
+    of formatter class. It computes the string value of a format code on the
+    first access only, and keeps it for the next access, so reading a few
+    format codes does not call all the formatter values of this class.
+
+    :param formatter: A formatter class or instance.
+    :type formatter: Formatter | FormatterType
+    :param value: A value that able to pass to the ``formatter`` method.
+    :type value: Any
+
+    Methods:
+        * to_dict: [] -> DictStr
+            A materialized dict of all format codes and its string value.
+    """
+
+    __slots__ = (
+        "formatter",
+        "value",
+        "renderers",
+        "prepared",
+        "formatters",
+        "data",
+    )
+
+    def __init__(
+        self,
+        formatter: Union[Formatter, FormatterType],
+        value: Any,
+    ) -> None:
+        self.formatter: Union[Formatter, FormatterType] = formatter
+        self.value: Any = value
+        self.renderers: dict[str, Callable[[Any], str]] | None = (
+            formatter.code_renderers
+        )
+        self.prepared: Any = None
+        self.formatters: ReturnFormattersType | None = (
+            formatter.formatter(value) if self.renderers is None else None
+        )
+        self.data: DictStr = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({self.to_dict()!r})>"
+
+    def __len__(self) -> int:
+        return len(self.renderers or self.formatters)  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.renderers or self.formatters)  # type: ignore[arg-type]
+
+    def __contains__(self, code: object) -> bool:
+        return code in (self.renderers or self.formatters)  # type: ignore
+
+    def __getitem__(self, code: str) -> str:
+        if (cached := self.data.get(code)) is not None:
+            return cached
+        rs: str
+        if (renderer := (self.renderers or {}).get(code)) is not None:
+            if self.prepared is None:
+                self.prepared = self.formatter.prepare_value(self.value)
+            rs = renderer(self.prepared)
+        else:
+            if self.formatters is None:
+                self.formatters = self.formatter.formatter(self.value)
+            rs = caller(self.formatters[code]["value"])
+        self.data[code] = rs
+        return rs
+
+    def to_dict(self) -> DictStr:
+        """Return a materialized dict of all format codes, and it's string
+        value of this view.
+
+        :rtype: DictStr
+        """
+        return {code: self[code] for code in self}
+
+
+DIGITS: frozenset[str] = frozenset("0123456789")
+SLICE_META: frozenset[str] = frozenset("\\^$*+?{}[]|()")
+SLICE_ATOM: re.Pattern[str] = re.compile(
+    r"(?:\\d|\[([0-9])-([0-9])\])(?:\{([0-9]+)(?:,([0-9]+))?\}|([*+]))?"
+)
+
+
+@dataclass(frozen=True)
+class SliceStep:
+    """Slice Step data class that keep a step of the slicing parser. A step
+    can be a literal string or a named group of digit characters.
+
+    .. dataclass attributes::
+
+        - name: str | None
+            A named group of this step, it will be None if it is a literal.
+        - value: str
+            A literal string value, the wildcard ``.`` will match any
+            character except new line.
+        - min_len: int
+            A minimum width of digit characters.
+        - max_len: int | None
+            A maximum width of digit characters, None if it does not bound.
+        - positions: tuple[frozenset[str], ...]
+            A tuple of allowed characters for each position of fixed width
+            group, or a tuple of one item for variable width group.
+        - choices: frozenset[str] | None
+            A set of allowed values if the group is an alternation.
+    """
+
+    name: str | None
+    value: str = ""
+    min_len: int = 0
+    max_len: int | None = 0
+    positions: tuple[frozenset[str], ...] = ()
+    choices: frozenset[str] | None = None
+
+    @property
+    def fixed(self) -> bool:
+        return self.min_len == self.max_len
+
+    def check(self, chunk: str) -> bool:
+        """Return True if a chunk of digit characters is allowed by this
+        named group step.
+
+        :param chunk: A chunk of string value that was sliced.
+        :type chunk: str
+
+        :rtype: bool
+        """
+        if self.choices is not None:
+            return chunk in self.choices
+        if len(self.positions) == 1:
+            allowed: frozenset[str] = self.positions[0]
+            return all(c in allowed for c in chunk)
+        return all(c in a for c, a in zip(chunk, self.positions))
+
+
+def _slice_group(name: str, regex: str) -> SliceStep | None:
+    """Return a slice step of named group from a regular expression string
+    value of this group, or None if this group can not parse by slicing.
+    """
+    if regex and all(
+        (alt.isascii() and alt.isdigit()) for alt in regex.split("|")
+    ):
+        choices: frozenset[str] = frozenset(regex.split("|"))
+        lengths: set[int] = {len(c) for c in choices}
+        return SliceStep(
+            name=name,
+            min_len=min(lengths),
+            max_len=max(lengths),
+            choices=choices,
+        )
+    pos: int = 0
+    atoms: list[tuple[frozenset[str], int, int | None]] = []
+    while pos < len(regex):
+        if not (match := SLICE_ATOM.match(regex, pos)):
+            return None
+        start, end, fixed, upper, repeat = match.groups()
+        allowed: frozenset[str] = (
+            frozenset(str(i) for i in range(int(start), int(end) + 1))
+            if start is not None
+            else DIGITS
+        )
+        if repeat:
+            atoms.append((allowed, int(repeat == "+"), None))
+        elif fixed is not None:
+            atoms.append(
+                (allowed, int(fixed), int(upper if upper else fixed))
+            )
+        else:
+            atoms.append((allowed, 1, 1))
+        pos = match.end()
+    if len(atoms) == 1:
+        allowed, min_len, max_len = atoms[0]
+        return SliceStep(
+            name=name, min_len=min_len, max_len=max_len, positions=(allowed,)
+        )
+    if not atoms or any(a[1] != a[2] for a in atoms):
+        return None
+    positions: tuple[frozenset[str], ...] = tuple(
+        allowed for allowed, width, _ in atoms for _ in range(width)
+    )
+    return SliceStep(
+        name=name,
+        min_len=len(positions),
+        max_len=len(positions),
+        positions=positions,
+    )
+
+
+@dataclass(frozen=True)
+class SliceParser:
+    """Slice Parser data class that parse a string value by the precomputed
+    table of literals and digit groups with string slicing instead of the
+    regular expression engine. It supports only the regular expression that
+    all named groups are digit characters and any group with variable width
+    must follow by a non-digit literal or the end of value, so the matching
+    result will equal to the regular expression one.
+
+    .. dataclass attributes::
+
+        - steps: tuple[SliceStep, ...]
+            A tuple of slice steps.
+        - width: int | None
+            A total width of value if all steps have fixed width.
+    """
+
+    steps: tuple[SliceStep, ...]
+    width: int | None
+
+    @classmethod
+    def from_regex(cls, regex: str) -> Self | None:
+        """Return a slice parser from a regular expression string value that
+        was generated from the format string, or None if this regular
+        expression can not parse by slicing.
+
+        Examples:
+            >>> SliceParser.from_regex("(?P<n>[0-9]{2})_(?P<m>[0-9]*)").parse(
+            ...     "01_2"
+            ... )
+            {'n': '01', 'm': '2'}
+
+        :param regex: A regular expression string value.
+        :type regex: str
+
+        :rtype: Self | None
+        """
+        steps: list[SliceStep] = []
+        pos: int = 0
+        while pos < len(regex):
+            if not regex.startswith("(?P<", pos):
+                end: int = regex.find("(?P<", pos)
+                literal: str = regex[pos:] if end == -1 else regex[pos:end]
+                if any(c in SLICE_META for c in literal):
+                    return None
+                steps.append(SliceStep(name=None, value=literal))
+                pos += len(literal)
+                continue
+            name_end: int = regex.index(">", pos)
+            close: int = regex.find(")", name_end)
+            if close == -1 or any(
+                c in "()" for c in regex[name_end + 1 : close]
+            ):
+                return None
+            step: SliceStep | None = _slice_group(
+                regex[pos + 4 : name_end], regex[name_end + 1 : close]
+            )
+            if step is None:
+                return None
+            steps.append(step)
+            pos = close + 1
+
+        for step, follow in zip_longest(steps, steps[1:]):
+            if step.name is None or step.fixed:
+                continue
+            if follow is None:
+                continue
+            if follow.name is not None or follow.value[0] in DIGITS | {"."}:
+                return None
+        if not any(step.name for step in steps):
+            return None
+        width: int | None = (
+            sum(
+                (step.min_len if step.name else len(step.value))
+                for step in steps
+            )
+            if all(step.name is None or step.fixed for step in steps)
+            else None
+        )
+        return cls(steps=tuple(steps), width=width)
+
+    def parse(self, value: str) -> dict[str, str] | None:
+        """Return a mapping of named group and its sliced value, or None if
+        a value does not match with this slice parser.
+
+        :param value: A string value that want to parse.
+        :type value: str
+
+        :rtype: dict[str, str] | None
+        """
+        size: int = len(value)
+        if self.width is not None and size != self.width:
+            return None
+        rs: dict[str, str] = {}
+        pos: int = 0
+        for step in self.steps:
+            if step.name is None:
+                literal: str = step.value
+                end: int = pos + len(literal)
+                if "." not in literal:
+                    if not value.startswith(literal, pos):
+                        return None
+                elif end > size or any(
+                    (c != v if c != "." else v == "\n")
+                    for c, v in zip(literal, value[pos:end])
+                ):
+                    return None
+                pos = end
+                continue
+            if step.fixed:
+                end = pos + step.min_len
+                if end > size:
+                    return None
+            else:
+                end = pos
+                while end < size and value[end] in DIGITS:
+                    end += 1
+                if end - pos < step.min_len or (
+                    step.max_len is not None and end - pos > step.max_len
+                ):
+                    return None
+            chunk: str = value[pos:end]
+            if not step.check(chunk):
+                return None
+            rs[step.name] = chunk
+            pos = end
+        return rs if pos == size else None
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Cache Information data class that keep the statistic values of the
+    ``FormatCache`` object.
+
+    .. dataclass attributes::
+
+        - hits: int
+        - misses: int
+        - evictions: int
+        - maxsize: int | None
+        - currsize: int
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+    @property
+    def ratio(self) -> float:
+        """Return a hit ratio of this cache information that return 0.0 if
+        this cache does not get any calling.
+
+        :rtype: float
+        """
+        return self.hits / total if (total := self.hits + self.misses) else 0.0
+
+
+class FormatCache:
+    """Bounded cache object with the least-recently-used (LRU) eviction
+    policy that use for keep any derived value of the format string such as
+    the compiled regular expression pattern.
+
+    :param maxsize: A maximum size of this cache. It will be unbounded if it
+        set to None, and it will disable caching if it set to 0.
+    :type maxsize: int | None(=128)
+
+    Methods:
+        * get: [Hashable, Any] -> Any
+            A cached value of an input key or default value if it does not
+            exist in this cache.
+        * put: [Hashable, Any] -> Any
+            An input value that was stored in this cache.
+        * clear: [] -> None
+            Clear all cached values and statistic counters.
+        * info: [] -> CacheInfo
+            A statistic information of this cache.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "hits",
+        "misses",
+        "evictions",
+        "data",
+    )
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        self.maxsize: int | None = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(maxsize={self.maxsize})>"
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value of an input key and mark this key to the most
+        recently used, or return a default value if it does not exist.
+
+        :param key: A key of cached value.
+        :type key: Hashable
+        :param default: A default value that return if a key does not exist.
+        :type default: Any(=None)
+
+        :rtype: Any
+        """
+        try:
+            value: Any = self.data[key]
+            self.data.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store an input value with its key to this cache and evict the least
+        recently used values if the size of this cache more than the maximum
+        size.
+
+        :param key: A key of cached value.
+        :type key: Hashable
+        :param value: A value that want to cache.
+        :type value: Any
+
+        :rtype: Any
+        :returns: An input value.
+        """
+        if self.maxsize == 0:
+            return value
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Clear all cached values and statistic counters of this cache."""
+        self.data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return a statistic information of this cache.
+
+        :rtype: CacheInfo
+        """
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxsize=self.maxsize,
+            currsize=len(self.data),
+        )
+
+
+OnErrorType: TypeAlias = Literal["raise", "skip", "collect"]
+ValidationType: TypeAlias = Literal["eager", "lazy", "off"]
+
+
+@dataclass(frozen=True)
+class ParseFailure:
+    """Parse Failure data class that was yielded from the bulk parsing method
+    with the ``collect`` error policy instead of raising an error.
+
+    .. dataclass attributes::
+
+        - value: str
+        - reason: str
+    """
+
+    value: str
+    reason: str
+
+
+# The bounds of the format inference work that do not depend on the number of
+# sample values. The inference searches the most common shapes, or separator
+# layouts for the formatter group, only with the spread representative values
+# of each of them.
+INFER_SHAPES: int = 8
+INFER_SAMPLES: int = 16
+
+
+@dataclass(frozen=True)
+class FormatCandidate:
+    """Format Candidate data class that keep a format string value that was
+    inferred from any sample values and its coverage.
+
+    .. dataclass attributes::
+
+        - fmt: str
+            A format string value that was inferred.
+        - coverage: float
+            A ratio of sample values that can parse with this format.
+    """
+
+    fmt: str
+    coverage: float
+
+
+@dataclass(frozen=True)
+class InferSpec:
+    """Infer Specification data class that keep the necessary values of a
+    format string for inferring the format string from sample values.
+
+    .. dataclass attributes::
+
+        - pattern: re.Pattern[str]
+            A compiled regular expression pattern of this format string.
+        - names: frozenset[str]
+            A set of base named group that this format string sets.
+        - rank: int
+            A position of the last format string in the base format string
+            that sets any of the named groups, or the number of format
+            strings in there if any named group does not set by them.
+    """
+
+    pattern: re.Pattern[str]
+    names: frozenset[str]
+    rank: int
+
+
+def _sample_shape(value: str) -> str:
+    """Return a shape of a sample value that change any digit to ``9`` and any
+    ascii letter to ``a`` for grouping the sample values before inference.
+    """
+    return "".join(
+        (
+            "9"
+            if c.isdigit()
+            else "a" if (c.isascii() and c.isalpha()) else c
+        )
+        for c in value
+    )
+
+
+def _sample_spread(values: list[str], size: int) -> list[str]:
+    """Return the spread sample values with a size from the sorted values for
+    keeping the variety of the representative values.
+    """
+    _values: list[str] = sorted(values)
+    return _values[:: max(1, len(_values) // size)][:size]
+
+
+def _count_samples(samples: Iterable[String]) -> dict[str, int]:
+    """Return a mapping of the distinct string values of sample values and
+    its number of occurrences.
+    """
+    counter: dict[str, int] = defaultdict(int)
+    for sample in samples:
+        counter[bytes2str(sample)] += 1
+    return counter
+
+
+def _rank_candidates(
+    candidates: dict[str, tuple[int, ...]],
+    counter: dict[str, int],
+    limit: int,
+    count: Callable[[str, dict[str, int]], int],
+) -> list[FormatCandidate]:
+    """Return the limit number of format candidates that rank by coverage of
+    all sample values, and then by its ranking tuple.
+
+    :param candidates: A mapping of candidate format string values and its
+        ranking tuple.
+    :type candidates: dict[str, tuple[int, ...]]
+    :param counter: A mapping of sample values and its number of occurrences.
+    :type counter: dict[str, int]
+    :param limit: A limit number of return candidates.
+    :type limit: int
+    :param count: A function that return the number of sample values that can
+        parse with a candidate format string value.
+    :type count: Callable[[str, dict[str, int]], int]
+
+    :rtype: list[FormatCandidate]
+    """
+    total: int = sum(counter.values())
+    rs: list[tuple[tuple[int, ...], FormatCandidate]] = []
+    for fmt, rank in candidates.items():
+        if matched := count(fmt, counter):
+            rs.append(
+                (
+                    (-matched, *rank),
+                    FormatCandidate(fmt, coverage=matched / total),
+                )
+            )
+    rs.sort(key=lambda x: x[0])
+    return [candidate for _, candidate in rs[:limit]]
+
+
+def _match_whole(pattern: re.Pattern[str], value: str) -> re.Match[str] | None:
+    """Return a matching of the whole of a value with a compiled pattern like
+    the ``^...$`` pattern with ``re.search``, so it allows one trailing
+    newline at the end of a value that does not include in the matching.
+
+    :param pattern: A compiled regular expression pattern.
+    :type pattern: re.Pattern[str]
+    :param value: A string value.
+    :type value: str
+
+    :rtype: re.Match[str] | None
+    """
+    if (rs := pattern.fullmatch(value)) is None and value.endswith("\n"):
+        return pattern.fullmatch(value, 0, len(value) - 1)
+    return rs
+
+
+def validate_on_error(on_error: str) -> None:
+    """Validate the error policy value of the bulk parsing method.
+
+    :param on_error: An error policy value.
+    :type on_error: str
+
+    :raises FormatterArgumentError: If an error policy value does not support.
+    """
+    if on_error not in ("raise", "skip", "collect"):
+        raise FormatterArgumentError(
+            "on_error",
+            (
+                f"The error policy, {on_error!r}, does not support, it should "
+                f"be one of 'raise', 'skip', or 'collect'."
+            ),
+        )
+
+
+def validate_property(
+    fget: Union[Callable[[Any], Any], property],
+) -> property:
+    """Return a property of formatter class that runs the pending validation
+    of an instance, that was parsed with the ``lazy`` validation policy,
+    before getting its value. It should decorate the value property of a
+    sub-formatter class, and it should be the outer decorator if this
+    property also decorates with ``memo_property``, so the failed validation
+    does not skip with the memo result.
+
+    :param fget: A getter function or a property that want to validate.
+    :type fget: Callable[[Any], Any] | property
+
+    :rtype: property
+    """
+    if isinstance(fget, property):
+        fget = fget.fget  # type: ignore[assignment]
+    func: Callable[[Any], Any] = fget  # type: ignore[assignment]
+
+    @wraps(func)
+    def wrapper(self: Any) -> Any:
+        if self._validate_pending:
+            # The flag clears before validating because the validate method
+            # can access this property, and it resets if validation fails.
+            object.__setattr__(self, "_validate_pending", False)
+            try:
+                if not self.validate():
+                    raise FormatterValueError(
+                        "Parsing value does not valid from validator"
+                    )
+            except BaseException:
+                object.__setattr__(self, "_validate_pending", True)
+                raise
+        return func(self)
+
+    return property(wrapper)
+
+
+def memo_property(fget: Union[Callable[[Any], Any], property]) -> property:
+    """Return a property of formatter class that keeps its result in the memo
+    mapping of an instance, ``self._memo``, with the name of its getter until
+    any attribute of this instance was changed. It should decorate only the
+    property that returns an immutable value and costs to compute.
+
+    :param fget: A getter function or a property that want to memoize.
+    :type fget: Callable[[Any], Any] | property
+
+    :rtype: property
+    """
+    if isinstance(fget, property):
+        fget = fget.fget  # type: ignore[assignment]
+    func: Callable[[Any], Any] = fget  # type: ignore[assignment]
+    name: str = func.__name__
+
+    @wraps(func)
+    def wrapper(self: Any) -> Any:
+        if (_memo := self._memo) is None:
+            object.__setattr__(self, "_memo", (_memo := {}))
+        elif name in _memo:
+            return _memo[name]
+        _memo[name] = rs = func(self)
+        return rs
+
+    return property(wrapper)
+
+
+def validate_validation(validation: str) -> None:
+    """Validate the validation policy value of the parsing method.
+
+    :param validation: A validation policy value.
+    :type validation: str
+
+    :raises FormatterArgumentError: If a validation policy value does not
+        support.
+    """
+    if validation not in ("eager", "lazy", "off"):
+        raise FormatterArgumentError(
+            "validation",
+            (
+                f"The validation policy, {validation!r}, does not support, it "
+                f"should be one of 'eager', 'lazy', or 'off'."
+            ),
+        )
+
+
+class CompiledFormat(Generic[FormatterT]):
+    """Compiled Format object that keep all derived values of a format string
+    for a formatter class, such as the compiled regular expression pattern,
+    the mapping of group name and its priority key, and the list of format
+    codes. This object will hoist these values out of the parsing loop the
+    same way as ``re.compile``. If all format codes of the format string are
+    digit characters, it will parse a value with the slice parser before
+    fallback to the regular expression engine.
+
+    :param formatter: A formatter class that want to compile a format.
+    :type formatter: FormatterType
+    :param fmt: A format string value.
+    :type fmt: str
+    :param regex: A regular expression string that was generated from fmt.
+    :type regex: str
+
+    Attributes:
+        * formatter: FormatterType
+            A formatter class of this compiled format.
+        * fmt: str
+            A format string value.
+        * pattern: re.Pattern[str]
+            A compiled regular expression pattern of the format string.
+        * groups: dict[str, str]
+            A mapping of group name of the pattern and its priority key.
+        * codes: tuple[str, ...]
+            A tuple of format codes that exist in the format string.
+        * slicer: SliceParser | None
+            A slice parser of the format string, it will be None if this
+            format string can not parse by slicing.
+        * intern_key: tuple[Any, ...] | None
+            A prefix key of the intern cache of the formatter class, it will
+            be None if ``Config.intern_maxsize`` of this class set to 0.
+
+    Methods:
+        * parse: [String] -> Formatter
+            An instance of formatter that parse from a value.
+        * match: [String] -> Formatter | None
+            An instance of formatter if the beginning of a value match with
+            the pattern.
+        * fullmatch: [String] -> Formatter | None
+            An instance of formatter if the whole of a value match with
+            the pattern.
+        * parse_many: [Iterable[String], ...] -> Iterator[Formatter]
+            A lazy iterator of formatter instances that parse from any values.
+        * finditer: [String] -> Iterator[tuple[tuple[int, int], Formatter]]
+            A lazy iterator of span and formatter instance of any matching
+            in a text.
+        * search: [String] -> tuple[tuple[int, int], Formatter] | None
+            A span and formatter instance of the first matching in a text.
+        * format: [Formatter] -> str
+            A string value that was formatted from a formatter instance.
+    """
+
+    __slots__ = (
+        "formatter",
+        "fmt",
+        "pattern",
+        "groups",
+        "codes",
+        "slicer",
+        "intern_key",
+    )
+
+    def __init__(
+        self,
+        formatter: type[FormatterT],
+        fmt: str,
+        regex: str,
+    ) -> None:
+        self.formatter: type[FormatterT] = formatter
+        self.fmt: str = fmt
+        self.pattern: re.Pattern[str] = re.compile(regex)
+        self.groups: DictStr = {
+            name: name.split("__", maxsplit=1)[0]
+            for name in self.pattern.groupindex
+        }
+        self.codes: tuple[str, ...] = tuple(
+            token.value for token in tokenize_fmt(fmt) if token.kind == "code"
+        )
+        self.slicer: SliceParser | None = SliceParser.from_regex(regex)
+        self.intern_key: tuple[Any, ...] | None = (
+            (formatter, fmt, formatter.Config.generation)
+            if formatter.Config.intern_maxsize != 0
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}"
+            f"({self.formatter.__name__}, fmt={self.fmt!r})>"
+        )
+
+    def _from_match(
+        self,
+        match: re.Match[str],
+        strict: bool = False,
+    ) -> FormatterT:
+        """Return an instance of formatter from the matching object of the
+        compiled pattern.
+
+        :param match: A matching object from the compiled pattern.
+        :type match: re.Match[str]
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+
+        :raises FormatterValueError: If any duplication format name do not
+            all equal.
+
+        :rtype: Formatter
+        """
+        return self._from_groups(match.groupdict(), strict=strict)
+
+    def _from_groups(
+        self,
+        groups: dict[str, Any],
+        strict: bool = False,
+        validation: ValidationType = "eager",
+    ) -> FormatterT:
+        """Return an instance of formatter from a mapping of named group and
+        its value that was matched by the regular expression or the slice
+        parser.
+
+        :param groups: A mapping of named group and its value.
+        :type groups: dict[str, Any]
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+        :param validation: A validation policy that pass to the formatter.
+        :type validation: ValidationType(='eager')
+
+        :raises FormatterValueError: If any duplication format name do not
+            all equal.
+
+        :rtype: Formatter
+        """
+        formats: dict[str, Any] = {}
+        for name, value in groups.items():
+            key: str = self.groups[name]
+            if key not in formats:
+                formats[key] = value
+            elif formats[key] != value:
+                raise FormatterValueError(
+                    "Parsing with some duplicate format name that have "
+                    "value do not all equal."
+                )
+        return self.formatter(
+            formats, set_strict_mode=strict, validation=validation
+        )
+
+    def parse(
+        self,
+        value: String,
+        *,
+        strict: bool = False,
+        validation: ValidationType = "eager",
+    ) -> FormatterT:
+        """Parse bytes or string value with this compiled format to the
+        formatter object.
+
+        :param value: A bytes or string value that match with the format.
+        :type value: String
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+        :param validation: A validation policy that validate the formatter
+            instance at the initialization with ``eager``, at the first access
+            of its value with ``lazy``, or does not validate with ``off``.
+        :type validation: ValidationType(='eager')
+
+        :raises FormatterValueError: if value does not match with regular
+            expression format string.
+
+        :rtype: Formatter
+        """
+        _value: str = bytes2str(value)
+        if (rs := self._parse_value(_value, strict, validation)) is not None:
+            return rs
+        raise FormatterValueError(
+            f"value {_value!r} does not match with format "
+            f"{self.pattern.pattern!r}"
+        )
+
+    def _parse_value(
+        self,
+        value: str,
+        strict: bool,
+        validation: ValidationType,
+    ) -> FormatterT | None:
+        """Return an instance of formatter if the whole of a value match with
+        this compiled format, or return None. If the intern cache of the
+        formatter class was enabled, it returns the shared frozen instance
+        that was kept with the key, ``(cls, fmt, value, strict, validation)``.
+        The instance of the lazy validation policy will not keep.
+
+        :param value: A string value.
+        :type value: str
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool
+        :param validation: A validation policy that pass to the formatter.
+        :type validation: ValidationType
+
+        :rtype: Formatter | None
+        """
+        # NOTE: The lazy instance does not validate yet, so it does not share
+        #   with the intern cache.
+        if (prefix := self.intern_key) is None or validation == "lazy":
+            if (_search := self._fullmatch(value)) is None:
+                return None
+            return self._from_groups(
+                _search, strict=strict, validation=validation
+            )
+
+        key: tuple[Any, ...] = (prefix, value, strict, validation)
+        cache: FormatCache = self.formatter._intern_cache
+        if (rs := cache.get(key)) is None:
+            if (_search := self._fullmatch(value)) is None:
+                return None
+            rs = self._from_groups(
+                _search, strict=strict, validation=validation
+            ).freeze()
+            cache.maxsize = self.formatter.Config.intern_maxsize
+            cache.put(key, rs)
+        return rs  # type: ignore[no-any-return]
+
+    def _fullmatch(self, value: str) -> dict[str, Any] | None:
+        """Return a mapping of named group and its value if the whole of a
+        value match with this compiled format, or return None. It uses the
+        slice parser first and fallback to the regular expression engine if
+        the slice parser does not match.
+
+        :param value: A string value.
+        :type value: str
+
+        :rtype: dict[str, Any] | None
+        """
+        if self.slicer is not None and (
+            (rs := self.slicer.parse(value)) is not None
+        ):
+            return rs
+        if _search := _match_whole(self.pattern, value):
+            return _search.groupdict()
+        return None
+
+    def match(
+        self,
+        value: String,
+        *,
+        strict: bool = False,
+    ) -> FormatterT | None:
+        """Return an instance of formatter if zero or more characters at the
+        beginning of a value match with this compiled format, or return None.
+
+        :param value: A bytes or string value.
+        :type value: String
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+
+        :rtype: Formatter | None
+        """
+        if _search := self.pattern.match(bytes2str(value)):
+            return self._from_match(_search, strict=strict)
+        return None
+
+    def fullmatch(
+        self,
+        value: String,
+        *,
+        strict: bool = False,
+        validation: ValidationType = "eager",
+    ) -> FormatterT | None:
+        """Return an instance of formatter if the whole of a value match with
+        this compiled format, or return None.
+
+        :param value: A bytes or string value.
+        :type value: String
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+        :param validation: A validation policy that pass to the formatter.
+        :type validation: ValidationType(='eager')
+
+        :rtype: Formatter | None
+        """
+        return self._parse_value(bytes2str(value), strict, validation)
+
+    def parse_many(
+        self,
+        values: Iterable[String],
+        *,
+        strict: bool = False,
+        on_error: OnErrorType = "raise",
+        validation: ValidationType = "eager",
+    ) -> Iterator[Union[FormatterT, ParseFailure]]:
+        """Parse any bytes or string values with this compiled format to the
+        formatter objects lazily, so the memory usage does not depend on the
+        length of an input values.
+
+        :param values: An iterable of bytes or string values.
+        :type values: Iterable[String]
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+        :param on_error: An error policy that will raise an error with
+            ``raise``, ignore the failure value with ``skip``, or yield the
+            ``ParseFailure`` object with its reason with ``collect``.
+        :type on_error: OnErrorType(='raise')
+        :param validation: A validation policy that pass to the formatter.
+        :type validation: ValidationType(='eager')
+
+        :raises FormatterArgumentError: If an error policy or a validation
+            policy does not support.
+        :raises FormatterValueError: If any value does not valid with the
+            ``raise`` error policy.
+
+        :rtype: Iterator[Formatter | ParseFailure]
+        """
+        validate_on_error(on_error)
+        validate_validation(validation)
+        if on_error == "raise":
+            for value in values:
+                yield self.parse(value, strict=strict, validation=validation)
+            return
+
+        parse_value = self._parse_value
+        for value in values:
+            _value: str = bytes2str(value)
+            try:
+                rs: FormatterT | None = parse_value(_value, strict, validation)
+            except (FormatterValueError, ValueError) as err:
+                if on_error == "collect":
+                    yield ParseFailure(_value, str(err))
+                continue
+            if rs is not None:
+                yield rs
+            elif on_error == "collect":
+                yield ParseFailure(
+                    _value,
+                    (
+                        f"value does not match with format "
+                        f"{self.pattern.pattern!r}"
+                    ),
+                )
+
+    def finditer(
+        self,
+        text: String,
+        *,
+        strict: bool = False,
+    ) -> Iterator[tuple[tuple[int, int], FormatterT]]:
+        """Scan a text with the unanchored pattern of this compiled format and
+        yield the span and formatter instance of any matching lazily. The
+        empty matching or the matching that can not construct a formatter
+        instance will be skipped.
+
+        :param text: A bytes or string text value that want to scan.
+        :type text: String
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+
+        :rtype: Iterator[tuple[tuple[int, int], Formatter]]
+        """
+        for _search in self.pattern.finditer(bytes2str(text)):
+            if _search.start() == _search.end():
+                continue
+            try:
+                yield _search.span(), self._from_match(_search, strict=strict)
+            except (FormatterValueError, ValueError):
+                continue
+
+    def search(
+        self,
+        text: String,
+        *,
+        strict: bool = False,
+    ) -> tuple[tuple[int, int], FormatterT] | None:
+        """Return the span and formatter instance of the first matching of
+        this compiled format in a text, or return None.
+
+        :param text: A bytes or string text value that want to scan.
+        :type text: String
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+
+        :rtype: tuple[tuple[int, int], Formatter] | None
+        """
+        return next(self.finditer(text, strict=strict), None)
+
+    def format(self, instance: Formatter) -> str:
+        """Return a string value that was formatted from a formatter instance
+        with this compiled format.
+
+        :param instance: A formatter instance.
+        :type instance: Formatter
+
+        :rtype: str
+        """
+        return instance.format(self.fmt)
+
+
+class CompiledAnyFormat(Generic[FormatterT]):
+    """Compiled Any Format object that combine many format strings of a
+    formatter class to one regular expression pattern with a named branch for
+    each format. It resolves the matching format with a single regular
+    expression pass and keeps the hit counter of each format, that use for
+    reordering the branches by hit frequency if adaptive mode was enabled.
+
+    :param formatter: A formatter class that want to compile formats.
+    :type formatter: FormatterType
+    :param fmts: A tuple of format string values.
+    :type fmts: tuple[str, ...]
+    :param adaptive: A flag to reorder the branches by hit frequency.
+    :type adaptive: bool(=False)
+
+    Attributes:
+        * formatter: FormatterType
+            A formatter class of this compiled format.
+        * fmts: tuple[str, ...]
+            A tuple of format string values.
+        * compiled: tuple[CompiledFormat, ...]
+            A tuple of compiled format of each format string value.
+        * adaptive: bool
+            A flag to reorder the branches by hit frequency.
+        * hits: list[int]
+            A list of hit counter of each format string value.
+        * state: AnyFormatState
+            A tuple of the order of format index, the combined regular
+            expression pattern of all branches with this order, and the
+            mapping of branch name and its group names. The reordering swaps
+            all of them in one assignment.
+        * order: tuple[int, ...]
+            An order of format index that use for the pattern branches.
+        * pattern: re.Pattern[str]
+            A combined regular expression pattern of all branches.
+
+    Methods:
+        * parse: [String] -> tuple[Formatter, str]
+            An instance of formatter and its matching format string.
+
+    Note:
+        The first branch that can parse a value will win, so reordering the
+        branches with adaptive mode can change the result of an ambiguous
+        value that match with more than one format.
+    """
+
+    __slots__ = (
+        "formatter",
+        "fmts",
+        "compiled",
+        "adaptive",
+        "hits",
+        "calls",
+        "state",
+    )
+
+    # NOTE: The number of parsing calls between reordering the branches.
+    reorder_interval: ClassVar[int] = 256
+
+    def __init__(
+        self,
+        formatter: type[FormatterT],
+        fmts: tuple[str, ...],
+        *,
+        adaptive: bool = False,
+    ) -> None:
+        if not fmts:
+            raise FormatterArgumentError(
+                "fmts", "The format strings should have at least one value."
+            )
+        self.formatter: type[FormatterT] = formatter
+        self.fmts: tuple[str, ...] = fmts
+        self.compiled: tuple[CompiledFormat[FormatterT], ...] = tuple(
+            formatter.compile(fmt) for fmt in fmts
+        )
+        self.adaptive: bool = adaptive
+        self.hits: list[int] = [0] * len(fmts)
+        self.calls: int = 0
+        self.state: AnyFormatState = self.__build(tuple(range(len(fmts))))
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}"
+            f"({self.formatter.__name__}, fmts={self.fmts!r})>"
+        )
+
+    @property
+    def order(self) -> tuple[int, ...]:
+        """Return an order of format index that use for the pattern branches.
+
+        :rtype: tuple[int, ...]
+        """
+        return self.state[0]
+
+    @property
+    def pattern(self) -> re.Pattern[str]:
+        """Return a combined regular expression pattern of all branches.
+
+        :rtype: re.Pattern[str]
+        """
+        return self.state[1]
+
+    def __build(self, order: tuple[int, ...]) -> AnyFormatState:
+        """Return the state of an order of branches that is the order itself,
+        the combined regular expression pattern with this order, and the
+        mapping of branch name and its group names.
+
+        :param order: An order of format index.
+        :type order: tuple[int, ...]
+
+        :rtype: AnyFormatState
+        """
+        regexes: list[str] = []
+        for i in order:
+            regexes.append(
+                f"(?P<_b{i}>"
+                f"{self.formatter.gen_format(self.fmts[i], prefix=f'_{i}_')})"
+            )
+        pattern: re.Pattern[str] = re.compile("|".join(regexes))
+        branches: dict[str, tuple[int, tuple[tuple[str, str], ...]]] = {}
+        for i in order:
+            prefix: str = f"_{i}_"
+            branches[f"_b{i}"] = (
+                i,
+                tuple(
+                    (name, name[len(prefix) :])
+                    for name in pattern.groupindex
+                    if name.startswith(prefix)
+                ),
+            )
+        return order, pattern, branches
+
+    def __hit(self, index: int) -> None:
+        """Increase the hit counter of a format index and reorder the branches
+        by hit frequency for every ``reorder_interval`` calls if adaptive mode
+        was enabled.
         """
-        return sum(index * int(i) for index, i in enumerate(self.slot, start=1))
+        self.hits[index] += 1
+        self.calls += 1
+        if not self.adaptive or self.calls % self.reorder_interval:
+            return
+        current: tuple[int, ...] = self.state[0]
+        order: tuple[int, ...] = tuple(
+            sorted(current, key=lambda i: -self.hits[i])
+        )
+        if order != current:
+            # NOTE: Swap the whole state in one assignment, so the concurrent
+            #   parsing never sees a pattern with the branches of other order.
+            self.state = self.__build(order)
 
-    def update(
+    def parse(
         self,
-        numbers: int | TupleInt | None = None,
-        strict: bool = True,
-    ) -> Self:
-        """Update boolean value in ``self.slot`` from False to True.
+        value: String,
+        *,
+        strict: bool = False,
+    ) -> tuple[FormatterT, str]:
+        """Parse bytes or string value with the first format that can parse
+        this value to the formatter object.
 
-        :param numbers: updated numbers of this SlotLevel object.
-        :type numbers: Union[int, TupleInt]
-        :param strict: a strict flag for raise error when pass out of
-            range numbers.
-        :type strict: bool(=True)
+        :param value: A bytes or string value that match with any format.
+        :type value: String
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
 
-        :raises FormatterValueError: if updated number does not exist in range.
+        :raises FormatterValueError: If value does not match with any format
+            string value.
 
-        :rtype: Self
-        :returns: Self that was updated level
+        :rtype: tuple[Formatter, str]
+        :returns: A pair of formatter instance and its matching format string.
         """
-        _numbers: Union[int, TupleInt] = numbers or (0,)
-        for num in self.make_tuple(_numbers):
-            if num == 0:
+        _value: str = bytes2str(value)
+        order, pattern, branches = self.state
+        if (_search := _match_whole(pattern, _value)) is None:
+            raise FormatterValueError(
+                f"value {_value!r} does not match with any format in "
+                f"{self.fmts!r}"
+            )
+        index, names = branches[_search.lastgroup]  # type: ignore[index]
+        try:
+            instance: FormatterT = self.compiled[index]._from_groups(
+                {key: _search.group(name) for name, key in names},
+                strict=strict,
+            )
+            self.__hit(index)
+            return instance, self.fmts[index]
+        except (FormatterValueError, ValueError) as err:
+            error: Exception = err
+
+        # NOTE: Fallback to the next branches if the matching branch can not
+        #   construct the formatter instance.
+        for i in order[order.index(index) + 1 :]:
+            if (groups := self.compiled[i]._fullmatch(_value)) is None:
                 continue
-            elif 0 <= (_num := (num - 1)) <= (self.level - 1):
-                self.slot[_num] = True
+            try:
+                instance = self.compiled[i]._from_groups(groups, strict=strict)
+            except (FormatterValueError, ValueError):
                 continue
-            if strict:
-                raise FormatterValueError(
-                    f"number for update the slot level object does not "
-                    f"in range of 0 and {self.level}."
-                )
-        return self
+            self.__hit(i)
+            return instance, self.fmts[i]
+        raise error
 
-    def checker(
-        self,
-        numbers: int | TupleInt,
-    ) -> bool:
-        """Return True if boolean value in ``self.slot`` is all True.
 
-        :param numbers: An index number values that want to check in slot.
-        :type numbers: Union[int, TupleInt]
+@dataclass(frozen=True)
+class FormatTranslator:
+    """Format Translator data class that converts a string value from an input
+    format to an output format of a formatter class directly. It keeps the
+    compiled format of the input format and the format template of the output
+    format, so the translation does not look up the compiled format cache for
+    each value. The validation will turn off if the attributes that the
+    validate method checks do not exist in the output format.
 
-        :rtype: bool
-        :returns: A True if all values in ``self.slot`` that match with
-            index numbers are True.
+    .. dataclass attributes::
+
+        - compiled: CompiledFormat
+            A compiled format of the input format string value.
+        - template: FormatTemplate
+            A format template of the output format string value.
+        - validation: ValidationType
+            A validation policy that pass to the parsing of input value.
+    """
+
+    compiled: CompiledFormat[Any]
+    template: FormatTemplate
+    validation: ValidationType = "eager"
+
+    @classmethod
+    def from_fmt(
+        cls,
+        formatter: FormatterType,
+        fmt_in: str,
+        fmt_out: str,
+    ) -> Self:
+        """Return a format translator of an input and output format string
+        values of a formatter class.
+
+        :param formatter: A formatter class.
+        :type formatter: FormatterType
+        :param fmt_in: An input format string value.
+        :type fmt_in: str
+        :param fmt_out: An output format string value.
+        :type fmt_out: str
+
+        :raises FormatterKeyError: If any format code of the output format
+            does not support for this formatter class.
+
+        :rtype: Self
         """
-        _numbers: TupleInt = self.make_tuple(numbers)
-        return all(
-            (
-                self.slot[_n]
-                if (0 <= (_n := (n - 1)) <= (self.level - 1))
-                else False
-            )
-            for n in filter(lambda x: x != 0, _numbers)
+        template: FormatTemplate = formatter.compile_template(fmt_out)
+        fields: frozenset[str] | None = formatter.validate_fields
+        attrs: frozenset[str] | None = formatter._format_attrs(fmt_out)
+        return cls(
+            compiled=formatter.compile(fmt_in),
+            template=template,
+            validation=(
+                "off"
+                if (
+                    fields is not None
+                    and attrs is not None
+                    and fields.isdisjoint(attrs)
+                )
+                else "eager"
+            ),
         )
 
-    @staticmethod
-    def make_tuple(value: int | TupleInt) -> TupleInt:
-        """Return tuple of integer value that was created from input value
-        parameter if it is not tuple.
+    def translate(self, value: String) -> str:
+        """Return a string value of the output format that was translated from
+        a bytes or string value of the input format.
 
-        :param value: a tuple of integers or any integer
-        :type value: Union[int, TupleInt]
+        :param value: A bytes or string value that match with the input
+            format.
+        :type value: String
 
-        :rtype: TupleInt
-        :returns: A tuple of integer value that was created from input.
-        """
-        return (value,) if isinstance(value, int) else value
+        :raises FormatterValueError: If a value does not match with the input
+            format, or it does not valid.
 
+        :rtype: str
+        """
+        return self.template.render(
+            self.compiled.parse(value, validation=self.validation)
+        )
 
-@dataclass(frozen=True)
-class PriorityData:
-    """Priority Data class.
+    def translate_many(
+        self,
+        values: Iterable[String],
+        *,
+        on_error: OnErrorType = "raise",
+    ) -> Iterator[Union[str, ParseFailure]]:
+        """Translate any bytes or string values of the input format to the
+        string values of the output format lazily.
 
-    .. dataclass attributes::
+        :param values: An iterable of bytes or string values.
+        :type values: Iterable[String]
+        :param on_error: An error policy that will raise an error with
+            ``raise``, ignore the failure value with ``skip``, or yield the
+            ``ParseFailure`` object with its reason with ``collect``.
+        :type on_error: OnErrorType(='raise')
 
-        - value: PriorityCallable
-        - level: int | TupleInt | None
-    """
+        :raises FormatterArgumentError: If an error policy does not support.
 
-    value: PriorityCallable = field(default=itself, repr=False)
-    level: int | TupleInt | None = field(default=(0,))
+        :rtype: Iterator[str | ParseFailure]
+        """
+        validate_on_error(on_error)
+        render: Callable[[Formatter], str] = self.template.render
+        for rs in self.compiled.parse_many(
+            values, on_error=on_error, validation=self.validation
+        ):
+            yield rs if isinstance(rs, ParseFailure) else render(rs)
 
 
 class BaseFormatter(ABC):
@@ -314,20 +2572,72 @@ class Formatter(BaseFormatter):
         * Config: object
             A Configuration object that use for group and keep any config for
             this sub-formatter object.
+        * validate_fields: frozenset[str] | None
+            The attributes that the validate method checks, the validation
+            will skip if any of them does not parse.
+        * shared_priorities: bool
+            The flag to compile the priorities value once for this class
+            instead of for each instance.
+        * code_renderers: dict[str, Callable[[Any], str]] | None
+            The table of all format codes, and their renderers that receive a
+            prepared value.
 
     .. class-methods::
         * from_value: Self
             An instance of formatter that was use ``cls.parse`` method from any
             correct string value with the ``cls.base_fmt`` value.
+        * from_fields: Self
+            An instance of formatter that set its attributes from the trusted
+            typed fields directly without the regular expression layer.
+        * prepare_fields: dict[str, Any]
+            A mapping of attribute name and its value that was prepared from
+            the typed fields of ``cls.from_fields``.
         * parse: Self
             An instance of formatter that parse from a bytes or string value by
             a format string or base format string if it None.
+        * parse_many: Iterator[Self | ParseFailure]
+            A lazy iterator of formatter instances that parse from any bytes or
+            string values by a format string with an error policy.
+        * compile: CompiledFormat
+            A compiled format object of a format string value that was kept in
+            the compiled format cache.
+        * compile_pattern: re.Pattern[str]
+            A compiled regular expression pattern of a format string value that
+            was kept in the compiled format cache.
+        * compile_template: FormatTemplate
+            A format template of a format string value that was kept in the
+            compiled format cache.
+        * format_many: Iterator[str] | int
+            A lazy iterator of string values that format from any formatter
+            instances or native values, or a number of string values that
+            was written to a sink.
+        * compile_translator: FormatTranslator
+            A format translator of an input and output format string values
+            that was kept in the compiled format cache.
+        * translate: str
+            A string value of the output format that was translated from a
+            bytes or string value of the input format.
+        * translate_many: Iterator[str | ParseFailure] | int
+            A lazy iterator of string values that translate from any bytes or
+            string values, or a number of string values that was written to
+            a sink.
+        * cache_info: CacheInfo
+            A statistic information of the compiled format cache.
+        * cache_clear: None
+            Clear the compiled format cache.
+        * intern_info: CacheInfo
+            A statistic information of the intern cache.
+        * intern_clear: None
+            Clear the intern cache.
         * gen_format: str
             A format string value that was changed to the regular expression
             string value for comply with the `re` module to any string value.
         * regex: DictStr
             A dict of format string, and it's regular expression string
             value that was generated from values of ``cls.formatter``.
+        * regex_templates: dict[str, RegexTemplate]
+            A dict of format string, and it's regex template that was split
+            at the named group slots.
 
     .. attributes::
         * value: Any
@@ -381,13 +2691,60 @@ class Formatter(BaseFormatter):
     # This value must reassign from child class
     base_level: ClassVar[int] = 1
 
-    class Config:
+    class Config(metaclass=ConfigMeta):
         """A Configuration object that use for group and keep any config for
-        this sub-formatter object.
+        this sub-formatter object. Any change of this config will increase its
+        generation number, ``Config.generation``, that invalidate all derived
+        caches of the formatter class.
         """
 
         base_config_value: ClassVar[Any | None] = None
 
+        # The maximum size of the compiled format cache of each formatter
+        # class. It will be unbounded if it set to None, and disable caching
+        # if it set to 0. The eviction policy of this cache is LRU.
+        cache_maxsize: ClassVar[int | None] = 128
+
+        # The maximum size of the intern cache of each formatter class that
+        # keep the shared frozen instances of the parsing values. It will be
+        # unbounded if it set to None, and disable interning if it set to 0.
+        intern_maxsize: ClassVar[int | None] = 0
+
+    # The compiled format cache that will create for each subclass.
+    _format_cache: ClassVar[FormatCache] = FormatCache()
+
+    # The intern cache that will create for each subclass.
+    _intern_cache: ClassVar[FormatCache] = FormatCache(maxsize=0)
+
+    # The attributes that the validate method checks, the validation will
+    # skip if any attribute does not parse. It will always validate if it set
+    # to None, and it will reset to None for a subclass that override the
+    # validate method without this value.
+    validate_fields: ClassVar[frozenset[str] | None] = None
+
+    # The flag of the lazy validation that will validate at the first access
+    # of the value property.
+    _validate_pending: bool = False
+
+    # The flag to compile the priorities value of a blank instance once for
+    # each generation of the config of this class. All converters of the
+    # priorities value should be methods of the instance, partial objects of
+    # these methods, or callables that do not reference the instance. A
+    # subclass that references the instance in any other converter, like a
+    # lambda that calls the instance, should set it to False, and then the
+    # priorities value will compile for each instance instead.
+    shared_priorities: ClassVar[bool] = True
+
+    # The memo mapping of an instance that keep the results of the properties
+    # that were decorated with ``memo_property`` until any attribute of this
+    # instance was changed.
+    _memo: dict[str, Any] | None = None
+
+    # The flag of the frozen mode that make all attributes of an instance be
+    # read-only, and the hash value that was kept when it was frozen.
+    _frozen: bool = False
+    _hash: int | None = None
+
     def __init_subclass__(
         cls: type[Self],
         /,
@@ -405,8 +2762,13 @@ class Formatter(BaseFormatter):
         """
         cls.base_level: int = level or cls.base_level
         cls.base_fmt: str = fmt or cls.base_fmt
+        cls._format_cache = FormatCache(maxsize=cls.Config.cache_maxsize)
+        cls._intern_cache = FormatCache(maxsize=cls.Config.intern_maxsize)
         super().__init_subclass__(**kwargs)
 
+        if "validate" in cls.__dict__ and "validate_fields" not in cls.__dict__:
+            cls.validate_fields = None
+
         if not cls.base_fmt:
             raise NotImplementedError(
                 "Please implement base_fmt class property for this "
@@ -423,25 +2785,163 @@ class Formatter(BaseFormatter):
         cls,
         value: Any,
     ) -> Self:
-        """Passer the value to this formatter that will pass this value to
-        ``cls.formatter`` method and map with the base format string value
-        before parse by ``cls.parse``.
+        """Passer the value to this formatter that will set the typed fields
+        from ``cls.value_fields`` directly with ``cls.from_fields`` if they
+        cover all attributes of the base format string value. Otherwise, it
+        will pass this value to ``cls.formatter`` method and map with the base
+        format string value before parse by ``cls.parse``.
 
         :param value: An any value that able to pass to `cls.formatter` method.
         :type value: Any
 
         :rtype: Self
-        :returns: An instance of formatter that was use ``cls.parse`` method
-            from any correct string value with the ``cls.base_fmt`` value.
+        :returns: An instance of formatter that was set up from an input value
+            with the same attributes of the ``cls.base_fmt`` value.
         """
+        if (attrs := cls._base_attrs()) is not None and (
+            (fields := cls.value_fields(value)) is not None
+        ):
+            if attrs <= fields.keys():
+                return cls.from_fields(
+                    validate=(
+                        cls.validate_fields is None
+                        or not cls.validate_fields.isdisjoint(attrs)
+                    ),
+                    **{k: fields[k] for k in attrs},
+                )
+
+        codes: set[str] = {
+            token.value
+            for token in tokenize_fmt(cls.base_fmt)
+            if token.kind == "code"
+        }
         fmt_filter = [
             (k, caller(v["value"]))
             for k, v in cls.formatter(value).items()
-            if k in re.findall("(%[-+!*]?[A-Za-z])", cls.base_fmt)
+            if k in codes
         ]
         fmts, values = zip(*fmt_filter)
         return cls.parse(value="_".join(values), fmt="_".join(fmts))
 
+    @classmethod
+    def from_fields(
+        cls,
+        *,
+        validate: bool = False,
+        frozen: bool = False,
+        **fields: Any,
+    ) -> Self:
+        """Return an instance of this formatter that set its attributes from
+        the trusted typed fields directly. It skips the regular expression
+        layer and the converters of priorities, and updates the levels of all
+        fields to the slot level in bulk. The default priorities will set up
+        the attributes that do not pass like the initialization.
+
+        :param validate: A flag to run the ``self.validate`` method after set
+            up all attributes.
+        :type validate: bool(=False)
+        :param frozen: A flag to freeze this instance after set up all
+            attributes.
+        :type frozen: bool(=False)
+        :param fields: A mapping of attribute name and its typed value that
+            will prepare with ``cls.prepare_fields``.
+        :type fields: Any
+
+        :raises FormatterArgumentError: If any field does not an attribute of
+            the priorities of this formatter.
+        :raises FormatterValueError: If the validate flag is True, and the
+            attributes do not valid from validator.
+
+        :rtype: Self
+        """
+        self: Self = cls.__new__(cls)
+        self.level = SlotLevel(level=cls.base_level)
+        for attr in getattr(self, "__slots__", ()):
+            if attr != (cls.__name__.lower()):
+                setattr(self, attr, None)
+
+        plan: tuple[PriorityStep, ...] = (
+            cls._priority_plan() or cls._compile_priorities(self)
+        )
+        levels: dict[str, TupleInt] = (
+            cls._priority_levels() or _plan_levels(plan)
+        )
+        if unknown := sorted(fields.keys() - levels.keys()):
+            raise FormatterArgumentError(
+                tuple(unknown),
+                f"The fields do not support for {cls.__name__!r}.",
+            )
+        numbers: list[int] = []
+        for attr, value in cls.prepare_fields(fields).items():
+            setattr(self, attr, value)
+            numbers.extend(levels[attr])
+        self.level.update(tuple(numbers))
+
+        for step in plan:
+            if step.default and not getattr(self, step.attr):
+                setattr(self, step.attr, step.convert(self))
+                self.level.update(step.level)
+
+        if validate and not self.validate():
+            raise FormatterValueError(
+                "Parsing value does not valid from validator"
+            )
+        self._setter_std_value(flag=True)
+        return self.freeze() if frozen else self
+
+    @classmethod
+    def prepare_fields(cls, fields: dict[str, Any]) -> dict[str, Any]:
+        """Return a mapping of attribute name and its value that was prepared
+        from the typed fields of ``cls.from_fields`` to the same type of
+        attribute value that was set up from the initialization.
+
+        :param fields: A mapping of attribute name and its typed value.
+        :type fields: dict[str, Any]
+
+        :rtype: dict[str, Any]
+        """
+        return fields
+
+    @classmethod
+    def value_fields(cls, value: Any) -> dict[str, Any] | None:
+        """Return a mapping of attribute name and its typed value that was
+        extracted from a value for ``cls.from_value`` without formatting and
+        parsing it, or return None if this formatter class does not support.
+
+        :param value: An any value that able to pass to `cls.prepare_value`.
+        :type value: Any
+
+        :rtype: dict[str, Any] | None
+        """
+        return None
+
+    @classmethod
+    @config_cache
+    def _base_attrs(cls) -> frozenset[str] | None:
+        """Return a set of attributes that the parsing of the base format
+        string value sets, or return None if the priority plan does not
+        compile for this formatter class.
+
+        :rtype: frozenset[str] | None
+        """
+        return cls._format_attrs(cls.base_fmt)
+
+    @classmethod
+    def _format_attrs(cls, fmt: str) -> frozenset[str] | None:
+        """Return a set of attributes that the parsing of a format string
+        value sets, or return None if the priority plan does not compile for
+        this formatter class.
+
+        :param fmt: A format string value.
+        :type fmt: str
+
+        :rtype: frozenset[str] | None
+        """
+        if (plan := cls._priority_plan()) is None:
+            return None
+        names: set[str] = set(cls.compile(fmt).groups.values())
+        return frozenset(step.attr for step in plan if step.name in names)
+
     @classmethod
     def parse(
         cls,
@@ -449,6 +2949,7 @@ class Formatter(BaseFormatter):
         fmt: str | None = None,
         *,
         strict: bool = False,
+        validation: ValidationType = "eager",
     ) -> Self:
         """Parse bytes or string value with its format to this formatter object.
         This method generates the value for itself data that can be formatted
@@ -461,6 +2962,10 @@ class Formatter(BaseFormatter):
         :type fmt: str | None(=None)
         :param strict: A flag strict validate that pass to ``set_strict_mode``.
         :type strict: bool(=False)
+        :param validation: A validation policy that validate the instance at
+            the initialization with ``eager``, at the first access of its
+            value with ``lazy``, or does not validate with ``off``.
+        :type validation: ValidationType(='eager')
 
         :raises NotImplementedError: if fmt value parameter does not pass form
             input, or `cls.base_fmt` does not implement.
@@ -480,13 +2985,272 @@ class Formatter(BaseFormatter):
                 "value."
             )
 
-        _fmt = cls.gen_format(_fmt)
-        if _search := re.search(rf"^{_fmt}$", _value):
-            return cls(_search.groupdict(), set_strict_mode=strict)
+        return cls.compile(_fmt).parse(
+            _value, strict=strict, validation=validation
+        )
+
+    @classmethod
+    def parse_many(
+        cls,
+        values: Iterable[String],
+        fmt: str | None = None,
+        *,
+        strict: bool = False,
+        on_error: OnErrorType = "raise",
+        validation: ValidationType = "eager",
+    ) -> Iterator[Union[Self, ParseFailure]]:
+        """Parse any bytes or string values with its format to this formatter
+        objects lazily. The format string will compile only once before
+        parsing.
+
+        :param values: An iterable of bytes or string values.
+        :type values: Iterable[String]
+        :param fmt: a format value will use `cls.base_fmt` if it does not pass
+            from input argument.
+        :type fmt: str | None(=None)
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+        :param on_error: An error policy that will raise an error with
+            ``raise``, ignore the failure value with ``skip``, or yield the
+            ``ParseFailure`` object with its reason with ``collect``.
+        :type on_error: OnErrorType(='raise')
+        :param validation: A validation policy that pass to the instances.
+        :type validation: ValidationType(='eager')
+
+        :rtype: Iterator[Self | ParseFailure]
+        """
+        validate_on_error(on_error)
+        validate_validation(validation)
+        return cls.compile(fmt).parse_many(
+            values, strict=strict, on_error=on_error, validation=validation
+        )
+
+    @classmethod
+    def finditer(
+        cls,
+        text: String,
+        fmt: str | None = None,
+        *,
+        strict: bool = False,
+    ) -> Iterator[tuple[tuple[int, int], Self]]:
+        """Scan a bytes or string text value, such as log lines or a whole
+        file, with its format and yield the span and formatter object of any
+        matching lazily.
+
+        :param text: A bytes or string text value that want to scan.
+        :type text: String
+        :param fmt: a format value will use `cls.base_fmt` if it does not pass
+            from input argument.
+        :type fmt: str | None(=None)
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+
+        :rtype: Iterator[tuple[tuple[int, int], Self]]
+        """
+        return cls.compile(fmt).finditer(
+            text, strict=strict
+        )
+
+    @classmethod
+    def search(
+        cls,
+        text: String,
+        fmt: str | None = None,
+        *,
+        strict: bool = False,
+    ) -> tuple[tuple[int, int], Self] | None:
+        """Return the span and formatter object of the first matching of its
+        format in a bytes or string text value, or return None.
+
+        :param text: A bytes or string text value that want to scan.
+        :type text: String
+        :param fmt: a format value will use `cls.base_fmt` if it does not pass
+            from input argument.
+        :type fmt: str | None(=None)
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+
+        :rtype: tuple[tuple[int, int], Self] | None
+        """
+        return cls.compile(fmt).search(
+            text, strict=strict
+        )
+
+    @classmethod
+    def parse_any(
+        cls,
+        value: String,
+        fmts: Iterable[str],
+        *,
+        strict: bool = False,
+        adaptive: bool = False,
+    ) -> tuple[Self, str]:
+        """Parse bytes or string value with the first format in any format
+        string values that can parse this value. All formats will combine to
+        one cached regular expression pattern, so it resolves the matching
+        format with a single pass.
+
+        :param value: A bytes or string value that match with any format.
+        :type value: String
+        :param fmts: An iterable of format string values.
+        :type fmts: Iterable[str]
+        :param strict: A flag strict validate that pass to ``set_strict_mode``.
+        :type strict: bool(=False)
+        :param adaptive: A flag to reorder the formats by hit frequency.
+        :type adaptive: bool(=False)
+
+        :raises FormatterValueError: If value does not match with any format
+            string value.
+
+        :rtype: tuple[Self, str]
+        :returns: A pair of formatter instance and its matching format string.
+        """
+        return cls.compile_any(
+            fmts, adaptive=adaptive
+        ).parse(value, strict=strict)
+
+    @classmethod
+    def compile_any(
+        cls,
+        fmts: Iterable[str],
+        *,
+        adaptive: bool = False,
+    ) -> CompiledAnyFormat[Self]:
+        """Return a compiled any format object of format string values that
+        was kept in the compiled format cache of this formatter class.
+
+        :param fmts: An iterable of format string values.
+        :type fmts: Iterable[str]
+        :param adaptive: A flag to reorder the formats by hit frequency.
+        :type adaptive: bool(=False)
+
+        :rtype: CompiledAnyFormat[Self]
+        """
+        _fmts: tuple[str, ...] = tuple(fmts)
+        key: tuple[Any, ...] = (cls, _fmts, adaptive, cls.Config.generation)
+        cache: FormatCache = cls._format_cache
+        if (compiled := cache.get(key)) is None:
+            cache.maxsize = cls.Config.cache_maxsize
+            compiled = cache.put(
+                key, CompiledAnyFormat(cls, _fmts, adaptive=adaptive)
+            )
+        return compiled  # type: ignore[no-any-return]
+
+    @classmethod
+    def compile(cls, fmt: str | None = None) -> CompiledFormat[Self]:
+        """Return a compiled format object of a format string value that can
+        reuse for parsing and formatting many values without re-deriving the
+        format string.
+
+        :param fmt: a format value will use `cls.base_fmt` if it does not pass
+            from input argument.
+        :type fmt: str | None(=None)
+
+        :rtype: CompiledFormat[Self]
+        :returns: A compiled format object that was kept in the compiled
+            format cache.
+        """
+        return cls.__compile(fmt or cls.base_fmt)
+
+    @classmethod
+    def __compile(
+        cls,
+        fmt: str,
+        *,
+        prefix: str | None = None,
+        suffix: str | None = None,
+        alias: bool = True,
+    ) -> CompiledFormat[Self]:
+        """Return a compiled format object that keep in the compiled format
+        cache of this formatter class with the key,
+        ``(cls, fmt, prefix, suffix, alias)``, that was bounded by
+        ``cls.Config.cache_maxsize``. The key will include the generation
+        number of the config class for avoiding the stale compiled format.
+        """
+        key: tuple[Any, ...] = (
+            cls,
+            fmt,
+            prefix,
+            suffix,
+            alias,
+            cls.Config.generation,
+        )
+        cache: FormatCache = cls._format_cache
+        if (compiled := cache.get(key)) is None:
+            cache.maxsize = cls.Config.cache_maxsize
+            compiled = cache.put(
+                key,
+                CompiledFormat(
+                    cls,
+                    fmt,
+                    cls.__gen_format(
+                        fmt, prefix=prefix, suffix=suffix, alias=alias
+                    ),
+                ),
+            )
+        return compiled  # type: ignore[no-any-return]
+
+    @classmethod
+    def compile_pattern(
+        cls,
+        fmt: str,
+        *,
+        prefix: str | None = None,
+        suffix: str | None = None,
+        alias: bool = True,
+    ) -> re.Pattern[str]:
+        """Return a compiled regular expression pattern of a format string
+        value. This pattern will keep in the compiled format cache of this
+        formatter class with the key, ``(cls, fmt, prefix, suffix, alias)``,
+        that was bounded by ``cls.Config.cache_maxsize``.
+
+        :param fmt: a format string value pass from input argument.
+        :type fmt: str
+        :param prefix: a prefix string value that will add to alias format
+            string value.
+        :type prefix: str | None(=None)
+        :param suffix: a suffix string value that will add to alias format
+            string value.
+        :type suffix: str | None(=None)
+        :param alias: an alias boolean flag that will pass alias name if it
+            true to the format string value.
+        :type alias: bool
+
+        :rtype: re.Pattern[str]
+        :returns: A compiled regular expression pattern of a format string.
+        """
+        return cls.__compile(
+            fmt, prefix=prefix, suffix=suffix, alias=alias
+        ).pattern
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Return a statistic information of the compiled format cache of this
+        formatter class.
+
+        :rtype: CacheInfo
+        """
+        return cls._format_cache.info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Clear the compiled format cache of this formatter class."""
+        cls._format_cache.clear()
 
-        raise FormatterValueError(
-            f"value {_value!r} does not match with format {_fmt!r}"
-        )
+    @classmethod
+    def intern_info(cls) -> CacheInfo:
+        """Return a statistic information of the intern cache of this
+        formatter class, the hit ratio of this information will show how many
+        parsing values reuse the shared instances.
+
+        :rtype: CacheInfo
+        """
+        return cls._intern_cache.info()
+
+    @classmethod
+    def intern_clear(cls) -> None:
+        """Clear the intern cache of this formatter class."""
+        cls._intern_cache.clear()
 
     @classmethod
     def gen_format(
@@ -499,6 +3263,40 @@ class Formatter(BaseFormatter):
     ) -> str:
         """Generate format string value that combine from any matching of
         format name with format regular expression value that able to search.
+        This value will get from the compiled format cache.
+
+        :param fmt: a format string value pass from input argument.
+        :type fmt: str
+        :param prefix: a prefix string value that will add to alias format
+            string value.
+        :type prefix: str | None(=None)
+        :param suffix: a suffix string value that will add to alias format
+            string value.
+        :type suffix: str | None(=None)
+        :param alias: an alias boolean flag that will pass alias name if it
+            true to the format string value.
+        :type alias: bool
+
+        :rtype: str
+        :returns: A format string value that was changed to the regular
+            expression string value for comply with the `re` module to any
+            string value.
+        """
+        return cls.compile_pattern(
+            fmt, prefix=prefix, suffix=suffix, alias=alias
+        ).pattern
+
+    @classmethod
+    def __gen_format(
+        cls,
+        fmt: str,
+        *,
+        prefix: str | None = None,
+        suffix: str | None = None,
+        alias: bool = True,
+    ) -> str:
+        """Generate format string value that combine from any matching of
+        format name with format regular expression value that able to search.
 
         :param fmt: a format string value pass from input argument.
         :type fmt: str
@@ -517,16 +3315,20 @@ class Formatter(BaseFormatter):
             expression string value for comply with the `re` module to any
             string value.
         """
-        _cache: dict[str, int] = defaultdict(int)
+        _cache: dict[str, int] = {}
         _prefix: str = prefix or ""
         _suffix: str = suffix or ""
-        regexes = cls.regex()
-        for fmt_match in re.finditer(r"(%?%[-+!*]?[A-Za-z])", fmt):
-            fmt_str: str = fmt_match.group()
-            if fmt_str.startswith("%%"):
-                fmt = fmt.replace(fmt_str, fmt_str[1:], 1)
+        templates: dict[str, RegexTemplate] = cls.regex_templates()
+        results: list[str] = []
+        for token in tokenize_fmt(fmt):
+            if token.kind == "literal":
+                results.append(token.value)
+                continue
+            elif token.kind == "escape":
+                results.append("%")
                 continue
-            if fmt_str not in regexes:
+            fmt_str: str = token.value
+            if fmt_str not in templates:
                 raise FormatterArgumentError(
                     "fmt",
                     (
@@ -534,44 +3336,21 @@ class Formatter(BaseFormatter):
                         f"``cls.regex``."
                     ),
                 )
-            regex: str = regexes[fmt_str]
-            insided: bool = False
-            for fmt_inside in re.finditer(
-                r"\(\?P<(?P<alias>\w+)>(?P<fmt>(?:(?!\(\?P<\w+>).)*)\)",
-                regex,
-            ):
-                _sr_re: str = fmt_inside.group("alias")
-                regex = re.sub(
-                    rf"\(\?P<{_sr_re}>",
-                    (
-                        (
-                            f"(?P<{_prefix}{_sr_re}{scache(_cache[_sr_re])}"
-                            f"{_suffix}>"
-                        )
-                        if alias
-                        else "("
-                    ),
-                    regex,
-                    count=1,
-                )
-                _cache[_sr_re] += 1
-                insided = True
-            if not insided:
-                raise FormatterValueError(
-                    "Regex format string does not set group name for "
-                    "parsing value to its class."
+            results.append(
+                templates[fmt_str].render(
+                    _cache, prefix=_prefix, suffix=_suffix, alias=alias
                 )
-            fmt = fmt.replace(fmt_str, regex, 1)
-        return fmt
+            )
+        return "".join(results)
 
     @classmethod
-    @lru_cache(maxsize=None)
+    @config_cache
     def regex(cls) -> DictStr:
         """Return a dict of format string, and it's regular expression value
         that was generated from values of ``cls.formatter``. This class-method
-        was wrapped with ``lru_cache`` function for more frequency getting this
-        ``cls.regex()`` value because the value does not change depend on the
-        formatter class.
+        was wrapped with ``config_cache`` function for more frequency getting
+        this ``cls.regex()`` value because the value does not change depend on
+        the formatter class until its config was changed.
 
         :raises FormatterValueError: if any key of value in formatter mapping
             does not contain `regex` nor `cregex`.
@@ -600,29 +3379,279 @@ class Formatter(BaseFormatter):
                     "in dict value"
                 )
         for f, cr in pre_results.items():
-            cr = cr.replace("%%", "[ESCAPE]")
-            for cm in re.finditer(r"(%[-+!*]?[A-Za-z])", cr):
-                cs: str = cm.group()
-                if cs in results:
-                    cr = cr.replace(cs, results[cs], 1)
+            crs: list[str] = []
+            for token in tokenize_fmt(cr):
+                if token.kind != "code":
+                    crs.append(token.value)
+                elif token.value in results:
+                    crs.append(results[token.value])
                 else:
                     raise FormatterArgumentError(
                         "format",
                         (
-                            f"format cregex string that contain {cs} regex "
-                            f"does not found."
+                            f"format cregex string that contain {token.value} "
+                            f"regex does not found."
                         ),
                     )
-            results[f] = cr.replace("[ESCAPE]", "%%")
+            results[f] = "".join(crs)
         return results
 
-    def values(self, value: Any | None = None) -> DictStr:
-        """Return a dict of format string, and it's string value that was passed
-        an input value to `cls.formatter` method.
+    @classmethod
+    @config_cache
+    def infer_specs(cls) -> dict[str, InferSpec]:
+        """Return a dict of format string, and it's inference specification
+        that was generated from ``cls.regex()`` and ``cls.base_fmt`` for
+        inferring the format string from sample values. The format strings
+        of ``cls.base_fmt`` come first with their order, and then the others
+        with the order of ``cls.regex()``.
+
+        :rtype: dict[str, InferSpec]
+        """
+        regex: DictStr = cls.regex()
+        base: list[str] = [
+            token.value
+            for token in tokenize_fmt(cls.base_fmt)
+            if token.kind == "code" and token.value in regex
+        ]
+        names: dict[str, frozenset[str]] = {
+            f: frozenset(
+                name.split("_", 1)[0]
+                for name in re.findall(r"\(\?P<(\w+)>", regex[f])
+            )
+            for f in dict.fromkeys([*base, *regex])
+        }
+        ranks: dict[str, int] = {}
+        for i, f in enumerate(base):
+            for name in names[f]:
+                ranks.setdefault(name, i)
+        return {
+            f: InferSpec(
+                pattern=re.compile(regex[f]),
+                names=names[f],
+                rank=max(
+                    (ranks.get(name, len(base)) for name in names[f]),
+                    default=0,
+                ),
+            )
+            for f in names
+        }
 
-        :rtype: DictStr
-        :returns: A dict of format string, and it's string value that was passed
-            an input value to `cls.formatter` method.
+    @classmethod
+    def infer_format(
+        cls,
+        samples: Iterable[String],
+        *,
+        limit: int = 5,
+    ) -> list[FormatCandidate]:
+        """Return candidate format string values that was inferred from any
+        sample values and ranked by coverage. The sample values will group by
+        its shape, and the candidates will search from the representative
+        values of each shape with the cached regular expression of each
+        format string from ``cls.infer_specs()``, so it does not trial-parse
+        every permutation of format strings.
+
+            The candidates that have the same coverage will rank by the order
+        of its shape, and then by the order of the search of each shape that
+        prefers the candidate that sets the leading named groups of
+        ``cls.base_fmt``.
+
+        :param samples: An iterable of bytes or string sample values.
+        :type samples: Iterable[String]
+        :param limit: A limit number of return candidates.
+        :type limit: int(=5)
+
+        :rtype: list[FormatCandidate]
+        """
+        counter: dict[str, int] = _count_samples(samples)
+        shapes: dict[str, list[str]] = defaultdict(list)
+        for value in counter:
+            shapes[_sample_shape(value)].append(value)
+
+        compiled: dict[str, CompiledFormat[Any] | None] = {}
+        candidates: dict[str, tuple[int, ...]] = {}
+        for index, values in enumerate(
+            sorted(
+                shapes.values(),
+                key=lambda vs: -sum(counter[v] for v in vs),
+            )[:INFER_SHAPES]
+        ):
+            for order, fmt in enumerate(
+                cls.__infer_candidates(
+                    _sample_spread(values, INFER_SAMPLES), limit, compiled
+                )
+            ):
+                candidates.setdefault(fmt, (index, order))
+        return _rank_candidates(
+            candidates,
+            counter,
+            limit,
+            partial(cls.__infer_count, compiled=compiled),
+        )
+
+    @classmethod
+    def __infer_candidates(
+        cls,
+        values: list[str],
+        limit: int,
+        compiled: dict[str, CompiledFormat[Any] | None],
+    ) -> list[str]:
+        """Return the limit number of candidate format string values that can
+        parse all representative values that have the same shape. It searches
+        the format strings from left to right of the values in the order of
+        the maximum rank of its format strings, so the candidate that sets
+        the leading named groups of ``cls.base_fmt`` comes first, and then
+        the order of its format strings in ``cls.infer_specs()``. This order
+        never decreases when a candidate grows, so the search completes the
+        candidates in this order, and a partial candidate with the same
+        position and named groups will expand at most the limit number of
+        times.
+
+        :param values: A list of representative values that have the same
+            shape.
+        :type values: list[str]
+        :param limit: A limit number of return candidates.
+        :type limit: int
+        :param compiled: A mapping of the compiled format of candidates.
+        :type compiled: dict[str, CompiledFormat | None]
+
+        :rtype: list[str]
+        """
+        specs: dict[str, InferSpec] = cls.infer_specs()
+        value: str = values[0]
+        size: int = len(value)
+
+        # NOTE: A move is a tuple of the end position, the index of the
+        #   format string, the token, and the named groups of this token.
+        moves: list[list[tuple[int, int, str, frozenset[str]]]] = []
+        for pos in range(size):
+            moves.append([])
+            for index, (f, spec) in enumerate(specs.items()):
+                if not (match := spec.pattern.match(value, pos)) or (
+                    (end := match.end()) == pos
+                ):
+                    continue
+                if all(
+                    (m := spec.pattern.match(v, pos)) is not None
+                    and m.end() == end
+                    for v in values[1:]
+                ):
+                    moves[pos].append((end, index, f, spec.names))
+
+            # NOTE: Any character that does not a digit and equal in all
+            #   representative values can be the literal. A letter of the only
+            #   one representative value can not tell that it is constant, so
+            #   it will be the literal when any format string does not match.
+            char: str = value[pos]
+            if (
+                not char.isdigit()
+                and all(v[pos] == char for v in values)
+                and not (char.isalpha() and len(values) == 1 and moves[pos])
+            ):
+                moves[pos].append(
+                    (pos + 1, -1, "%%" if char == "%" else char, frozenset())
+                )
+
+        # NOTE: A state is a tuple of the ranking tuple, the maximum rank and
+        #   the indexes of its format strings, the position, the tokens, and
+        #   the named groups.
+        heap: list[InferState] = [((0,), 0, (), frozenset())]
+        expanded: dict[tuple[int, frozenset[str]], int] = defaultdict(int)
+        rs: list[str] = []
+        while heap and len(rs) < limit:
+            rank, pos, tokens, names = heappop(heap)
+            if expanded[(pos, names)] >= limit:
+                continue
+            expanded[(pos, names)] += 1
+            if pos == size:
+                fmt: str = "".join(tokens)
+                if names and cls.__infer_count(
+                    fmt, dict.fromkeys(values, 1), compiled, every=True
+                ):
+                    rs.append(fmt)
+                continue
+            for end, index, token, move_names in moves[pos]:
+                if move_names & names:
+                    continue
+                heappush(
+                    heap,
+                    (
+                        (
+                            rank
+                            if index < 0
+                            else (
+                                max(rank[0], specs[token].rank),
+                                *rank[1:],
+                                index,
+                            )
+                        ),
+                        end,
+                        (*tokens, token),
+                        names | move_names,
+                    ),
+                )
+        return rs
+
+    @classmethod
+    def __infer_count(
+        cls,
+        fmt: str,
+        counter: dict[str, int],
+        compiled: dict[str, CompiledFormat[Any] | None],
+        *,
+        every: bool = False,
+    ) -> int:
+        """Return the number of sample values that can parse with a candidate
+        format. The compiled format of candidate will keep in the compiled
+        mapping instead of the compiled format cache of this class for
+        avoiding the eviction of the user formats. If the every flag is True,
+        it will return zero when any sample value can not parse.
+        """
+        if fmt not in compiled:
+            try:
+                compiled[fmt] = CompiledFormat(cls, fmt, cls.__gen_format(fmt))
+            except re.error:
+                compiled[fmt] = None
+        if (_compiled := compiled[fmt]) is None:
+            return 0
+        matched: int = 0
+        for value, count in counter.items():
+            if (groups := _compiled._fullmatch(value)) is not None:
+                try:
+                    _compiled._from_groups(groups)
+                    matched += count
+                    continue
+                except (FormatterValueError, ValueError):
+                    pass
+            if every:
+                return 0
+        return matched
+
+    @classmethod
+    @config_cache
+    def regex_templates(cls) -> dict[str, RegexTemplate]:
+        """Return a dict of format string, and it's regex template that was
+        pre-split from the regular expression value of ``cls.regex()`` at the
+        named group slots. This class-method was wrapped with ``config_cache``
+        function because the value does not change depend on the formatter
+        class until its config was changed.
+
+        :rtype: dict[str, RegexTemplate]
+        """
+        return {
+            f: RegexTemplate.from_regex(regex)
+            for f, regex in cls.regex().items()
+        }
+
+    def values(self, value: Any | None = None) -> FormatterValues:
+        """Return a lazy mapping view of format string, and it's string value
+        that was passed an input value to `cls.formatter` method. The string
+        value of each format code computes on the first access only, and the
+        view of this instance value keeps until any attribute was changed. Use
+        ``to_dict`` method of this view for a materialized dict.
+
+        :rtype: FormatterValues
+        :returns: A lazy mapping view of format string, and it's string value
+            that was passed an input value to `cls.formatter` method.
 
             Example:
                 {
@@ -631,10 +3660,14 @@ class Formatter(BaseFormatter):
                     ...
                 }
         """
-        return {
-            f: caller(props["value"])
-            for f, props in self.formatter(value or self.value).items()
-        }
+        if value:
+            return FormatterValues(self, value)
+        if (_memo := self._memo) is None:
+            object.__setattr__(self, "_memo", (_memo := {}))
+        elif (rs := _memo.get("values")) is not None:
+            return rs  # type: ignore[no-any-return]
+        _memo["values"] = rs = FormatterValues(self, self.value)
+        return rs
 
     def format(self, fmt: str) -> str:
         """Return a string value that was formatted and filled by an input
@@ -649,19 +3682,217 @@ class Formatter(BaseFormatter):
         :rtype: str
         :returns: A string value that was formatted from format string pattern.
         """
-        _fmts: ReturnFormattersType = self.formatter(self.value)
-        fmt = fmt.replace("%%", "[ESCAPE]")
-        for _fmt_match in re.finditer(r"(%[-+!*]?[A-Za-z])", fmt):
-            _fmt_str: str = _fmt_match.group()
-            try:
-                _value: Union[FormatterCallable, str] = _fmts[_fmt_str]["value"]
-                fmt = fmt.replace(_fmt_str, caller(_value))
-            except KeyError as err:
-                raise FormatterKeyError(
-                    f"the format: {_fmt_str!r} does not support for "
-                    f"{self.__class__.__name__!r}"
-                ) from err
-        return fmt.replace("[ESCAPE]", "%")
+        return self.compile_template(fmt).render(self)
+
+    @classmethod
+    def compile_template(cls, fmt: str) -> FormatTemplate:
+        """Return a format template of a format string value that was kept in
+        the compiled format cache of this formatter class with the key,
+        ``(FormatTemplate, fmt)``, and the generation number of its config.
+
+        :param fmt: A format string value for mapping with formatter.
+        :type fmt: str
+
+        :raises FormatterKeyError: If any format code does not support for
+            this formatter class.
+
+        :rtype: FormatTemplate
+        """
+        key: tuple[Any, ...] = (FormatTemplate, fmt, cls.Config.generation)
+        cache: FormatCache = cls._format_cache
+        if (template := cache.get(key)) is None:
+            cache.maxsize = cls.Config.cache_maxsize
+            template = cache.put(key, FormatTemplate.from_fmt(cls, fmt))
+        return template  # type: ignore[no-any-return]
+
+    @classmethod
+    def format_many(
+        cls,
+        values: Iterable[Any],
+        fmt: str | None = None,
+        *,
+        sink: Any | None = None,
+        sep: str = "\n",
+    ) -> Union[Iterator[str], int]:
+        """Format any formatter instances or native values, like ``datetime``
+        for Datetime, with its format lazily. The format string will compile
+        to the format template only once before formatting, and a native value
+        will pass to the formatter methods directly without creating an
+        instance. If a sink pass, the string values that end with a separator
+        will write to this text or binary sink instead.
+
+        :param values: An iterable of formatter instances or native values.
+        :type values: Iterable[Any]
+        :param fmt: a format value will use `cls.base_fmt` if it does not pass
+            from input argument.
+        :type fmt: str | None(=None)
+        :param sink: A text or binary sink object that has the ``write``
+            method, like an opened file. The string values will encode with
+            ``utf-8`` for a binary sink.
+        :type sink: Any | None(=None)
+        :param sep: A separator string that write after each string value to
+            a sink.
+        :type sep: str(='\\n')
+
+        :raises FormatterKeyError: If any format code does not support for
+            this formatter class.
+
+        :rtype: Iterator[str] | int
+        :returns: A lazy iterator of string values, or a number of string
+            values that was written to a sink if it passes.
+        """
+        strings: Iterator[str] = cls.compile_template(
+            fmt or cls.base_fmt
+        ).render_many(cls, values)
+        if sink is None:
+            return strings
+        return _write_strings(strings, sink, sep=sep)
+
+    @classmethod
+    def compile_translator(
+        cls,
+        fmt_in: str,
+        fmt_out: str | None = None,
+    ) -> FormatTranslator:
+        """Return a format translator of an input and output format string
+        values that was kept in the compiled format cache of this formatter
+        class with the key, ``(FormatTranslator, fmt_in, fmt_out)``, and the
+        generation number of its config.
+
+        :param fmt_in: An input format string value.
+        :type fmt_in: str
+        :param fmt_out: An output format string value will use `cls.base_fmt`
+            if it does not pass from input argument.
+        :type fmt_out: str | None(=None)
+
+        :raises FormatterKeyError: If any format code of the output format
+            does not support for this formatter class.
+
+        :rtype: FormatTranslator
+        """
+        _fmt_out: str = fmt_out or cls.base_fmt
+        key: tuple[Any, ...] = (
+            FormatTranslator,
+            fmt_in,
+            _fmt_out,
+            cls.Config.generation,
+        )
+        cache: FormatCache = cls._format_cache
+        if (translator := cache.get(key)) is None:
+            translator = FormatTranslator.from_fmt(cls, fmt_in, _fmt_out)
+            cache.maxsize = cls.Config.cache_maxsize
+            cache.put(key, translator)
+        return translator  # type: ignore[no-any-return]
+
+    @classmethod
+    def translate(
+        cls,
+        value: String,
+        fmt_in: str,
+        fmt_out: str | None = None,
+    ) -> str:
+        """Return a string value of the output format that was translated from
+        a bytes or string value of the input format, like
+        ``cls.parse(value, fmt_in).format(fmt_out)``, with the cached format
+        translator. It skips the validation if the attributes that the
+        validate method checks do not exist in the output format.
+
+        :param value: A bytes or string value that match with the input
+            format.
+        :type value: String
+        :param fmt_in: An input format string value.
+        :type fmt_in: str
+        :param fmt_out: An output format string value will use `cls.base_fmt`
+            if it does not pass from input argument.
+        :type fmt_out: str | None(=None)
+
+        :raises FormatterValueError: If a value does not match with the input
+            format, or it does not valid.
+        :raises FormatterKeyError: If any format code of the output format
+            does not support for this formatter class.
+
+        :rtype: str
+        """
+        return cls.compile_translator(fmt_in, fmt_out).translate(value)
+
+    @classmethod
+    def translate_many(
+        cls,
+        values: Iterable[String],
+        fmt_in: str,
+        fmt_out: str | None = None,
+        *,
+        on_error: OnErrorType = "raise",
+        sink: Any | None = None,
+        sep: str = "\n",
+    ) -> Union[Iterator[Union[str, ParseFailure]], int]:
+        """Translate any bytes or string values of the input format to the
+        string values of the output format lazily with the cached format
+        translator. If a sink pass, the string values that end with a
+        separator will write to this text or binary sink instead.
+
+        :param values: An iterable of bytes or string values.
+        :type values: Iterable[String]
+        :param fmt_in: An input format string value.
+        :type fmt_in: str
+        :param fmt_out: An output format string value will use `cls.base_fmt`
+            if it does not pass from input argument.
+        :type fmt_out: str | None(=None)
+        :param on_error: An error policy that will raise an error with
+            ``raise``, ignore the failure value with ``skip``, or yield the
+            ``ParseFailure`` object with its reason with ``collect``.
+        :type on_error: OnErrorType(='raise')
+        :param sink: A text or binary sink object that has the ``write``
+            method, like an opened file. The string values will encode with
+            ``utf-8`` for a binary sink.
+        :type sink: Any | None(=None)
+        :param sep: A separator string that write after each string value to
+            a sink.
+        :type sep: str(='\\n')
+
+        :raises FormatterArgumentError: If an error policy does not support,
+            or it is ``collect`` with a sink.
+        :raises FormatterKeyError: If any format code of the output format
+            does not support for this formatter class.
+
+        :rtype: Iterator[str | ParseFailure] | int
+        :returns: A lazy iterator of string values, or a number of string
+            values that was written to a sink if it passes.
+        """
+        validate_on_error(on_error)
+        if sink is not None and on_error == "collect":
+            raise FormatterArgumentError(
+                "on_error",
+                "The error policy, 'collect', does not support with a sink.",
+            )
+        strings: Iterator[Union[str, ParseFailure]] = cls.compile_translator(
+            fmt_in, fmt_out
+        ).translate_many(values, on_error=on_error)
+        if sink is None:
+            return strings
+        return _write_strings(
+            strings, sink, sep=sep  # type: ignore[arg-type]
+        )
+
+    @classmethod
+    def _fused_renderer(
+        cls,
+        parts: tuple[str, ...],
+        codes: tuple[str, ...],
+    ) -> Callable[[Any], str] | None:
+        """Return a renderer that receives a prepared value and returns the
+        whole string of the literal parts and format codes at once, or return
+        None if this class can not fuse them. A sub-formatter class that has
+        a native formatting of its value should override this method.
+
+        :param parts: A tuple of literal string parts of a format template.
+        :type parts: tuple[str, ...]
+        :param codes: A tuple of format codes of a format template.
+        :type codes: tuple[str, ...]
+
+        :rtype: Callable[[Any], str] | None
+        """
+        return None
 
     def __init__(
         self,
@@ -669,13 +3900,17 @@ class Formatter(BaseFormatter):
         *,
         set_strict_mode: bool = False,
         set_std_value: bool = True,
+        validation: ValidationType = "eager",
+        frozen: bool = False,
     ) -> None:
         """Main initialization get the format mapping from input argument
         and generate the necessary attributes for define the value of this
-        base formatter object.
+        base formatter object. All attributes will be read-only after this
+        initialization if the frozen flag is True.
 
             The setter of attribute does not do anything to __slot__ variable.
         """
+        validate_validation(validation)
         _formats: dict[str, Any] = self.__validate_format(formats)
         # Set level of SlotLevel object that set from `base_level` and pass this
         # value to _level variable for update process in priorities loop.
@@ -686,57 +3921,104 @@ class Formatter(BaseFormatter):
             if attr != (self.__class__.__name__.lower()):
                 setattr(self, attr, None)
 
-        for name, values in self.priorities.items():
-            # Split name of key of priorities property value.
-            # From: <prefix>_<body> -> TO: [<prefix>, <body>]
-            attr = name.split("_", maxsplit=1)[0]
-
-            # Prepare values from priorities to PriorityData object.
-            props = PriorityData(**values)
-
+        plan: tuple[PriorityStep, ...] = (
+            self._priority_plan() or self._compile_priorities(self)
+        )
+        fields: frozenset[str] | None = self.validate_fields
+        checked: bool = fields is None
+        for step in plan:
             # Set attr condition
-            if getter := getattr(self, attr):
+            if getter := getattr(self, (attr := step.attr)):
                 if not set_strict_mode:
                     continue
-                elif (name in _formats) and getter != (
-                    p := props.value(
-                        _formats[name],  # type: ignore[call-arg]
-                    )
+                elif (step.name in _formats) and getter != (
+                    p := step.convert(self, _formats[step.name])
                 ):
                     raise FormatterValueError(
                         f"Parsing duplicate values do not equal, {getter} and "
                         f"{p}, in ``self.{attr}`` with strict mode."
                     )
 
-            elif any(name.endswith(i) for i in {"_default", "_fix"}):
+            elif step.default:
                 # Set default value
-                setattr(self, attr, caller(props.value))
+                setattr(self, attr, step.convert(self))
 
                 # Update level by default it will update at first level
-                self.level.update(props.level)
-            elif name in _formats:
-                setattr(
-                    self,
-                    attr,
-                    props.value(_formats[name]),  # type: ignore[call-arg]
-                )
+                self.level.update(step.level)
+            elif step.name in _formats:
+                setattr(self, attr, step.convert(self, _formats[step.name]))
 
                 # Update level by default it will update at first level
-                self.level.update(props.level)
-
-        # Run validate method before setting standard value.
-        if not self.validate():
+                self.level.update(step.level)
+                checked = checked or attr in fields  # type: ignore[operator]
+
+        # Run validate method before setting standard value. It will skip if
+        # any field that the validate method checks does not parse.
+        if not checked or validation == "off":
+            pass
+        elif validation == "lazy":
+            self._validate_pending = True
+        elif not self.validate():
             raise FormatterValueError(
                 "Parsing value does not valid from validator"
             )
 
         # Set standard property by default is string value or `self.string`
         self._setter_std_value(flag=set_std_value)
+        if frozen:
+            self.freeze()
+
+    def freeze(self) -> Self:
+        """Freeze this formatter instance that make all its attributes and its
+        slot level object be read-only, and keep its hash value, so it does
+        not rebuild the string value when it uses as a key of mapping or a
+        member of set.
+
+        :rtype: Self
+        :returns: This formatter instance itself.
+        """
+        if not self._frozen:
+            object.__setattr__(self, "_hash", self.__hash__())
+            object.__setattr__(self, "_frozen", True)
+            self.level.freeze()
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """Return True if this formatter instance was frozen.
+
+        :rtype: bool
+        """
+        return self._frozen
 
     def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(
+                f"cannot assign to field {name!r} of frozen "
+                f"{self.__class__.__name__!r} instance"
+            )
         super().__setattr__(name, value)
+        if self._memo is not None:
+            super().__setattr__("_memo", None)
+
+    def __delattr__(self, name: str) -> None:
+        if self._frozen:
+            raise AttributeError(
+                f"cannot delete field {name!r} of frozen "
+                f"{self.__class__.__name__!r} instance"
+            )
+        super().__delattr__(name)
+
+    def __setstate__(self, state: Any) -> None:
+        # The state from ``object.__getstate__`` will be a tuple of dict and
+        # slots mapping, it should bypass the setter for the frozen instance.
+        for mapping in state if isinstance(state, tuple) else (state,):
+            for name, value in (mapping or {}).items():
+                object.__setattr__(self, name, value)
 
     def __hash__(self) -> int:
+        if (_hash := self._hash) is not None:
+            return _hash
         return hash(self.string)
 
     def __str__(self) -> str:
@@ -750,10 +4032,68 @@ class Formatter(BaseFormatter):
         )
 
     def __eq__(self, other: Union[Formatter, Any]) -> bool:
-        return isinstance(other, self.__class__) and self.value == other.value
+        return (
+            isinstance(other, self.__class__)
+            and self.sort_key == other.sort_key
+        )
 
     def __lt__(self, other: Formatter) -> bool:
-        return self.value.__lt__(other.value)  # type: ignore[no-any-return]
+        return self.sort_key.__lt__(  # type: ignore[no-any-return]
+            other.sort_key
+        )
+
+    @property
+    def sort_key(self) -> Any:
+        """Return a comparison key of this formatter object that use for the
+        equality and ordering. It will be the value property by default, and
+        a subclass can override it with ``memo_property`` for keeping it in
+        the memo mapping of an instance.
+
+        :rtype: Any
+        """
+        return self.value
+
+    @classmethod
+    @config_cache
+    def _priority_plan(cls) -> tuple[PriorityStep, ...] | None:
+        """Return the priority plan that was compiled from the priorities value
+        of a blank instance once for each generation number of the config of
+        this formatter class, or return None if ``cls.shared_priorities`` was
+        set to False, so it will compile for each instance instead.
+
+        :rtype: tuple[PriorityStep, ...] | None
+        """
+        if not cls.shared_priorities:
+            return None
+        return cls._compile_priorities(cls.__new__(cls))
+
+    @classmethod
+    @config_cache
+    def _priority_levels(cls) -> dict[str, TupleInt] | None:
+        """Return a mapping of attribute and its levels that was derived from
+        the priority plan for setting the slot level of trusted fields in
+        bulk, or return None if the priority plan does not compile.
+
+        :rtype: dict[str, TupleInt] | None
+        """
+        if (plan := cls._priority_plan()) is None:
+            return None
+        return _plan_levels(plan)
+
+    @classmethod
+    def _compile_priorities(cls, instance: Self) -> tuple[PriorityStep, ...]:
+        """Return an ordered tuple of priority steps that was compiled from the
+        priorities value of an instance of this formatter class.
+
+        :param instance: An instance that generates the priorities value.
+        :type instance: Self
+
+        :rtype: tuple[PriorityStep, ...]
+        """
+        return tuple(
+            PriorityStep.from_priority(name, values, instance)
+            for name, values in instance.priorities.items()
+        )
 
     def _setter_std_value(self, flag: bool = True) -> None:
         """Setting standard value that have an argument name be the class name
@@ -762,12 +4102,10 @@ class Formatter(BaseFormatter):
         :param flag: A boolean flag that want to set standard value or not.
         :type flag: bool(=True)
         """
-        if flag:
-            setattr(
-                self,
-                self.__class__.__name__.lower(),
-                str(self.string),
-            )
+        # It does not set if the standard value was generated by property.
+        name: str = self.__class__.__name__.lower()
+        if flag and not isinstance(getattr(type(self), name, None), property):
+            setattr(self, name, str(self.string))
 
     @property
     @abstractmethod
@@ -832,7 +4170,7 @@ class Formatter(BaseFormatter):
         :returns: A boolean value from slot of ``self.level`` with an input
             level integer.
         """
-        if (sl := self.level.slot[(level - 1)]) and checker:
+        if (sl := self.level.checker(level)) and checker:
             raise FormatterValueError(
                 f"Parsing value does not valid with {error}."
             )
@@ -882,6 +4220,13 @@ class Formatter(BaseFormatter):
             "class"
         )
 
+    # The table of all format codes, and their renderers that receive a
+    # prepared value and return the string value of a format code, so the
+    # formatting does not generate the whole formatter value. It will be None
+    # if this class renders all format codes from the formatter value, and a
+    # subclass that overrides the formatter method should override it too.
+    code_renderers: ClassVar[dict[str, Callable[[Any], str]] | None] = None
+
     @staticmethod
     @abstractmethod
     def formatter(value: Any | None = None) -> ReturnFormattersType:
@@ -910,7 +4255,7 @@ class Formatter(BaseFormatter):
             ``self.values()``.
         """
         return dict2const(
-            self.values(),
+            self.values().to_dict(),
             name=f"{self.__class__.__name__}Const",
             base_fmt=self.base_fmt,
         )
@@ -976,7 +4321,7 @@ class Serial(Formatter, fmt="%n"):
         "serial",
     )
 
-    @property
+    @validate_property
     def value(self) -> int:
         """Return a serial value (positive int)."""
         return int(self.string)
@@ -1078,6 +4423,30 @@ class Serial(Formatter, fmt="%n"):
             },
         }
 
+    @classmethod
+    def prepare_fields(cls, fields: dict[str, Any]) -> dict[str, Any]:
+        """Return a mapping of attribute name and its value that was prepared
+        from the typed fields, the number field will be a string of integer.
+
+        :param fields: A mapping of attribute name and its typed value.
+        :type fields: dict[str, Any]
+
+        :rtype: dict[str, Any]
+        """
+        return {k: str(int(v)) for k, v in fields.items()}
+
+    @classmethod
+    def value_fields(cls, value: Any) -> dict[str, Any]:
+        """Return a mapping of the number field that was extracted from a
+        prepared integer value.
+
+        :param value: A value that want to prepare.
+        :type value: Any
+
+        :rtype: dict[str, Any]
+        """
+        return {"number": cls.prepare_value(value)}
+
     @staticmethod
     def prepare_value(value: int | str | float | None) -> int:
         """Prepare value before passing to convert logic in the formatter
@@ -1172,20 +4541,47 @@ WEEKS_FULL: DictStr = {
 
 
 class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
-    """Datetime formatter object that parse and format any datetime value."""
+    """Datetime formatter object that parse and format any datetime value.
 
-    __slots__ = (
-        "year",
-        "month",
-        "week",
-        "weeks",
-        "day",
-        "hour",
-        "minute",
-        "second",
-        "microsecond",
-        "locale",
-        "datetime",
+    .. memory::
+
+        All components keep as the bit fields of one packed integer slot,
+    ``_packed``, that is 79 bits or 36 bytes on CPython, and the component
+    strings and the standard value, ``self.datetime``, are generated on
+    demand. The budget of an instance, not include its memo mapping, is 260
+    bytes on CPython 3.11 that most of it is the slot level object and the
+    instance attributes of the base class (it was 700 bytes with the string
+    slots).
+    """
+
+    __slots__ = ("_packed",)
+
+    year = PackedField(14, width=4)
+    month = PackedField(7, width=2)
+    week = PackedField(4)
+    weeks = PackedField(4)
+    day = PackedField(7, width=2)
+    hour = PackedField(7, width=2)
+    minute = PackedField(7, width=2)
+    second = PackedField(7, width=2)
+    microsecond = PackedField(20, width=6)
+    locale = PackedField(2, choices=("AM", "PM"))
+
+    # The validate method checks the week and locale attributes with the
+    # value that create from the other attributes, and the creation of this
+    # value checks the range of the date and time attributes.
+    validate_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            "year",
+            "month",
+            "day",
+            "hour",
+            "minute",
+            "second",
+            "microsecond",
+            "week",
+            "locale",
+        }
     )
 
     def __repr__(self) -> str:
@@ -1195,12 +4591,13 @@ class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
             f"'{self.base_fmt}')>"
         )
 
-    @property
+    @validate_property
+    @memo_property
     def value(self) -> datetime:
         """Return a ``datetime.datetime`` instance value."""
         return datetime.fromisoformat(self.string)
 
-    @property
+    @memo_property
     def string(self) -> str:
         """Return a string datetime with ISO format."""
         return (
@@ -1211,14 +4608,13 @@ class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
 
     @property
     def iso_date(self) -> datetime:
-        """Return Datetime that parsing from string of date with ISO format.
+        """Return Datetime that create from the year, month, and day
+        attributes directly instead of parsing its string with ISO format.
 
         :rtype: datetime
-        :returns: A datetime that parsing from string of date with ISO format.
+        :returns: A datetime of the date attributes.
         """
-        return datetime.strptime(
-            f"{self.year}-{self.month}-{self.day}", "%Y-%m-%d"
-        )
+        return datetime(int(self.year), int(self.month), int(self.day))
 
     def validate(self) -> bool:
         """Validate method that validate all Datetime attributes in initialize
@@ -1352,7 +4748,7 @@ class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
                 "level": 2,
             },
             "week_default": {
-                "value": lambda: self.iso_date.strftime("%w"),
+                "value": self._default_week,
                 "level": 0,
             },
             "weeks_year_mon_pad": {
@@ -1612,6 +5008,136 @@ class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
             },
         }
 
+    # The native ``strftime`` directive of each format code, and the format
+    # codes that remove the zero padding of their directive after formatting.
+    _strftime_directives: ClassVar[dict[str, str]] = {
+        "%n": "%Y%m%d_%H%M%S",
+        "%Y": "%Y",
+        "%y": "%y",
+        "%-y": "%y",
+        "%m": "%m",
+        "%-m": "%m",
+        "%b": "%b",
+        "%B": "%B",
+        "%a": "%a",
+        "%A": "%A",
+        "%w": "%w",
+        "%u": "%u",
+        "%d": "%d",
+        "%-d": "%d",
+        "%H": "%H",
+        "%-H": "%H",
+        "%I": "%I",
+        "%-I": "%I",
+        "%M": "%M",
+        "%-M": "%M",
+        "%S": "%S",
+        "%-S": "%S",
+        "%j": "%j",
+        "%-j": "%j",
+        "%U": "%U",
+        "%W": "%W",
+        "%p": "%p",
+        "%f": "%f",
+    }
+    _strftime_unpads: ClassVar[frozenset[str]] = frozenset(
+        ("%-y", "%-m", "%-d", "%-H", "%-I", "%-M", "%-S", "%-j")
+    )
+
+    code_renderers: ClassVar[dict[str, Callable[[Any], str]] | None] = {
+        "%n": methodcaller("strftime", "%Y%m%d_%H%M%S"),
+        "%Y": methodcaller("strftime", "%Y"),
+        "%y": methodcaller("strftime", "%y"),
+        "%-y": partial(_strftime_unpad, "%y"),
+        "%m": methodcaller("strftime", "%m"),
+        "%-m": partial(_strftime_unpad, "%m"),
+        "%b": methodcaller("strftime", "%b"),
+        "%B": methodcaller("strftime", "%B"),
+        "%a": methodcaller("strftime", "%a"),
+        "%A": methodcaller("strftime", "%A"),
+        "%w": methodcaller("strftime", "%w"),
+        "%u": methodcaller("strftime", "%u"),
+        "%d": methodcaller("strftime", "%d"),
+        "%-d": partial(_strftime_unpad, "%d"),
+        "%H": methodcaller("strftime", "%H"),
+        "%-H": partial(_strftime_unpad, "%H"),
+        "%I": methodcaller("strftime", "%I"),
+        "%-I": partial(_strftime_unpad, "%I"),
+        "%M": methodcaller("strftime", "%M"),
+        "%-M": partial(_strftime_unpad, "%M"),
+        "%S": methodcaller("strftime", "%S"),
+        "%-S": partial(_strftime_unpad, "%S"),
+        "%j": methodcaller("strftime", "%j"),
+        "%-j": partial(_strftime_unpad, "%j"),
+        "%U": methodcaller("strftime", "%U"),
+        "%W": methodcaller("strftime", "%W"),
+        "%p": methodcaller("strftime", "%p"),
+        "%f": methodcaller("strftime", "%f"),
+    }
+
+    @classmethod
+    def value_fields(cls, value: Any) -> dict[str, Any]:
+        """Return a mapping of the date and time fields that was extracted
+        from a prepared datetime value.
+
+        :param value: A value that want to prepare.
+        :type value: Any
+
+        :rtype: dict[str, Any]
+        """
+        dt: datetime = cls.prepare_value(value)
+        return {
+            "year": dt.year,
+            "month": dt.month,
+            "day": dt.day,
+            "hour": dt.hour,
+            "minute": dt.minute,
+            "second": dt.second,
+            "microsecond": dt.microsecond,
+        }
+
+    @classmethod
+    def _fused_renderer(
+        cls,
+        parts: tuple[str, ...],
+        codes: tuple[str, ...],
+    ) -> Callable[[datetime], str] | None:
+        """Return a renderer that formats the whole string with one
+        ``strftime`` call if all format codes map to the ``strftime``
+        directives. The literal parts join to the native format string with
+        escaping if they are printable ASCII and no format code removes its
+        zero padding. Otherwise, the directives join with a separator, and
+        the ``strftime`` result splits back before the post-pass removes the
+        zero padding and joins with the literal parts.
+
+        :param parts: A tuple of literal string parts of a format template.
+        :type parts: tuple[str, ...]
+        :param codes: A tuple of format codes of a format template.
+        :type codes: tuple[str, ...]
+
+        :rtype: Callable[[datetime], str] | None
+        """
+        directives: dict[str, str] = cls._strftime_directives
+        if not all(code in directives for code in codes):
+            return None
+        natives: list[tuple[str, bool]] = [
+            (directives[code], code in cls._strftime_unpads) for code in codes
+        ]
+        if not any(unpad for _, unpad in natives) and all(
+            part.isascii() and part.isprintable() for part in parts
+        ):
+            native: str = parts[0].replace("%", "%%") + "".join(
+                directive + part.replace("%", "%%")
+                for (directive, _), part in zip(natives, parts[1:])
+            )
+            return partial(_call_unbound, datetime.strftime, (native,), {})
+        return partial(
+            _strftime_split,
+            STRFTIME_SEP.join(directive for directive, _ in natives),
+            tuple(i for i, (_, unpad) in enumerate(natives) if unpad),
+            parts,
+        )
+
     @staticmethod
     def prepare_value(value: str | datetime | date | None) -> datetime:
         """Prepare value before passing to convert logic in the formatter
@@ -1744,7 +5270,7 @@ class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
         :returns: A validated hour string value that map with ``self.locale``
             attribute value.
         """
-        if self.level.slot[0] and self.locale and self.locale == "PM":
+        if self.level.checker(1) and self.locale and self.locale == "PM":
             return str(int(value) + 12).rjust(2, "0")
         return value.rjust(2, "0")
 
@@ -1758,6 +5284,14 @@ class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
         """
         return "PM" if int(self.hour) >= 12 else "AM"
 
+    def _default_week(self) -> str:
+        """Return a default string week value that generate depend on
+        ``self.iso_date`` property value.
+
+        :rtype: str
+        """
+        return self.iso_date.strftime("%w")
+
     @staticmethod
     def remove_pad_dt(_dt: datetime, fmt: str) -> str:
         """Return a padded datetime string value that was formatted.
@@ -1822,6 +5356,14 @@ class Datetime(Formatter, level=10, fmt="%Y-%m-%d %H:%M:%S.%f"):
     def __rsub__(self, other: Any) -> Any:
         return NotImplemented
 
+    @property
+    def datetime(self) -> str:
+        """Return a standard string value of this datetime formatter object.
+        This property defines at the end of class because it shadows the
+        ``datetime`` class in the class namespace.
+        """
+        return self.string
+
 
 class Version(Formatter, level=4, fmt="%m_%n_%c"):
     """Version formatter object that parse and format any version
@@ -1890,12 +5432,18 @@ class Version(Formatter, level=4, fmt="%m_%n_%c"):
             _fmt = f"{_fmt}%l"
         return f"<{self.__class__.__name__}.parse('{self.string}', '{_fmt}')>"
 
-    @property
+    @validate_property
+    @memo_property
     def value(self) -> VerPackage:
         """Return a ``__version.VersionPackage`` instance value."""
         return VerPackage.parse(self.string)
 
-    @property
+    @memo_property
+    def sort_key(self) -> tuple[Any, ...]:
+        """Return a comparison key tuple of the version package value."""
+        return self.value.sort_key()
+
+    @memo_property
     def string(self) -> str:
         """Return a string version value with full format version."""
         _release: str = f"v{self.major}.{self.minor}.{self.micro}"
@@ -1968,11 +5516,11 @@ class Version(Formatter, level=4, fmt="%m_%n_%c"):
                 "level": 0,
             },
             "pre": {
-                "value": lambda x: self.__from_prefix(x),
+                "value": self.__from_prefix,
                 "level": 0,
             },
             "post": {
-                "value": lambda x: self.__from_prefix(x),
+                "value": self.__from_prefix,
                 "level": 0,
             },
             "post_num": {
@@ -2086,6 +5634,44 @@ class Version(Formatter, level=4, fmt="%m_%n_%c"):
             },
         }
 
+    @classmethod
+    def prepare_fields(cls, fields: dict[str, Any]) -> dict[str, Any]:
+        """Return a mapping of attribute name and its value that was prepared
+        from the typed fields, the release fields will be a string of integer
+        and the other fields will be a string.
+
+        :param fields: A mapping of attribute name and its typed value.
+        :type fields: dict[str, Any]
+
+        :rtype: dict[str, Any]
+        """
+        return {
+            k: (
+                str(int(v))
+                if k in ("epoch", "major", "minor", "micro")
+                else str(v)
+            )
+            for k, v in fields.items()
+        }
+
+    @classmethod
+    def value_fields(cls, value: Any) -> dict[str, Any]:
+        """Return a mapping of the epoch and release fields that was
+        extracted from a prepared version value.
+
+        :param value: A value that want to prepare.
+        :type value: Any
+
+        :rtype: dict[str, Any]
+        """
+        _version: VerPackage = cls.prepare_value(value)
+        return {
+            "epoch": _version.epoch,
+            "major": _version.major,
+            "minor": _version.minor,
+            "micro": _version.patch,
+        }
+
     @staticmethod
     def prepare_value(
         value: str | VerPackage | None,
@@ -2195,6 +5781,10 @@ class Version(Formatter, level=4, fmt="%m_%n_%c"):
         return NotImplemented
 
 
+# The pattern of a word that the strings attribute of Naming formatter keeps.
+LOWER_WORD: re.Pattern[str] = re.compile(r"[a-z0-9]+")
+
+
 class Naming(Formatter, level=5, fmt="%n"):
     """Naming formatter object that parse and format any name value.
 
@@ -2212,12 +5802,16 @@ class Naming(Formatter, level=5, fmt="%n"):
         "vowels",
     )
 
-    @property
+    # The validate method only checks any pair of the flats, shorts, and
+    # vowels attributes, so one of the shorts and vowels always in the pair.
+    validate_fields: ClassVar[frozenset[str]] = frozenset({"shorts", "vowels"})
+
+    @validate_property
     def value(self) -> list[str]:
         """Return a list of word of naming value."""
         return self.string.split()
 
-    @property
+    @memo_property
     def string(self) -> str:
         """Return a string naming with \\s sep if it is possible."""
         if self.strings:
@@ -2249,13 +5843,6 @@ class Naming(Formatter, level=5, fmt="%n"):
                     f"Flat and Shortname that were parsed are not equal, "
                     f"{self.flats[0]} and {''.join(self.shorts)}."
                 )
-            elif not self.level.checker(5):
-                self.__setattr__(
-                    "strings",
-                    self.__extract_from_word_with_short(
-                        self.flats[0], self.shorts
-                    ),
-                )
 
         # Validate flat and vowel
         if (
@@ -2298,6 +5885,21 @@ class Naming(Formatter, level=5, fmt="%n"):
             idx += word[idx:].index(s) + 1
         return False
 
+    def _default_strings(self) -> list[str]:
+        """Return a default list of word that was extracted from the flat and
+        shortname values if both of them were parsed, or an empty list.
+
+        :rtype: List[str]
+        """
+        if not self.level.checker((3, 2)):
+            return []
+        try:
+            return self.__extract_from_word_with_short(
+                self.flats[0], self.shorts
+            )
+        except ValueError:
+            return []
+
     @staticmethod
     def __extract_from_word_with_short(
         word: str,
@@ -2357,11 +5959,11 @@ class Naming(Formatter, level=5, fmt="%n"):
             },
             "strings_lower": {"value": lambda x: x.split(), "level": 5},
             "strings_camel": {
-                "value": lambda x: self.__split_pascal_case(x),
+                "value": self.__split_pascal_case,
                 "level": 5,
             },
             "strings_pascal": {
-                "value": lambda x: self.__split_pascal_case(x),
+                "value": self.__split_pascal_case,
                 "level": 5,
             },
             "strings_kebab": {
@@ -2388,16 +5990,12 @@ class Naming(Formatter, level=5, fmt="%n"):
                 "value": lambda x: x.lower().split("_"),
                 "level": 5,
             },
-            "strings_default": {
-                "value": default([]),
-                "level": 0,
-            },
             "flats": {
                 "value": self._from_flats,
                 "level": 3,
             },
             "flats_upper": {
-                "value": lambda x: self._from_flats(x.lower()),
+                "value": self._from_flats_upper,
                 "level": 3,
             },
             "flats_default": {
@@ -2409,7 +6007,7 @@ class Naming(Formatter, level=5, fmt="%n"):
                 "level": 2,
             },
             "shorts_upper": {
-                "value": lambda x: self._from_shorts(x.lower()),
+                "value": self._from_shorts_upper,
                 "level": 2,
             },
             "shorts_default": {
@@ -2421,7 +6019,7 @@ class Naming(Formatter, level=5, fmt="%n"):
                 "level": 1,
             },
             "vowels_upper": {
-                "value": lambda x: self._from_vowels(x.lower()),
+                "value": self._from_vowels_upper,
                 "level": 1,
             },
             "vowels_default": {
@@ -2430,6 +6028,10 @@ class Naming(Formatter, level=5, fmt="%n"):
                 ),
                 "level": 0,
             },
+            "strings_default": {
+                "value": self._default_strings,
+                "level": 0,
+            },
         }
 
     @classmethod
@@ -2615,6 +6217,22 @@ class Naming(Formatter, level=5, fmt="%n"):
             },
         }
 
+    @classmethod
+    def value_fields(cls, value: Any) -> dict[str, Any] | None:
+        """Return a mapping of the strings field that was extracted from a
+        prepared list of words, or return None if any word is not a lower
+        case word that the base format string value can parse.
+
+        :param value: A value that want to prepare.
+        :type value: Any
+
+        :rtype: dict[str, Any] | None
+        """
+        words: list[str] = cls.prepare_value(value)
+        if not all(LOWER_WORD.fullmatch(word) for word in words):
+            return None
+        return {"strings": words}
+
     @classmethod
     def prepare_value(cls, value: str | list[str] | None) -> list[str]:
         """Prepare value before passing to convert logic in the formatter
@@ -2705,6 +6323,39 @@ class Naming(Formatter, level=5, fmt="%n"):
             )
         return v
 
+    def _from_flats_upper(self, value: str) -> list[str]:
+        """Return a validated flats value from an upper case value.
+
+        :param value: A format string value that pass from initialize.
+        :type value: str
+
+        :rtype: List[str]
+        :returns: a validated flats value.
+        """
+        return self._from_flats(value.lower())
+
+    def _from_shorts_upper(self, value: str) -> list[str]:
+        """Return a validated shorts value from an upper case value.
+
+        :param value: A format string value that pass from initialize.
+        :type value: str
+
+        :rtype: List[str]
+        :returns: a validated shorts value.
+        """
+        return self._from_shorts(value.lower())
+
+    def _from_vowels_upper(self, value: str) -> list[str]:
+        """Return a validated vowels value from an upper case value.
+
+        :param value: A format string value that pass from initialize.
+        :type value: str
+
+        :rtype: List[str]
+        :returns: A validated vowels value.
+        """
+        return self._from_vowels(value.lower())
+
     def __default(
         self,
         logic: Callable[[list[str]], str],
@@ -2720,14 +6371,23 @@ class Naming(Formatter, level=5, fmt="%n"):
             it was set from initialization.
         """
 
-        def sub_caller() -> list[str]:
-            if not self.level.slot[4]:
-                return []
-            return (
-                [*rs] if isinstance((rs := logic(self.strings)), list) else [rs]
-            )
+        return partial(self.__from_default, logic)
+
+    def __from_default(
+        self,
+        logic: Callable[[list[str]], str],
+    ) -> list[str]:
+        """Return a default value that pass logic to ``self.strings`` if it
+        was set from initialization.
+
+        :param logic: A logic function receive a ``self.strings`` list.
+        :type logic: Callable[[List[str]], str]
 
-        return sub_caller
+        :rtype: List[str]
+        """
+        if not self.level.checker(5):
+            return []
+        return [*rs] if isinstance((rs := logic(self.strings)), list) else [rs]
 
     @staticmethod
     def pascal_case(snake_case: str) -> str:
@@ -2860,7 +6520,12 @@ class Storage(Formatter, fmt="%b"):
         "storage",
     )
 
-    @property
+    # The validate method checks the byte attribute with the bit attribute,
+    # and either of them can create the default of the other, so it validates
+    # if any of them was parsed.
+    validate_fields: ClassVar[frozenset[str]] = frozenset({"byte", "bit"})
+
+    @validate_property
     def value(self) -> Decimal:
         """Return a bit integer value."""
         return Decimal(self.string)
@@ -2910,39 +6575,39 @@ class Storage(Formatter, fmt="%b"):
                 "level": 1,
             },
             "byte": {
-                "value": lambda x: self.str2byte(x, "B"),
+                "value": partial(self.str2byte, order="B"),
                 "level": 1,
             },
             "byte_kilo": {
-                "value": lambda x: self.str2byte(x, "KB"),
+                "value": partial(self.str2byte, order="KB"),
                 "level": 1,
             },
             "byte_mega": {
-                "value": lambda x: self.str2byte(x, "MB"),
+                "value": partial(self.str2byte, order="MB"),
                 "level": 1,
             },
             "byte_giga": {
-                "value": lambda x: self.str2byte(x, "GB"),
+                "value": partial(self.str2byte, order="GB"),
                 "level": 1,
             },
             "byte_tera": {
-                "value": lambda x: self.str2byte(x, "TB"),
+                "value": partial(self.str2byte, order="TB"),
                 "level": 1,
             },
             "byte_peta": {
-                "value": lambda x: self.str2byte(x, "PB"),
+                "value": partial(self.str2byte, order="PB"),
                 "level": 1,
             },
             "byte_exa": {
-                "value": lambda x: self.str2byte(x, "EB"),
+                "value": partial(self.str2byte, order="EB"),
                 "level": 1,
             },
             "byte_zetta": {
-                "value": lambda x: self.str2byte(x, "ZB"),
+                "value": partial(self.str2byte, order="ZB"),
                 "level": 1,
             },
             "byte_yotta": {
-                "value": lambda x: self.str2byte(x, "YB"),
+                "value": partial(self.str2byte, order="YB"),
                 "level": 1,
             },
             "bit_default": {
@@ -3022,6 +6687,30 @@ class Storage(Formatter, fmt="%b"):
             },
         }
 
+    @classmethod
+    def prepare_fields(cls, fields: dict[str, Any]) -> dict[str, Any]:
+        """Return a mapping of attribute name and its value that was prepared
+        from the typed fields, the bit and byte fields will be a decimal.
+
+        :param fields: A mapping of attribute name and its typed value.
+        :type fields: dict[str, Any]
+
+        :rtype: dict[str, Any]
+        """
+        return {k: Decimal(str(v)) for k, v in fields.items()}
+
+    @classmethod
+    def value_fields(cls, value: Any) -> dict[str, Any]:
+        """Return a mapping of the bit field that was extracted from a
+        prepared decimal value.
+
+        :param value: A value that want to prepare.
+        :type value: Any
+
+        :rtype: dict[str, Any]
+        """
+        return {"bit": cls.prepare_value(value)}
+
     @classmethod
     def prepare_value(
         cls,
@@ -3264,11 +6953,13 @@ class Constant(Formatter, fmt="%%"):
         formats: dict[str, Any] | None = None,
         *,
         set_strict_mode: bool = False,
+        validation: ValidationType = "eager",
+        frozen: bool = False,
     ) -> None:
         """Main initialization get the format mapping from input argument
         and generate the necessary attributes for define the value of this
         base formatter object. This process will set the standard value after
-        set ``self._constant`` value.
+        set ``self._constant`` value, and freeze it if the frozen flag is True.
         """
         # Raise if formatter does not set
         if not self.formatter():
@@ -3280,6 +6971,7 @@ class Constant(Formatter, fmt="%%"):
             formats=formats,
             set_strict_mode=set_strict_mode,
             set_std_value=False,
+            validation=validation,
         )
 
         # Set ``_constant`` property that contain all arguments from
@@ -3290,8 +6982,10 @@ class Constant(Formatter, fmt="%%"):
 
         # Set standard property by default is string value or ``self.string``.
         self._setter_std_value(flag=True)
+        if frozen:
+            self.freeze()
 
-    @property
+    @validate_property
     def value(self) -> list[str]:
         """Return a list of string value that list from ``cls.__slots__``
         attributes.
@@ -3363,6 +7057,8 @@ class Constant(Formatter, fmt="%%"):
         return NotImplemented
 
     def __hash__(self) -> int:
+        if (_hash := self._hash) is not None:
+            return _hash
         return hash(tuple(self.value))
 
     @const_comparison
@@ -3524,7 +7220,7 @@ def make_const(
                 "arguments.",
             )
         name = f"{fmt.__name__}Const"
-        _fmt = fmt().values(value=value)
+        _fmt = fmt().values(value=value).to_dict()
         base_fmt = fmt.base_fmt
     elif isinstance(formatter, Formatter):
         return formatter.to_const()
@@ -3636,9 +7332,22 @@ class FormatterGroup:
         * parse: Self
             An instance of formatter group that parse from a bytes or string
             value by a format string.
+        * parse_many: Iterator[Self | ParseFailure]
+            A lazy iterator of formatter group instances that parse from any
+            bytes or string values by a format string with an error policy.
         * gen_format: Tuple[str, ReturnGroupGenFormatType]
             A tuple of group naming and format string value that change format
             string to regular expression string for complied to the `re` module.
+        * compile_pattern: Tuple[re.Pattern[str], ReturnGroupGenFormatType]
+            A tuple of compiled pattern and group naming getter that was kept
+            in the compiled format cache.
+        * compile_template: Tuple[Tuple[str, ...], Tuple[...]]
+            A tuple of literal parts and pairs of group naming and format
+            template that was kept in the compiled format cache.
+        * format_many: Iterator[str] | int
+            A lazy iterator of string values that format from any formatter
+            group instances or dicts of native values, or a number of string
+            values that was written to a sink.
         * from_formatter: Self
             An instance of formatter group that was pass formats value directly
             to its formatter object.
@@ -3673,9 +7382,22 @@ class FormatterGroup:
     # This value must reassign from child class
     base_groups: BaseGroupsType = {}
 
+    class Config(metaclass=ConfigMeta):
+        """A Configuration object that use for keep any config for this
+        formatter group object.
+        """
+
+        # The maximum size of the compiled format cache of each formatter
+        # group class.
+        cache_maxsize: ClassVar[int | None] = 128
+
+    # The compiled format cache that will create for each subclass.
+    _format_cache: ClassVar[FormatCache] = FormatCache()
+
     def __init_subclass__(cls: FormatterGroupType, **kwargs: Any) -> NoReturn:
         """Subclass Initialize method."""
         super().__init_subclass__(**kwargs)
+        cls._format_cache = FormatCache(maxsize=cls.Config.cache_maxsize)
 
         if not cls.base_groups:
             raise NotImplementedError(
@@ -3762,6 +7484,318 @@ class FormatterGroup:
             string value by a format string.
         """
         parser_rs: ReturnParseType = cls.__parse(bytes2str(value), fmt)
+        return cls.__from_parse(parser_rs)
+
+    @classmethod
+    def parse_many(
+        cls,
+        values: Iterable[String],
+        fmt: str,
+        *,
+        on_error: OnErrorType = "raise",
+    ) -> Iterator[Union[Self, ParseFailure]]:
+        """Parse any bytes or string values with its format to this formatter
+        group objects lazily. The format string will compile only once before
+        parsing.
+
+        :param values: An iterable of bytes or string values.
+        :type values: Iterable[String]
+        :param fmt: a format string value that must have the formatter group
+            pattern like `{group-name:fmt-str}`.
+        :type fmt: str
+        :param on_error: An error policy that will raise an error with
+            ``raise``, ignore the failure value with ``skip``, or yield the
+            ``ParseFailure`` object with its reason with ``collect``.
+        :type on_error: OnErrorType(='raise')
+
+        :rtype: Iterator[Self | ParseFailure]
+        """
+        validate_on_error(on_error)
+        return cls.__parse_many(values, fmt, on_error=on_error)
+
+    @classmethod
+    def __parse_many(
+        cls,
+        values: Iterable[String],
+        fmt: str,
+        *,
+        on_error: OnErrorType = "raise",
+    ) -> Iterator[Union[Self, ParseFailure]]:
+        """Private generator of the ``parse_many`` class-method."""
+        pattern, _fmt_getter = cls.compile_pattern(fmt)
+        for value in values:
+            _value: str = bytes2str(value)
+            if (_search := _match_whole(pattern, _value)) is None:
+                if on_error == "raise":
+                    raise FormatterGroupArgumentError(
+                        "format",
+                        (
+                            f"{_value!r} does not match with the format: "
+                            f"'^{pattern.pattern}$'"
+                        ),
+                    )
+                elif on_error == "collect":
+                    yield ParseFailure(
+                        _value,
+                        (
+                            f"value does not match with format "
+                            f"'^{pattern.pattern}$'"
+                        ),
+                    )
+                continue
+            try:
+                yield cls.__from_parse(cls.__parse_match(_search, _fmt_getter))
+            except (FormatterValueError, ValueError) as err:
+                if on_error == "raise":
+                    raise
+                elif on_error == "collect":
+                    yield ParseFailure(_value, str(err))
+
+    @classmethod
+    def finditer(
+        cls,
+        text: String,
+        fmt: str,
+    ) -> Iterator[tuple[tuple[int, int], Self]]:
+        """Scan a bytes or string text value with its format and yield the
+        span and formatter group object of any matching lazily. The empty
+        matching or the matching that can not construct a formatter group
+        will be skipped.
+
+        :param text: A bytes or string text value that want to scan.
+        :type text: String
+        :param fmt: a format string value that must have the formatter group
+            pattern like `{group-name:fmt-str}`.
+        :type fmt: str
+
+        :rtype: Iterator[tuple[tuple[int, int], Self]]
+        """
+        pattern, _fmt_getter = cls.compile_pattern(fmt)
+        for _search in pattern.finditer(bytes2str(text)):
+            if _search.start() == _search.end():
+                continue
+            try:
+                yield _search.span(), cls.__from_parse(
+                    cls.__parse_match(_search, _fmt_getter)
+                )
+            except (FormatterValueError, ValueError):
+                continue
+
+    @classmethod
+    def search(
+        cls,
+        text: String,
+        fmt: str,
+    ) -> tuple[tuple[int, int], Self] | None:
+        """Return the span and formatter group object of the first matching
+        of its format in a bytes or string text value, or return None.
+
+        :param text: A bytes or string text value that want to scan.
+        :type text: String
+        :param fmt: a format string value that must have the formatter group
+            pattern like `{group-name:fmt-str}`.
+        :type fmt: str
+
+        :rtype: tuple[tuple[int, int], Self] | None
+        """
+        return next(cls.finditer(text, fmt), None)
+
+    @classmethod
+    def infer_format(
+        cls,
+        samples: Iterable[String],
+        *,
+        limit: int = 5,
+    ) -> list[FormatCandidate]:
+        """Return candidate format string values of this formatter group that
+        was inferred from any sample values and ranked by coverage. The sample
+        values will split to the alphanumeric runs by their separators, and
+        the candidates will search from the sample values of each separator
+        layout, where a constant run will be the literal, and a span of runs
+        will be a group if its formatter can infer the format of the values
+        of this span.
+
+            The candidates that have the same coverage will rank by the order
+        of its layout, and then by the order of the search of each layout.
+
+        :param samples: An iterable of bytes or string sample values.
+        :type samples: Iterable[String]
+        :param limit: A limit number of return candidates.
+        :type limit: int(=5)
+
+        :rtype: list[FormatCandidate]
+        """
+        counter: dict[str, int] = _count_samples(samples)
+        layouts: dict[tuple[str, ...], list[list[str]]] = defaultdict(list)
+        for value in counter:
+            parts: list[str] = re.split(r"([^0-9A-Za-z]+)", value)
+            layouts[tuple(parts[1::2])].append(parts)
+
+        candidates: dict[str, tuple[int, ...]] = {}
+        for index, layout in enumerate(
+            sorted(layouts.values(), key=len, reverse=True)[:INFER_SHAPES]
+        ):
+            for order, fmt in enumerate(cls.__infer_layout(layout, limit)):
+                candidates.setdefault(fmt, (index, order))
+        compiled: dict[str, tuple[re.Pattern[str], Any] | None] = {}
+        return _rank_candidates(
+            candidates,
+            counter,
+            limit,
+            partial(cls.__infer_count, compiled=compiled),
+        )
+
+    @classmethod
+    def __infer_layout(cls, layout: list[list[str]], limit: int) -> list[str]:
+        """Return the limit number of candidate format string values from the
+        split parts of sample values that have the same separators. It walks
+        the runs from left to right, where a constant run will be the literal
+        first, and then the groups with the order of ``cls.base_groups`` will
+        take the shorter span of runs first. The format of each span and group
+        will infer once, and a column with the same used groups that can not
+        complete will not walk again.
+
+        :param layout: A list of the split parts of sample values that have
+            the same separators.
+        :type layout: list[list[str]]
+        :param limit: A limit number of return candidates.
+        :type limit: int
+
+        :rtype: list[str]
+        """
+        seps: list[str] = layout[0][1::2]
+        size: int = len(seps) + 1
+        spans: dict[tuple[int, int], list[str]] = {}
+        formats: dict[tuple[int, int, str], str | None] = {}
+
+        def span_values(start: int, end: int) -> list[str]:
+            """Return the distinct values of a span of runs."""
+            if (start, end) not in spans:
+                spans[(start, end)] = sorted(
+                    {
+                        "".join(parts[start * 2 : end * 2 - 1])
+                        for parts in layout
+                    }
+                )
+            return spans[(start, end)]
+
+        def span_format(start: int, end: int, group: str) -> str | None:
+            """Return the best format of a group that can parse all the spread
+            values of a span of runs, or return None if the formatter of this
+            group can not infer it.
+            """
+            if (start, end, group) not in formats:
+                best: list[FormatCandidate] = cls.base_groups[
+                    group
+                ].infer_format(
+                    _sample_spread(span_values(start, end), INFER_SAMPLES),
+                    limit=1,
+                )
+                formats[(start, end, group)] = (
+                    best[0].fmt if best and best[0].coverage == 1 else None
+                )
+            return formats[(start, end, group)]
+
+        rs: list[str] = []
+        dead: set[tuple[int, frozenset[str]]] = set()
+
+        def walk(
+            col: int,
+            tokens: tuple[str, ...],
+            used: frozenset[str],
+        ) -> bool:
+            """Append the candidates that start with the tokens, and continue
+            from a column of the split parts without the used group names.
+            Return True if any candidate was appended.
+            """
+            if len(rs) >= limit:
+                return True
+            elif col == size:
+                if used:
+                    rs.append("".join(tokens))
+                return bool(used)
+            elif (col, used) in dead:
+                return False
+            found: bool = False
+
+            # NOTE: A constant run will be the literal, except a digit-only
+            #   run, because this run is more likely a constant value of the
+            #   sample data.
+            values: list[str] = span_values(col, col + 1)
+            if (
+                len(values) == 1
+                and not values[0].isdigit()
+                and not any(c in "{}" for c in values[0])
+            ):
+                found |= walk(
+                    col + 1,
+                    (*tokens, values[0], seps[col] if col + 1 < size else ""),
+                    used,
+                )
+            for group in cls.base_groups:
+                if group in used:
+                    continue
+                for end in range(col + 1, size + 1):
+                    if (fmt := span_format(col, end, group)) is None:
+                        continue
+                    found |= walk(
+                        end,
+                        (
+                            *tokens,
+                            f"{{{group}:{fmt}}}",
+                            seps[end - 1] if end < size else "",
+                        ),
+                        used | {group},
+                    )
+            if not found:
+                dead.add((col, used))
+            return found
+
+        walk(0, (), frozenset())
+        return rs
+
+    @classmethod
+    def __infer_count(
+        cls,
+        fmt: str,
+        counter: dict[str, int],
+        compiled: dict[str, tuple[re.Pattern[str], Any] | None],
+    ) -> int:
+        """Return the number of sample values that can parse with a candidate
+        format. The compiled pattern of candidate will keep in the compiled
+        mapping instead of the compiled format cache of this class.
+        """
+        if fmt not in compiled:
+            try:
+                _fmt, _fmt_getter = cls.gen_format(fmt)
+                compiled[fmt] = (re.compile(_fmt), _fmt_getter)
+            except re.error:
+                compiled[fmt] = None
+        if (_compiled := compiled[fmt]) is None:
+            return 0
+        pattern, _fmt_getter = _compiled
+        matched: int = 0
+        for value, count in counter.items():
+            if (_search := _match_whole(pattern, value)) is None:
+                continue
+            try:
+                cls.__from_parse(cls.__parse_match(_search, _fmt_getter))
+            except (FormatterValueError, ValueError):
+                continue
+            matched += count
+        return matched
+
+    @classmethod
+    def __from_parse(cls, parser_rs: ReturnParseType) -> Self:
+        """Return an instance of formatter group from the mapping of parsing
+        result.
+
+        :param parser_rs: A mapping of fmt, value, and props keys that passing
+            from searching step with `re` module.
+        :type parser_rs: ReturnParseType
+
+        :rtype: Self
+        """
         rs: dict[str, DictStr] = defaultdict(dict)
         for g in parser_rs:
             rs[g.split("__")[0]] |= parser_rs[g]["props"]
@@ -3789,13 +7823,32 @@ class FormatterGroup:
         :returns: A mapping of fmt, value, and props keys that passing
             from searching step with `re` module.
         """
-        _fmt, _fmt_getter = cls.gen_format(fmt=fmt)
-        if not (_search := re.search(rf"^{_fmt}$", value)):
+        pattern, _fmt_getter = cls.compile_pattern(fmt)
+        if not (_search := _match_whole(pattern, value)):
             raise FormatterGroupArgumentError(
                 "format",
-                f"{value!r} does not match with the format: '^{_fmt}$'",
+                (
+                    f"{value!r} does not match with the format: "
+                    f"'^{pattern.pattern}$'"
+                ),
             )
+        return cls.__parse_match(_search, _fmt_getter)
+
+    @staticmethod
+    def __parse_match(
+        _search: re.Match[str],
+        _fmt_getter: ReturnGroupGenFormatType,
+    ) -> ReturnParseType:
+        """Return a mapping of necessary value for main parsing method from
+        the matching object of the compiled format pattern.
 
+        :param _search: A matching object of the compiled format pattern.
+        :type _search: re.Match[str]
+        :param _fmt_getter: A group naming getter of the compiled format.
+        :type _fmt_getter: ReturnGroupGenFormatType
+
+        :rtype: ReturnParseType
+        """
         _search_dict: DictStr = _search.groupdict()
         rs: ReturnParseType = {}
         for name in iter(_fmt_getter.copy()):
@@ -3812,6 +7865,49 @@ class FormatterGroup:
             }
         return rs
 
+    @classmethod
+    def compile_pattern(
+        cls,
+        fmt: str,
+    ) -> tuple[re.Pattern[str], ReturnGroupGenFormatType]:
+        """Return a compiled regular expression pattern of a format string
+        value with its group naming getter. This value will keep in the
+        compiled format cache of this formatter group class that was bounded
+        by ``cls.Config.cache_maxsize``.
+
+        :param fmt: a format string value that must have the formatter group
+            pattern like `{group-name:fmt-str}`.
+        :type fmt: str
+
+        :rtype: Tuple[re.Pattern[str], ReturnGroupGenFormatType]
+        """
+        key: tuple[Any, ...] = (
+            cls,
+            fmt,
+            cls.Config.generation,
+            *(f.Config.generation for f in cls.base_groups.values()),
+        )
+        cache: FormatCache = cls._format_cache
+        if (rs := cache.get(key)) is None:
+            cache.maxsize = cls.Config.cache_maxsize
+            _fmt, _fmt_getter = cls.gen_format(fmt=fmt)
+            rs = cache.put(key, (re.compile(_fmt), _fmt_getter))
+        return rs  # type: ignore[no-any-return]
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Return a statistic information of the compiled format cache of this
+        formatter group class.
+
+        :rtype: CacheInfo
+        """
+        return cls._format_cache.info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Clear the compiled format cache of this formatter group class."""
+        cls._format_cache.clear()
+
     @classmethod
     def gen_format(cls, fmt: str) -> tuple[str, ReturnGroupGenFormatType]:
         """Generate format string value that combine from any matching of
@@ -3855,22 +7951,38 @@ class FormatterGroup:
                 fmt_getter[group_index] = {"fmt": fmt_str}
         return fmt, fmt_getter
 
-    def format(self, fmt: str) -> str:
-        """Return a string value that was formatted and filled by an input
-        format string pattern.
+    @classmethod
+    def compile_template(
+        cls,
+        fmt: str,
+    ) -> tuple[tuple[str, ...], tuple[tuple[str, FormatTemplate], ...]]:
+        """Return a tuple of the literal parts of a format string value and the
+        pairs of group naming and format template of its group. This value
+        will keep in the compiled format cache of this formatter group class.
 
         :param fmt: A format string value for mapping with formatter group.
         :type fmt: str
 
         :raises FormatterGroupValueError: If group naming on format string
-            pattern does not exist in ``self.base_groups``.
+            pattern does not exist in ``cls.base_groups``.
         :raises FormatterGroupArgumentError: If any group of formatter raise
-            FormatterKeyError from ``format`` method.
+            FormatterKeyError from ``compile_template`` method.
 
-        :rtype: str
-        :returns: A string value that was filled and formatted by an input
-            format pattern.
+        :rtype: tuple[tuple[str, ...], tuple[tuple[str, FormatTemplate], ...]]
         """
+        key: tuple[Any, ...] = (
+            FormatTemplate,
+            fmt,
+            cls.Config.generation,
+            *(f.Config.generation for f in cls.base_groups.values()),
+        )
+        cache: FormatCache = cls._format_cache
+        if (rs := cache.get(key)) is not None:
+            return rs  # type: ignore[no-any-return]
+
+        parts: list[str] = []
+        templates: list[tuple[str, FormatTemplate]] = []
+        start: int = 0
         for fmt_match in re.finditer(
             r"(?P<found>{(?P<group>\w+):?(?P<format>[^{}]+)?})", fmt
         ):
@@ -3881,26 +7993,128 @@ class FormatterGroup:
             #   'format': '%Y_%m_%d'
             # }
             fmt_dict: DictStr = fmt_match.groupdict()
-            if (group := fmt_dict["group"]) not in self.base_groups:
+            if (group := fmt_dict["group"]) not in cls.base_groups:
                 raise FormatterGroupValueError(
                     f"This group, {group!r}, does not set on `cls.base_groups`."
                 )
-            formatter: Formatter = self.groups[group]
+            formatter: FormatterType = cls.base_groups[group]
             fmt_str: str
             if not (fmt_str := fmt_dict["format"]):
                 fmt_str = formatter.base_fmt
 
             try:
-                fmt = fmt.replace(
-                    fmt_dict["found"],
-                    formatter.format(fmt=fmt_str),
-                    1,
-                )
+                templates.append((group, formatter.compile_template(fmt_str)))
             except FormatterKeyError as err:
                 raise FormatterGroupArgumentError(
                     "format", f"{err} in {fmt_dict['found']}"
                 ) from err
-        return fmt
+            parts.append(fmt[start : fmt_match.start()])
+            start = fmt_match.end()
+        parts.append(fmt[start:])
+        cache.maxsize = cls.Config.cache_maxsize
+        return cache.put(  # type: ignore[no-any-return]
+            key, (tuple(parts), tuple(templates))
+        )
+
+    @classmethod
+    def format_many(
+        cls,
+        values: Iterable[Union[Self, dict[str, Any]]],
+        fmt: str,
+        *,
+        sink: Any | None = None,
+        sep: str = "\n",
+    ) -> Union[Iterator[str], int]:
+        """Format any formatter group instances, or dicts of group naming and
+        native value of its group, with its format lazily. The format string
+        will compile only once before formatting, and the native value of a
+        group will pass to the formatter methods directly. A group that does
+        not exist in a dict will use the value of ``cls.from_value``. If a
+        sink pass, the string values that end with a separator will write to
+        this text or binary sink instead.
+
+        :param values: An iterable of formatter group instances or dicts of
+            group naming and native value of its group.
+        :type values: Iterable[Self | dict[str, Any]]
+        :param fmt: A format string value for mapping with formatter group.
+        :type fmt: str
+        :param sink: A text or binary sink object that has the ``write``
+            method, like an opened file. The string values will encode with
+            ``utf-8`` for a binary sink.
+        :type sink: Any | None(=None)
+        :param sep: A separator string that write after each string value to
+            a sink.
+        :type sep: str(='\\n')
+
+        :raises FormatterGroupValueError: If group naming on format string
+            pattern does not exist in ``cls.base_groups``.
+        :raises FormatterGroupArgumentError: If any group of formatter raise
+            FormatterKeyError from ``compile_template`` method.
+
+        :rtype: Iterator[str] | int
+        :returns: A lazy iterator of string values, or a number of string
+            values that was written to a sink if it passes.
+        """
+        strings: Iterator[str] = cls.__format_many(
+            values, cls.compile_template(fmt)
+        )
+        if sink is None:
+            return strings
+        return _write_strings(strings, sink, sep=sep)
+
+    @classmethod
+    def __format_many(
+        cls,
+        values: Iterable[Union[Self, dict[str, Any]]],
+        template: tuple[
+            tuple[str, ...], tuple[tuple[str, FormatTemplate], ...]
+        ],
+    ) -> Iterator[str]:
+        """Private generator of the ``format_many`` class-method."""
+        parts, templates = template
+        groups: frozenset[str] = frozenset(group for group, _ in templates)
+        pairs = tuple(
+            (group, cls.base_groups[group], _template, part)
+            for (group, _template), part in zip(templates, parts[1:])
+        )
+        for value in values:
+            if not isinstance(value, cls) and not value.keys() >= groups:
+                value = cls.from_value(value)
+            results: list[str] = [parts[0]]
+            if isinstance(value, cls):
+                for group, _, _template, part in pairs:
+                    results.append(_template.render(value.groups[group]))
+                    results.append(part)
+            else:
+                for group, formatter, _template, part in pairs:
+                    results.append(
+                        _template.render_value(formatter, value[group])
+                    )
+                    results.append(part)
+            yield "".join(results)
+
+    def format(self, fmt: str) -> str:
+        """Return a string value that was formatted and filled by an input
+        format string pattern.
+
+        :param fmt: A format string value for mapping with formatter group.
+        :type fmt: str
+
+        :raises FormatterGroupValueError: If group naming on format string
+            pattern does not exist in ``self.base_groups``.
+        :raises FormatterGroupArgumentError: If any group of formatter raise
+            FormatterKeyError from ``format`` method.
+
+        :rtype: str
+        :returns: A string value that was filled and formatted by an input
+            format pattern.
+        """
+        parts, templates = self.compile_template(fmt)
+        results: list[str] = [parts[0]]
+        for (group, template), part in zip(templates, parts[1:]):
+            results.append(template.render(self.groups[group]))
+            results.append(part)
+        return "".join(results)
 
     def __init__(
         self,
@@ -3913,9 +8127,16 @@ class FormatterGroup:
         ``self.groups`` attributes for define the value of this formatter group
         instance.
         """
-        # Make default formatter instance from `cls.base_groups` mapping.
+        # Make default formatter instance from `cls.base_groups` mapping. It
+        # does not make the default instance of the group that was passed with
+        # the ignore construct flag.
         self.groups: GroupsType = {
-            group: fmt() for group, fmt in self.base_groups.items()
+            group: (
+                formats[group]
+                if ignore_construct and group in formats
+                else fmt()
+            )
+            for group, fmt in self.base_groups.items()
         }
         if not ignore_construct:
             for k, v in formats.items():
@@ -4015,7 +8236,7 @@ class FormatterGroup:
             k: (fmt + values[k]) if k in values else fmt
             for k, fmt in self.groups.items()
         }
-        return self.__class__(formats=_groups)
+        return self.__class__(formats=_groups, ignore_construct=True)
 
     def to_const(
         self,
@@ -4106,6 +8327,24 @@ __all__ = (
     "Version",
     "Naming",
     "SlotLevel",
+    "SlotView",
+    "PackedField",
+    "ConfigMeta",
+    "CacheInfo",
+    "FormatCache",
+    "CompiledFormat",
+    "CompiledAnyFormat",
+    "ParseFailure",
+    "FormatCandidate",
+    "FormatToken",
+    "RegexTemplate",
+    "FormatTemplate",
+    "FormatTranslator",
+    "FormatterValues",
+    "SliceParser",
+    "tokenize_fmt",
+    "memo_property",
+    "validate_property",
     "Storage",
     "ConstantType",
     "Constant",
@@ -26,6 +26,45 @@ class SlotLevelTestCase(unittest.TestCase):
         self.assertEqual(3, self.sl.count)
         self.assertEqual(9, self.sl.value)
 
+    def test_slot_level_bitmask(self):
+        self.assertEqual(0b1110, self.sl.mask)
+        self.assertListEqual([False, True, True, True, False], self.sl.slot)
+        self.sl.update((3, 5)).update([0, 1])
+        self.assertEqual(0b11111, self.sl.mask)
+        self.assertEqual(5, self.sl.count)
+        self.assertEqual(15, self.sl.value)
+        self.assertTrue(self.sl.checker((1, 5)))
+        self.assertFalse(fmt.SlotLevel(level=5).update(2).checker((2, 3)))
+        self.assertFalse(self.sl.checker(6))
+        self.assertTrue(self.sl.checker(0))
+
+    def test_slot_level_slot_write_through(self):
+        slot = self.sl.slot
+        slot[0] = True
+        slot[3] = False
+        self.assertListEqual([True, True, True, False, False], slot)
+        self.assertListEqual([True, True, True, False, False], self.sl.slot)
+        self.assertEqual(0b111, self.sl.mask)
+        self.assertEqual(3, self.sl.count)
+        self.assertEqual(6, self.sl.value)
+        self.assertTrue(self.sl.checker((1, 2, 3)))
+        self.assertEqual(hash(tuple(self.sl.slot)), self.sl.__hash__())
+
+        self.sl.slot = [False] * 4 + [True]
+        self.assertEqual(5, self.sl.value)
+        with self.assertRaises(fmt.FormatterValueError):
+            self.sl.slot = [True]
+        with self.assertRaises(fmt.FormatterValueError):
+            self.sl.slot[1:3] = [True]
+        with self.assertRaises(fmt.FormatterValueError):
+            self.sl.slot.append(True)
+        self.assertEqual(0b10000, self.sl.mask)
+
+    def test_slot_level_order(self):
+        levels = [fmt.SlotLevel(level=3).update(n) for n in (3, (1, 2), 1)]
+        self.assertListEqual([1, 3, 3], [sl.value for sl in sorted(levels)])
+        self.assertEqual(levels[0], levels[1])
+
     def test_slot_level_update_failed(self):
         with self.assertRaises(fmt.FormatterValueError) as context:
             fmt.SlotLevel(level=5).update(numbers=(6,), strict=True)
@@ -44,6 +83,221 @@ class SlotLevelTestCase(unittest.TestCase):
         )
 
 
+class FormatCacheTestCase(unittest.TestCase):
+    def test_format_cache_eviction(self):
+        cache = fmt.FormatCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(
+            fmt.CacheInfo(
+                hits=1, misses=1, evictions=1, maxsize=2, currsize=2
+            ),
+            cache.info(),
+        )
+        self.assertEqual(0.5, cache.info().ratio)
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0.0, cache.info().ratio)
+
+    def test_format_cache_disable(self):
+        cache = fmt.FormatCache(maxsize=0)
+        self.assertEqual(1, cache.put("a", 1))
+        self.assertEqual(0, len(cache))
+
+    def test_formatter_parse_with_cache(self):
+        fmt.Serial.cache_clear()
+        for _ in range(3):
+            fmt.Serial.parse("009", "%p")
+        info = fmt.Serial.cache_info()
+        self.assertEqual(2, info.hits)
+        self.assertEqual(1, info.misses)
+        self.assertEqual(1, info.currsize)
+        self.assertEqual(
+            "(?P<number_pad>[0-9]{3})",
+            fmt.Serial.compile_pattern("%p").pattern,
+        )
+        self.assertIs(
+            fmt.Serial.compile_pattern("%p"),
+            fmt.Serial.compile_pattern("%p"),
+        )
+
+    def test_formatter_cache_maxsize_config(self):
+        class SerialCache(fmt.Serial):
+            class Config(fmt.Serial.Config):
+                cache_maxsize = 1
+
+        SerialCache.parse("009", "%p")
+        SerialCache.parse("9", "%n")
+        info = SerialCache.cache_info()
+        self.assertEqual(1, info.currsize)
+        self.assertEqual(1, info.evictions)
+        self.assertEqual(0, fmt.Serial.cache_info().evictions)
+
+    def test_formatter_intern_cache(self):
+        class SerialIntern(fmt.Serial):
+            class Config(fmt.Serial.Config):
+                intern_maxsize = 2
+
+        sr = SerialIntern.parse("009", "%p")
+        self.assertTrue(sr.frozen)
+        self.assertIs(sr, SerialIntern.parse("009", "%p"))
+        self.assertIs(sr, SerialIntern.compile("%p").fullmatch(b"009"))
+        self.assertIsNot(sr, SerialIntern.parse("009", "%p", strict=True))
+        self.assertListEqual(
+            [sr, sr],
+            list(
+                SerialIntern.parse_many(
+                    ["009", "x", "009"], "%p", on_error="skip"
+                )
+            ),
+        )
+        info = SerialIntern.intern_info()
+        self.assertEqual((4, 3), (info.hits, info.misses))
+        self.assertEqual(2, info.currsize)
+        self.assertFalse(fmt.Serial.parse("009", "%p").frozen)
+        self.assertEqual(0, fmt.Serial.intern_info().currsize)
+
+        SerialIntern.intern_clear()
+        self.assertEqual(0.0, SerialIntern.intern_info().ratio)
+
+    def test_formatter_config_generation(self):
+        class SerialConfig(fmt.Serial):
+            class Config(fmt.Serial.Config):
+                serial_max_padding = 3
+
+        generation: int = SerialConfig.Config.generation
+        self.assertEqual(9, SerialConfig.parse("009", "%p").value)
+        self.assertEqual(
+            "(?P<number_pad>[0-9]{3})", SerialConfig.regex()["%p"]
+        )
+
+        SerialConfig.Config.serial_max_padding = 5
+        self.assertEqual(generation + 1, SerialConfig.Config.generation)
+        self.assertEqual(
+            "(?P<number_pad>[0-9]{5})", SerialConfig.regex()["%p"]
+        )
+        self.assertEqual(9, SerialConfig.parse("00009", "%p").value)
+        with self.assertRaises(fmt.FormatterValueError):
+            SerialConfig.parse("009", "%p")
+        self.assertEqual(
+            "(?P<number_pad>[0-9]{3})", fmt.Serial.regex()["%p"]
+        )
+
+
+class TokenizeFormatTestCase(unittest.TestCase):
+    def test_tokenize_fmt(self):
+        self.assertTupleEqual(
+            (
+                fmt.FormatToken("literal", "file_"),
+                fmt.FormatToken("code", "%Y"),
+                fmt.FormatToken("code", "%-m"),
+                fmt.FormatToken("literal", "_"),
+                fmt.FormatToken("escape", "%%"),
+                fmt.FormatToken("literal", "n 100% done"),
+            ),
+            fmt.tokenize_fmt("file_%Y%-m_%%n 100% done"),
+        )
+        self.assertTupleEqual((), fmt.tokenize_fmt(""))
+
+    def test_format_with_tokens(self):
+        sr = fmt.Serial.parse("12", "%n")
+        self.assertEqual("12_%n_012_%", sr.format("%n_%%n_%p_%%"))
+        self.assertEqual(
+            "(?P<number>[0-9]*)_%n_(?P<number__1>[0-9]*)",
+            fmt.Serial.gen_format("%n_%%n_%n"),
+        )
+
+
+class RegexTemplateTestCase(unittest.TestCase):
+    def test_regex_template_render(self):
+        template = fmt.RegexTemplate.from_regex(
+            r"(?P<year>\d{4})-(?P<month>\d{2})"
+        )
+        self.assertTupleEqual(("year", "month"), template.names)
+        self.assertTupleEqual(("", r"\d{4})-", r"\d{2})"), template.parts)
+
+        counter: dict[str, int] = {"year": 1}
+        self.assertEqual(
+            r"(?P<ts___year__1__2>\d{4})-(?P<ts___month__2>\d{2})",
+            template.render(counter, prefix="ts___", suffix="__2"),
+        )
+        self.assertDictEqual({"year": 2, "month": 1}, counter)
+        self.assertEqual(r"(\d{4})-(\d{2})", template.render({}, alias=False))
+
+    def test_regex_template_without_group(self):
+        with self.assertRaises(fmt.FormatterValueError) as context:
+            fmt.RegexTemplate.from_regex(r"(\d{4})").render({})
+        self.assertIn(
+            "Regex format string does not set group name",
+            str(context.exception),
+        )
+
+    def test_formatter_regex_templates(self):
+        templates = fmt.Datetime.regex_templates()
+        self.assertTupleEqual(
+            (
+                "year",
+                "month_pad",
+                "day_pad",
+                "hour_pad",
+                "minute_pad",
+                "second_pad",
+            ),
+            templates["%n"].names,
+        )
+
+
+class SliceParserTestCase(unittest.TestCase):
+    def test_slice_parser_fixed_width(self):
+        slicer = fmt.SliceParser.from_regex(
+            fmt.Datetime.gen_format("%Y%m%d_%H%M%S")
+        )
+        self.assertEqual(15, slicer.width)
+        self.assertDictEqual(
+            {
+                "year": "2022",
+                "month_pad": "12",
+                "day_pad": "30",
+                "hour_pad": "01",
+                "minute_pad": "02",
+                "second_pad": "03",
+            },
+            slicer.parse("20221230_010203"),
+        )
+        self.assertIsNone(slicer.parse("20221330_010203"))
+        self.assertIsNone(slicer.parse("20221230-010203"))
+        self.assertIsNone(slicer.parse("20221230_0102030"))
+
+    def test_slice_parser_variable_width(self):
+        slicer = fmt.SliceParser.from_regex(fmt.Version.gen_format("%m_%n_%c"))
+        self.assertIsNone(slicer.width)
+        self.assertDictEqual(
+            {"major": "1", "minor": "22", "micro": "333"},
+            slicer.parse("1_22_333"),
+        )
+        self.assertIsNone(slicer.parse("1_2222_3"))
+        self.assertIsNone(slicer.parse("1__3"))
+
+    def test_slice_parser_fallback(self):
+        self.assertIsNone(
+            fmt.SliceParser.from_regex(fmt.Serial.gen_format("%c"))
+        )
+        self.assertIsNone(
+            fmt.SliceParser.from_regex(fmt.Version.gen_format("%m.%n.%c"))
+        )
+        self.assertIsNone(
+            fmt.SliceParser.from_regex(fmt.Datetime.gen_format("%-m%d"))
+        )
+        self.assertIsNone(fmt.Serial.compile("%c").slicer)
+        self.assertIsNotNone(fmt.Serial.compile("%p").slicer)
+        self.assertEqual(1234, fmt.Serial.parse("1,234", "%c").value)
+
+
 class PriorityDataTestCase(unittest.TestCase):
     def setUp(self) -> None: ...
 
@@ -61,6 +315,126 @@ class PriorityDataTestCase(unittest.TestCase):
             fmt.PriorityData(**{"value": self.caller, "level": 5}).__repr__(),
         )
 
+    def test_priority_plan(self):
+        plan = fmt.Datetime._priority_plan()
+        self.assertIs(plan, fmt.Datetime._priority_plan())
+        step = next(s for s in plan if s.name == "week_default")
+        self.assertTupleEqual(
+            ("week", 0, True, True),
+            (step.attr, step.level, step.default, step.bound),
+        )
+        self.assertEqual(
+            "3",
+            step.convert(fmt.Datetime.parse("2022-06-15", "%Y-%m-%d")),
+        )
+        self.assertEqual(
+            "PriorityStep(name='year', attr='year', level=10, default=False, "
+            "bound=False)",
+            repr(next(s for s in plan if s.name == "year")),
+        )
+
+        class OffsetConfigSerial(fmt.Serial):
+            class Config(fmt.Serial.Config):
+                offset: int = 10
+
+            @property
+            def priorities(self) -> dict[str, dict]:
+                offset: int = self.Config.offset
+                return {
+                    "number": {
+                        "value": lambda x: str(int(x) + offset),
+                        "level": 1,
+                    },
+                    "number_default": {"value": default("0"), "level": 0},
+                }
+
+        # NOTE: The priority plan recompiles when the config was changed.
+        plan = OffsetConfigSerial._priority_plan()
+        self.assertEqual(15, OffsetConfigSerial.parse("5", "%n").value)
+        OffsetConfigSerial.Config.offset = 20
+        self.assertIsNot(plan, OffsetConfigSerial._priority_plan())
+        self.assertEqual(25, OffsetConfigSerial.parse("5", "%n").value)
+
+    def test_priority_plan_bound_method(self):
+        class OffsetSerial(fmt.Serial):
+            offset: int = 10
+
+            def _from_offset(self, value: str) -> str:
+                return str(int(value) + self.offset)
+
+            @property
+            def priorities(self) -> dict[str, dict]:
+                return {
+                    "number": {"value": self._from_offset, "level": 1},
+                    "number_default": {"value": default("0"), "level": 0},
+                }
+
+        step = OffsetSerial._priority_plan()[0]
+        self.assertTrue(step.bound)
+        self.assertIs(OffsetSerial._from_offset, step.value)
+        self.assertEqual(15, OffsetSerial.parse("5", "%n").value)
+        sr = OffsetSerial.__new__(OffsetSerial)
+        sr.offset = 100
+        self.assertEqual("105", step.convert(sr, "5"))
+
+    def test_priority_plan_shared_priorities(self):
+        class ClosureSerial(fmt.Serial):
+            shared_priorities = False
+            offset: int = 10
+
+            @property
+            def priorities(self) -> dict[str, dict]:
+                return {
+                    "number": {
+                        "value": lambda x: str(int(x) + self.offset),
+                        "level": 1,
+                    },
+                    "number_default": {"value": default("0"), "level": 0},
+                }
+
+        self.assertIsNone(ClosureSerial._priority_plan())
+        self.assertEqual(15, ClosureSerial({"number": "5"}).value)
+        sr = ClosureSerial.__new__(ClosureSerial)
+        sr.offset = 100
+        sr.__init__({"number": "5"})
+        self.assertEqual(105, sr.value)
+
+        class BrokenSerial(fmt.Serial):
+            @property
+            def priorities(self) -> dict[str, dict]:
+                raise KeyError("number")
+
+        # NOTE: The error from the priorities value does not hide by the
+        #   fallback to compile for each instance.
+        with self.assertRaises(KeyError):
+            BrokenSerial._priority_plan()
+        with self.assertRaises(KeyError):
+            BrokenSerial.parse("5", "%n")
+
+    def test_memo_property(self):
+        class PadSerial(fmt.Serial):
+            @property
+            def string(self) -> str:
+                return self.number.zfill(3)
+
+            @fmt.memo_property
+            def padded(self) -> str:
+                return self.number.zfill(5)
+
+        # NOTE: A property of a subclass does not memoize until it decorates
+        #   with the memo property.
+        sr = PadSerial.parse("7", "%n")
+        self.assertEqual("007", sr.string)
+        self.assertIsNone(sr._memo)
+        self.assertEqual("00007", sr.padded)
+        self.assertDictEqual({"padded": "00007"}, sr._memo)
+        sr.number = "42"
+        self.assertIsNone(sr._memo)
+        self.assertEqual("00042", sr.padded)
+
+        nm = fmt.Naming.parse("foo bar", "%n")
+        self.assertIsNot(nm.value, nm.value)
+
 
 class FormatterTestCase(unittest.TestCase):
     def setUp(self) -> None:
@@ -6,6 +6,8 @@
 """
 Test the Datetime formatter object.
 """
+import copy
+import io
 import sys
 import unittest
 from datetime import date, datetime, timedelta
@@ -223,6 +225,20 @@ class DatetimeTestCase(unittest.TestCase):
             str(context.exception),
         )
 
+    def test_datetime_parser_trailing_newline(self):
+        # NOTE: The whole value matching allows one trailing newline like the
+        #   ``^...$`` pattern.
+        self.assertEqual(
+            datetime(2024, 1, 1),
+            fmt.Datetime.parse("20240101\n", "%Y%m%d").value,
+        )
+        self.assertEqual(
+            datetime(2024, 1, 1),
+            fmt.Datetime.parse("2024-01-01\n", "%Y-%m-%d").value,
+        )
+        with self.assertRaises(fmt.FormatterValueError):
+            fmt.Datetime.parse("20240101\n\n", "%Y%m%d")
+
     def test_datetime_parser_cmp_datetime(self):
         self.assertEqual(
             datetime.strptime("2023-09 Sep", "%Y-%m %b"),
@@ -306,6 +322,262 @@ class DatetimeTestCase(unittest.TestCase):
             str(context.exception),
         )
 
+    def test_datetime_compile(self):
+        compiled = fmt.Datetime.compile("%Y%m%d")
+        self.assertIs(compiled, fmt.Datetime.compile("%Y%m%d"))
+        self.assertEqual(("%Y", "%m", "%d"), compiled.codes)
+        self.assertDictEqual(
+            {"year": "year", "month_pad": "month_pad", "day_pad": "day_pad"},
+            compiled.groups,
+        )
+        self.assertEqual(
+            fmt.Datetime.parse("20220101", "%Y%m%d"),
+            compiled.parse(b"20220101"),
+        )
+        self.assertEqual(
+            fmt.Datetime.parse("20220101", "%Y%m%d"),
+            compiled.match("20220101_suffix"),
+        )
+        self.assertIsNone(compiled.fullmatch("20220101_suffix"))
+        self.assertIsNone(compiled.match("2022-01-01"))
+        self.assertEqual("20221230", compiled.format(self.dt))
+        self.assertEqual(
+            "<CompiledFormat(Datetime, fmt='%Y%m%d')>", repr(compiled)
+        )
+
+        with self.assertRaises(fmt.FormatterValueError) as context:
+            compiled.parse("2022-01-01")
+        self.assertIn(
+            "value '2022-01-01' does not match with format",
+            str(context.exception),
+        )
+
+        compiled_dup = fmt.Datetime.compile("%Y%m%d_%m")
+        self.assertEqual(
+            ("year", "month_pad", "day_pad", "month_pad"),
+            tuple(compiled_dup.groups.values()),
+        )
+        self.assertEqual(
+            "2022-01-02 00:00:00.000000",
+            compiled_dup.parse("20220102_01").string,
+        )
+        with self.assertRaises(fmt.FormatterValueError):
+            compiled_dup.parse("20220102_02")
+
+    def test_datetime_from_fields(self):
+        dt = fmt.Datetime.from_fields(year=2022, month=1, day=3, hour=10)
+        parsed = fmt.Datetime.parse("2022-01-03 10", "%Y-%m-%d %H")
+        self.assertEqual(parsed, dt)
+        self.assertEqual(parsed.level, dt.level)
+        self.assertEqual("1", dt.week)
+        self.assertEqual("AM", dt.locale)
+        self.assertEqual("2022-01-03 10:00:00.000000", dt.datetime)
+        dt = fmt.Datetime.from_fields(year=2022, month=1, day=3, week=5)
+        self.assertEqual("5", dt.week)
+        with self.assertRaises(fmt.FormatterValueError):
+            fmt.Datetime.from_fields(
+                year=2022, month=1, day=3, week=5, validate=True
+            )
+
+    def test_datetime_parse_validation(self):
+        value, _fmt = "2022-01-03 Fri", "%Y-%m-%d %a"
+        with self.assertRaises(fmt.FormatterValueError):
+            fmt.Datetime.parse(value, _fmt)
+
+        dt = fmt.Datetime.parse(value, _fmt, validation="off")
+        self.assertEqual(datetime(2022, 1, 3), dt.value)
+        self.assertEqual("5", dt.week)
+
+        dt = fmt.Datetime.parse(value, _fmt, validation="lazy")
+        self.assertEqual("2022-01-03 00:00:00.000000", dt.string)
+        with self.assertRaises(fmt.FormatterValueError):
+            _ = dt.value
+
+        # NOTE: The failed lazy validation keeps pending, so every access
+        #   of the value raises.
+        with self.assertRaises(fmt.FormatterValueError):
+            _ = dt.value
+
+        class DatetimeIntern(fmt.Datetime):
+            class Config(fmt.Datetime.Config):
+                intern_maxsize = 8
+
+        # NOTE: The lazy instance does not validate yet, so it does not share
+        #   with the intern cache.
+        dt = DatetimeIntern.parse(value, _fmt, validation="lazy")
+        dt2 = DatetimeIntern.parse(value, _fmt, validation="lazy")
+        self.assertIsNot(dt, dt2)
+        self.assertEqual(0, DatetimeIntern.intern_info().currsize)
+        with self.assertRaises(fmt.FormatterValueError):
+            _ = dt.value
+        with self.assertRaises(fmt.FormatterValueError):
+            _ = dt2.value
+
+        rs = fmt.Datetime.parse_many(
+            [value, "2022-01-07 Fri"], _fmt, validation="lazy"
+        )
+        self.assertListEqual(
+            [datetime(2022, 1, 7)],
+            [dt.value for dt in rs if dt.day == "07"],
+        )
+        with self.assertRaises(fmt.FormatterArgumentError):
+            fmt.Datetime.parse(value, _fmt, validation="never")
+
+    def test_datetime_validate_fields(self):
+        class CountDatetime(fmt.Datetime):
+            validate_fields = fmt.Datetime.validate_fields
+            calls: int = 0
+
+            def validate(self) -> bool:
+                CountDatetime.calls += 1
+                return super().validate()
+
+        CountDatetime.parse("2022-01-03", "%Y-%m-%d", validation="off")
+        self.assertEqual(0, CountDatetime.calls)
+        CountDatetime.parse("2022-01-03 Mon", "%Y-%m-%d %a")
+        self.assertEqual(1, CountDatetime.calls)
+
+        # NOTE: The date and time attributes validate with the creation of
+        #   the datetime value, so the out of range values raise eagerly.
+        with self.assertRaises(ValueError):
+            fmt.Datetime.parse("2024010125", "%Y%m%d%H")
+        with self.assertRaises(ValueError):
+            fmt.Datetime.parse("202401010061", "%Y%m%d%H%M")
+        with self.assertRaises(ValueError):
+            fmt.Datetime.translate("2024010125", "%Y%m%d%H", "%Y")
+
+    def test_datetime_parse_any(self):
+        fmts: list[str] = ["%Y%m%d", "%Y-%m-%d", "%d%b%Y"]
+        dt, _fmt = fmt.Datetime.parse_any("2022-01-03", fmts)
+        self.assertEqual("%Y-%m-%d", _fmt)
+        self.assertEqual(fmt.Datetime.parse("2022-01-03", "%Y-%m-%d"), dt)
+        dt, _fmt = fmt.Datetime.parse_any(b"03Jan2022", fmts)
+        self.assertEqual("%d%b%Y", _fmt)
+        self.assertEqual("2022-01-03 00:00:00.000000", dt.string)
+
+        # NOTE: The first branch matches but it is not a valid date.
+        dt, _fmt = fmt.Datetime.parse_any("12020231", ["%Y%m%d", "%m%d%H%M"])
+        self.assertEqual("%m%d%H%M", _fmt)
+        self.assertEqual("1900-12-02 02:31:00.000000", dt.string)
+
+        with self.assertRaises(fmt.FormatterValueError) as context:
+            fmt.Datetime.parse_any("2022/01/03", fmts)
+        self.assertIn("does not match with any format", str(context.exception))
+
+        with self.assertRaises(ValueError):
+            fmt.Datetime.parse_any("20220230", ["%Y%m%d"])
+
+        with self.assertRaises(fmt.FormatterArgumentError):
+            fmt.Datetime.parse_any("20220101", [])
+
+    def test_datetime_parse_any_adaptive(self):
+        compiled = fmt.Datetime.compile_any(
+            ["%Y%m%d", "%Y-%m-%d"], adaptive=True
+        )
+        self.assertIs(
+            compiled,
+            fmt.Datetime.compile_any(["%Y%m%d", "%Y-%m-%d"], adaptive=True),
+        )
+        state = compiled.state
+        for _ in range(compiled.reorder_interval):
+            compiled.parse("2022-01-01")
+        self.assertTupleEqual((1, 0), compiled.order)
+
+        # NOTE: The reordering swaps the whole state, so the parsing that read
+        #   the previous state keeps the pattern with its own branches.
+        self.assertIsNot(state, compiled.state)
+        order, pattern, branches = state
+        self.assertTupleEqual((0, 1), order)
+        self.assertTrue(pattern.pattern.startswith("(?P<_b0>"))
+        self.assertEqual(0, branches[pattern.match("20220101").lastgroup][0])
+        self.assertTrue(compiled.pattern.pattern.startswith("(?P<_b1>"))
+        self.assertEqual("%Y%m%d", compiled.parse("20220101")[1])
+
+    def test_datetime_infer_format(self):
+        start = datetime(2021, 1, 1, 3, 4, 5)
+        values = [
+            (start + timedelta(days=i, seconds=i * 97)).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            for i in range(200)
+        ]
+        rs = fmt.Datetime.infer_format(values)
+        self.assertEqual(
+            fmt.FormatCandidate("%Y-%m-%d %H:%M:%S", 1.0), rs[0]
+        )
+        values = [
+            (start + timedelta(days=i)).strftime("%Y%m%d") for i in range(99)
+        ]
+        rs = fmt.Datetime.infer_format([*values, "unknown"], limit=1)
+        self.assertEqual(fmt.FormatCandidate("%Y%m%d", 0.99), rs[0])
+        self.assertListEqual([], fmt.Datetime.infer_format([]))
+
+        # NOTE: The short year sets the year that leads the base format, so
+        #   it comes before the hour that also matches these values.
+        values = [
+            (start + timedelta(days=i)).strftime("%d/%m/%y") for i in range(60)
+        ]
+        rs = fmt.Datetime.infer_format(values, limit=1)
+        self.assertEqual(fmt.FormatCandidate("%d/%m/%y", 1.0), rs[0])
+        self.assertEqual(0, fmt.Datetime.infer_specs()["%y"].rank)
+        self.assertEqual(3, fmt.Datetime.infer_specs()["%-H"].rank)
+
+    def test_datetime_finditer(self):
+        text: str = (
+            "INFO 2022-12-30 01:02:03 start\n"
+            "WARN 2023-02-30 00:00:00 skip\n"
+            "INFO 2024-01-01 10:11:12 end"
+        )
+        rs = fmt.Datetime.finditer(text, "%Y-%m-%d %H:%M:%S")
+        span, dt = next(rs)
+        self.assertTupleEqual((5, 24), span)
+        self.assertEqual("2022-12-30 01:02:03", text[slice(*span)])
+        self.assertEqual(
+            fmt.Datetime.parse("2022-12-30 01:02:03", "%Y-%m-%d %H:%M:%S"), dt
+        )
+        span, dt = next(rs)
+        self.assertEqual("2024-01-01 10:11:12", text[slice(*span)])
+        self.assertListEqual([], list(rs))
+
+        span, dt = fmt.Datetime.search(text.encode(), "%Y-%m-%d")
+        self.assertTupleEqual((5, 15), span)
+        self.assertEqual("2022-12-30 00:00:00.000000", dt.string)
+        self.assertIsNone(fmt.Datetime.search("no date", "%Y-%m-%d"))
+
+    def test_datetime_parse_many(self):
+        values = iter(["20220101", b"20220102", "2022-01-03", "20220230"])
+        rs = fmt.Datetime.parse_many(values, "%Y%m%d", on_error="collect")
+        self.assertEqual(fmt.Datetime.parse("20220101", "%Y%m%d"), next(rs))
+        self.assertEqual(fmt.Datetime.parse("20220102", "%Y%m%d"), next(rs))
+        failure = next(rs)
+        self.assertIsInstance(failure, fmt.ParseFailure)
+        self.assertEqual("2022-01-03", failure.value)
+        self.assertIn("does not match with format", failure.reason)
+        failure = next(rs)
+        self.assertEqual("20220230", failure.value)
+        self.assertIn("day is out of range", failure.reason)
+        self.assertListEqual([], list(rs))
+
+        self.assertListEqual(
+            ["2022-01-01 00:00:00.000000"],
+            [
+                dt.string
+                for dt in fmt.Datetime.parse_many(
+                    ["20220101", "2022-01-03"], "%Y%m%d", on_error="skip"
+                )
+            ],
+        )
+
+        with self.assertRaises(fmt.FormatterValueError):
+            list(fmt.Datetime.parse_many(["2022-01-03"], "%Y%m%d"))
+
+        with self.assertRaises(fmt.FormatterArgumentError) as context:
+            fmt.Datetime.parse_many(["20220101"], "%Y%m%d", on_error="pass")
+        self.assertIn(
+            "The error policy, 'pass', does not support",
+            str(context.exception),
+        )
+
     def test_datetime_format(self):
         self.assertEqual(
             r"(\d{4})(01|02|03|04|05|06|07|08|09|10|11|12)([0-3][0-9])",
@@ -316,6 +588,138 @@ class DatetimeTestCase(unittest.TestCase):
         self.assertEqual("2022", self.dt.format("%Y"))
         self.assertEqual("2022", f"{self.dt:%Y}")
 
+    def test_datetime_format_template(self):
+        template = fmt.Datetime.compile_template("/%Y/%-m/%%d_%H.csv")
+        self.assertIs(
+            template, fmt.Datetime.compile_template("/%Y/%-m/%%d_%H.csv")
+        )
+        self.assertEqual(("/", "/", "/%d_", ".csv"), template.parts)
+        self.assertEqual(("%Y", "%-m", "%H"), template.codes)
+        self.assertTrue(all(r is not None for r in template.renderers))
+        self.assertEqual("/2022/12/%d_00.csv", template.render(self.dt))
+        self.assertEqual(
+            "/2022/12/%d_00.csv", self.dt.format("/%Y/%-m/%%d_%H.csv")
+        )
+        self.assertIsNone(fmt.Serial.compile_template("%p").renderers[0])
+
+        dt = fmt.Datetime.from_value(datetime(2023, 4, 5, 6, 7, 8))
+        for fmt_str, expected in (
+            ("%Y-%m-%d %H:%M:%S %%p", "2023-04-05 06:07:08 %p"),
+            ("%-d/%-m/%y %-H%p", "5/4/23 6AM"),
+            ("ปี %Y เดือน %B", "ปี 2023 เดือน April"),
+        ):
+            template = fmt.Datetime.compile_template(fmt_str)
+            self.assertIsNotNone(template.fused)
+            self.assertEqual(expected, template.render(dt))
+            self.assertEqual(
+                expected,
+                fmt.FormatTemplate(
+                    template.parts, template.codes, template.renderers
+                ).render(dt),
+            )
+        self.assertIsNone(fmt.Serial.compile_template("%p").fused)
+
+        with self.assertRaises(fmt.FormatterKeyError) as context:
+            fmt.Datetime.compile_template("%Y-%Z")
+        self.assertEqual(
+            "the format: '%Z' does not support for 'Datetime'",
+            str(context.exception),
+        )
+
+    def test_datetime_code_renderers(self):
+        dt = datetime(2023, 4, 5, 6, 7, 8, 9)
+        formatters = fmt.Datetime.formatter(dt)
+        self.assertEqual(set(formatters), set(fmt.Datetime.code_renderers))
+        for code, renderer in fmt.Datetime.code_renderers.items():
+            self.assertEqual(formatters[code]["value"](), renderer(dt))
+            self.assertEqual(
+                renderer(dt),
+                fmt.Datetime._fused_renderer(("", ""), (code,))(dt),
+            )
+        self.assertIsNone(fmt.Serial.code_renderers)
+
+    def test_datetime_format_many(self):
+        values = [self.dt, datetime(2023, 4, 5, 6), date(2024, 1, 2)]
+        self.assertListEqual(
+            ["/2022/12/00.csv", "/2023/04/06.csv", "/2024/01/00.csv"],
+            list(fmt.Datetime.format_many(values, "/%Y/%m/%H.csv")),
+        )
+        self.assertListEqual(
+            [self.dt.format(fmt.Datetime.base_fmt)],
+            list(fmt.Datetime.format_many([self.dt])),
+        )
+
+        sink = io.BytesIO()
+        self.assertEqual(
+            3, fmt.Datetime.format_many(values, "%Y%m%d", sink=sink, sep=",")
+        )
+        self.assertEqual(b"20221230,20230405,20240102,", sink.getvalue())
+
+        with self.assertRaises(fmt.FormatterKeyError):
+            fmt.Datetime.format_many(values, "%Y-%Z")
+
+    def test_datetime_translate(self):
+        self.assertEqual(
+            "2024/01/31",
+            fmt.Datetime.translate("20240131", "%Y%m%d", "%Y/%m/%d"),
+        )
+        self.assertEqual(
+            fmt.Datetime.parse("20240131", "%Y%m%d").format(
+                fmt.Datetime.base_fmt
+            ),
+            fmt.Datetime.translate("20240131", "%Y%m%d"),
+        )
+        translator = fmt.Datetime.compile_translator("%Y-%m-%d %a", "%d/%m/%Y")
+        self.assertIs(
+            translator,
+            fmt.Datetime.compile_translator("%Y-%m-%d %a", "%d/%m/%Y"),
+        )
+
+        # NOTE: The date attributes exist in the output format, so the
+        #   validation runs and checks the parsed weekday.
+        self.assertEqual("eager", translator.validation)
+        with self.assertRaises(fmt.FormatterValueError):
+            translator.translate("2024-01-31 Mon")
+        self.assertEqual("31/01/2024", translator.translate("2024-01-31 Wed"))
+
+        # NOTE: The shorts and vowels attributes do not exist in the output
+        #   format, so the validation of Naming will skip.
+        self.assertEqual(
+            "off", fmt.Naming.compile_translator("%s", "%k").validation
+        )
+
+        rs = list(
+            fmt.Datetime.translate_many(
+                ["20240131", "2024013x", "20240231"],
+                "%Y%m%d",
+                "%Y/%m/%d",
+                on_error="collect",
+            )
+        )
+        self.assertEqual("2024/01/31", rs[0])
+        self.assertEqual("2024013x", rs[1].value)
+        self.assertEqual(
+            fmt.ParseFailure("20240231", "day is out of range for month"),
+            rs[2],
+        )
+
+        sink = io.StringIO()
+        self.assertEqual(
+            1,
+            fmt.Datetime.translate_many(
+                ["20240131", "2024013x"],
+                "%Y%m%d",
+                "%Y/%m/%d",
+                on_error="skip",
+                sink=sink,
+            ),
+        )
+        self.assertEqual("2024/01/31\n", sink.getvalue())
+        with self.assertRaises(fmt.FormatterArgumentError):
+            fmt.Datetime.translate_many(
+                [], "%Y%m%d", on_error="collect", sink=sink
+            )
+
     def test_datetime_form_value(self):
         self.assertEqual(
             "2023-01-23 00:00:00.000000",
@@ -326,6 +730,26 @@ class DatetimeTestCase(unittest.TestCase):
             fmt.Datetime.from_value("2023-01-23").string,
         )
 
+        self.assertEqual(
+            fmt.Datetime.parse(
+                "2022-03-04 05:06:07.000008", fmt.Datetime.base_fmt
+            ),
+            fmt.Datetime.from_value(datetime(2022, 3, 4, 5, 6, 7, 8)),
+        )
+        self.assertEqual(
+            "0001-01-01 00:00:00.000000",
+            fmt.Datetime.from_value(datetime(1, 1, 1)).string,
+        )
+
+        class DatetimeDate(fmt.Datetime, fmt="%Y%m%d"):
+            pass
+
+        dt = DatetimeDate.from_value(datetime(2022, 3, 4, 5, 6))
+        self.assertEqual("2022-03-04 00:00:00.000000", dt.string)
+        self.assertEqual(
+            frozenset({"year", "month", "day"}), DatetimeDate._base_attrs()
+        )
+
         # NOTE: '20230123' is valid for python-version >= 3.11
         with self.assertRaises(ValueError) as context:
             _ = fmt.Datetime.from_value("2023012300").string
@@ -334,6 +758,80 @@ class DatetimeTestCase(unittest.TestCase):
             str(context.exception),
         )
 
+    def test_datetime_memo(self):
+        dt = fmt.Datetime.parse("2022-01-03", "%Y-%m-%d")
+        self.assertIs(dt.value, dt.value)
+        self.assertIs(dt.value, dt.sort_key)
+        self.assertEqual("2022-01-03 00:00:00.000000", dt.string)
+        dt.day = "04"
+        self.assertIsNone(dt._memo)
+        self.assertEqual(datetime(2022, 1, 4), dt.value)
+        self.assertEqual("2022-01-04 00:00:00.000000", dt.string)
+
+    def test_datetime_packed(self):
+        dt = fmt.Datetime.parse(
+            "2022-01-03 10:11:12 PM", "%Y-%m-%d %I:%M:%S %p"
+        )
+        self.assertEqual(("_packed",), fmt.Datetime.__slots__)
+        self.assertIsInstance(dt._packed, int)
+        self.assertEqual(
+            ("2022", "01", "03", "22", "PM", "1"),
+            (dt.year, dt.month, dt.day, dt.hour, dt.locale, dt.week),
+        )
+        self.assertEqual("2022-01-03 22:11:12.000000", dt.datetime)
+        self.assertIsInstance(fmt.Datetime.year, fmt.PackedField)
+
+        dt.month = "12"
+        self.assertEqual("2022-12-03 22:11:12.000000", dt.string)
+        dt.month = None
+        self.assertIsNone(dt.month)
+        self.assertEqual("2022", dt.year)
+
+        with self.assertRaises(fmt.FormatterValueError) as context:
+            dt.year = "20000"
+        self.assertEqual(
+            "The year field does not support for value, '20000', it is out "
+            "of range.",
+            str(context.exception),
+        )
+        with self.assertRaises(fmt.FormatterValueError):
+            dt.locale = "XM"
+
+    def test_datetime_frozen(self):
+        dt = fmt.Datetime({"year": "2022", "month": "01"}, frozen=True)
+        self.assertTrue(dt.frozen)
+        self.assertFalse(fmt.Datetime.parse("2022-01", "%Y-%m").frozen)
+        self.assertEqual(hash(dt.string), hash(dt))
+        self.assertIn(fmt.Datetime.parse("2022-01", "%Y-%m"), {dt})
+
+        with self.assertRaises(AttributeError) as context:
+            dt.day = "04"
+        self.assertEqual(
+            "cannot assign to field 'day' of frozen 'Datetime' instance",
+            str(context.exception),
+        )
+        with self.assertRaises(AttributeError):
+            del dt.day
+
+        # NOTE: The slot level of the frozen instance is frozen too.
+        value = dt.level.value
+        with self.assertRaises(AttributeError) as context:
+            dt.level.update(tuple(range(1, dt.level.level + 1)))
+        self.assertEqual(
+            "cannot update the slot of frozen 'SlotLevel' instance",
+            str(context.exception),
+        )
+        with self.assertRaises(AttributeError):
+            dt.level.slot[0] = not dt.level.slot[0]
+        self.assertEqual(value, dt.level.value)
+        self.assertEqual(hash(dt.string), hash(dt))
+
+        copied = copy.copy(dt)
+        self.assertTrue(copied.frozen)
+        self.assertEqual(dt, copied)
+        self.assertIs(dt, dt.freeze())
+        self.assertTrue(fmt.Datetime.from_fields(year=2022, frozen=True).frozen)
+
     def test_datetime_order(self):
         self.assertLessEqual(
             fmt.Datetime.parse("2021-01-1 135043", "%Y-%m-%-d %f"),
@@ -377,6 +875,7 @@ class DatetimeTestCase(unittest.TestCase):
             )
 
         self.assertEqual(timedelta(days=349, seconds=43), (self.dt - self.dt2))
+        self.assertEqual(1, fmt.lazy_relativedelta.cache_info().currsize)
 
         # 2022-12-30 00:00:43 + 10 days
         self.assertEqual(
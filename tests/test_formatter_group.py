@@ -7,6 +7,7 @@
 Test the formatter object.
 """
 import datetime
+import io
 import unittest
 
 import fmtutil.formatter as fmt
@@ -214,6 +215,84 @@ class FormatterGroupTestCase(unittest.TestCase):
             "{name:%s}_in_{datetime:%Y%m%d}_{name:%a}__{datetime:%n}"
         )
 
+    def test_fmt_group_compile_pattern(self):
+        self.DateName.cache_clear()
+        hits: int = self.DateName.cache_info().hits
+        pattern, _fmt_getter = self.DateName.compile_pattern(
+            "{name:%s}_in_{datetime:%Y%m%d}"
+        )
+        self.assertEqual(
+            self.DateName.gen_format("{name:%s}_in_{datetime:%Y%m%d}")[0],
+            pattern.pattern,
+        )
+        self.assertDictEqual(
+            {"name": {"fmt": "%s"}, "datetime": {"fmt": "%Y%m%d"}},
+            _fmt_getter,
+        )
+        self.DateName.parse(
+            "data_engineer_in_20220101", fmt="{name:%s}_in_{datetime:%Y%m%d}"
+        )
+        self.assertEqual(1, self.DateName.cache_info().hits - hits)
+        self.DateName.cache_clear()
+        self.assertEqual(0, self.DateName.cache_info().currsize)
+
+    def test_fmt_group_parse_many(self):
+        _fmt: str = "{name:%s}_in_{datetime:%Y%m%d}"
+        rs = list(
+            self.DateName.parse_many(
+                [
+                    "data_engineer_in_20220101",
+                    "data_engineer_20220101",
+                    "data_engineer_in_20221301",
+                ],
+                fmt=_fmt,
+                on_error="collect",
+            )
+        )
+        self.assertEqual(3, len(rs))
+        self.assertEqual(
+            self.DateName.parse("data_engineer_in_20220101", fmt=_fmt), rs[0]
+        )
+        self.assertIsInstance(rs[1], fmt.ParseFailure)
+        self.assertIsInstance(rs[2], fmt.ParseFailure)
+        self.assertEqual(
+            1,
+            len(
+                list(
+                    self.DateName.parse_many(
+                        ["data_engineer_in_20220101", "data_engineer"],
+                        fmt=_fmt,
+                        on_error="skip",
+                    )
+                )
+            ),
+        )
+        with self.assertRaises(fmt.FormatterGroupArgumentError):
+            list(self.DateName.parse_many(["data_engineer"], fmt=_fmt))
+
+    def test_fmt_group_finditer(self):
+        _fmt: str = "{name:%s}_in_{datetime:%Y%m%d}"
+        text: str = "/data/data_engineer_in_20220101/data_engineer_in_20221301"
+        rs = list(self.DateName.finditer(text, fmt=_fmt))
+        self.assertEqual(1, len(rs))
+        self.assertTupleEqual((6, 31), rs[0][0])
+        self.assertEqual(
+            self.DateName.parse("data_engineer_in_20220101", fmt=_fmt),
+            rs[0][1],
+        )
+        self.assertEqual(rs[0], self.DateName.search(text, fmt=_fmt))
+        self.assertIsNone(self.DateName.search("/data/", fmt=_fmt))
+
+    def test_fmt_group_parser_trailing_newline(self):
+        self.assertEqual(
+            self.DateName.parse(
+                "data engineer_20220101", "{name}_{datetime:%Y%m%d}"
+            ),
+            self.DateName.parse(
+                "data engineer_20220101\n", "{name}_{datetime:%Y%m%d}"
+            ),
+        )
+
     def test_fmt_group_parser(self):
         self.assertEqual(
             {
@@ -316,6 +395,41 @@ class FormatterGroupTestCase(unittest.TestCase):
             self.gp2.format("{datetime}_{version}_{datetime}.csv"),
         )
 
+    def test_fmt_group_format_many(self):
+        fmt_str: str = "{datetime:%Y%m%d}_v{version:%m.%n.%c}.csv"
+        self.assertListEqual(
+            ["20220101_v1.2.3.csv", "20230405_v1.2.3.csv"],
+            list(
+                self.DateVersion.format_many(
+                    [
+                        self.gp2,
+                        {
+                            "datetime": datetime.datetime(2023, 4, 5),
+                            "version": "1.2.3",
+                        },
+                    ],
+                    fmt_str,
+                )
+            ),
+        )
+        parts, templates = self.DateVersion.compile_template(fmt_str)
+        self.assertEqual(("", "_v", ".csv"), parts)
+        self.assertListEqual(
+            ["datetime", "version"], [group for group, _ in templates]
+        )
+        self.assertIs(templates[0][1], fmt.Datetime.compile_template("%Y%m%d"))
+
+        sink = io.StringIO()
+        self.assertEqual(
+            2, self.DateVersion.format_many([self.gp2] * 2, fmt_str, sink=sink)
+        )
+        self.assertEqual(
+            "20220101_v1.2.3.csv\n20220101_v1.2.3.csv\n", sink.getvalue()
+        )
+
+        with self.assertRaises(fmt.FormatterGroupValueError):
+            self.DateVersion.format_many([self.gp2], "{timestamp}")
+
     def test_fmt_group_format_raise(self):
         with self.assertRaises(fmt.FormatterGroupArgumentError) as context:
             self.gp2.format("{datetime:%Y_%m_%d_%H%M%S_%K}_v{version:%f}.csv")
@@ -482,6 +596,13 @@ class FormatterGroupTestCase(unittest.TestCase):
             .value,
         )
 
+        group = self.DateVersion.parse(
+            "20220101_1_0_0", fmt="{datetime:%Y%m%d}_{version}"
+        )
+        adjusted = group.adjust({"datetime": datetime.timedelta(days=1)})
+        self.assertIs(group.groups["version"], adjusted.groups["version"])
+        self.assertListEqual(list(group.groups), list(adjusted.groups))
+
         with self.assertRaises(fmt.FormatterGroupValueError) as context:
             self.DateVersion.parse(
                 "20220101_1_0_0",
@@ -492,3 +613,27 @@ class FormatterGroupTestCase(unittest.TestCase):
             "<class 'fmtutil.formatter.VersionDatetimeGroup'>.",
             str(context.exception),
         )
+
+    def test_fmt_group_infer_format(self):
+        values = [
+            f"/logs/{d:%Y-%m-%d}/{name}.csv"
+            for d in (
+                datetime.date(2022, 1, 1) + datetime.timedelta(days=i)
+                for i in range(40)
+            )
+            for name in ("data_engineer", "ml_ops")
+        ]
+        rs = self.DateName.infer_format(values, limit=1)
+        self.assertEqual(
+            fmt.FormatCandidate(
+                "/logs/{datetime:%Y-%m-%d}/{name:%s}.csv", 1.0
+            ),
+            rs[0],
+        )
+        self.assertEqual(
+            self.DateName.parse(values[0], rs[0].fmt),
+            self.DateName.parse(
+                "/logs/2022-01-01/data_engineer.csv",
+                "/logs/{datetime:%Y-%m-%d}/{name:%s}.csv",
+            ),
+        )
@@ -61,7 +61,7 @@ class NamingTestCase(unittest.TestCase):
                 "%v": "fbr",
                 "%V": "FBR",
             },
-            fmt.Naming().values(["foo", "bar"]),
+            fmt.Naming().values(["foo", "bar"]).to_dict(),
         )
         self.assertDictEqual(
             {
@@ -88,7 +88,7 @@ class NamingTestCase(unittest.TestCase):
                 "%v": "fbr",
                 "%V": "FBR",
             },
-            fmt.Naming().values("foo bar"),
+            fmt.Naming().values("foo bar").to_dict(),
         )
         self.assertDictEqual(
             {
@@ -115,9 +115,19 @@ class NamingTestCase(unittest.TestCase):
                 "%v": "",
                 "%V": "",
             },
-            fmt.Naming().values(),
+            fmt.Naming().values().to_dict(),
         )
 
+        values = self.nm_p.values()
+        self.assertIs(values, self.nm_p.values())
+        self.assertEqual("data-engineer", values["%k"])
+        self.assertDictEqual({"%k": "data-engineer"}, values.data)
+        self.assertEqual(22, len(values))
+        self.assertIn("%V", values)
+        self.assertEqual("DE", values.get("%A"))
+        self.assertIsNone(values.get("%Z"))
+        self.assertEqual(values.to_dict(), dict(values))
+
     def test_naming_regex(self):
         self.assertDictEqual(
             {
@@ -257,6 +267,16 @@ class NamingTestCase(unittest.TestCase):
             str(context.exception),
         )
 
+    def test_naming_parse_validation(self):
+        for validation in ("eager", "lazy", "off"):
+            nm = fmt.Naming.parse(
+                "databricks db", "%f %a", validation=validation
+            )
+            self.assertEqual("data bricks", nm.string)
+        nm = fmt.Naming.parse("foobar ff", "%f %a", validation="lazy")
+        with self.assertRaises(fmt.FormatterValueError):
+            _ = nm.value
+
     def test_naming_format(self):
         self.assertEqual("data_engineer", self.nm.format("%s"))
         self.assertEqual("DATA-ENGINEER", self.nm.format("%K"))
@@ -93,6 +93,13 @@ class SerialTestCase(unittest.TestCase):
         self.assertEqual(0, self.sr_default.value)
         self.assertEqual("0", self.sr_default.string)
 
+    def test_serial_keep_digits(self):
+        sr = fmt.Serial.parse("0012", "%n")
+        self.assertEqual("0012", sr.number)
+        self.assertEqual("0012", sr.string)
+        self.assertEqual("007", fmt.Serial.parse("007", "%n").string)
+        self.assertNotEqual(hash(fmt.Serial.parse("12", "%n")), hash(sr))
+
     def test_serial_gen_format(self):
         self.assertEqual(
             "This is normal number (?P<number>[0-9]*) and except %n",
@@ -72,6 +72,14 @@ class StorageTestCase(unittest.TestCase):
             decimal.Decimal("10"), fmt.Storage.from_value("10").value
         )
 
+    def test_storage_from_fields(self):
+        st = fmt.Storage.from_fields(byte=1310)
+        self.assertEqual(self.st_p, fmt.Storage.from_fields(bit=82824))
+        self.assertEqual(decimal.Decimal("10480"), st.value)
+        self.assertEqual(self.st.level, st.level)
+        with self.assertRaises(fmt.FormatterValueError):
+            fmt.Storage.from_fields(bit=8, byte=2, validate=True)
+
     def test_storage_regex(self):
         self.assertDictEqual(
             {
@@ -93,6 +101,13 @@ class StorageTestCase(unittest.TestCase):
         with self.assertRaises(fmt.FormatterValueError):
             fmt.Storage.parse("150 19B", "%b %B")
 
+        # NOTE: The default byte attribute creates from the parsed bit, so
+        #   the bit that does not fit to whole bytes does not valid.
+        with self.assertRaises(fmt.FormatterValueError):
+            fmt.Storage.parse("1.5", "%b")
+        with self.assertRaises(fmt.FormatterValueError):
+            fmt.Storage.parse("3.3", "%b")
+
     def test_storage_formatter(self):
         formatter = fmt.Storage.formatter(storage=512)
         regex = fmt.Storage.regex()
@@ -50,6 +50,18 @@ class VersionTestCase(unittest.TestCase):
     def test_version_from_value(self):
         self.assertEqual("v1.2.3", fmt.Version.from_value("1.2.3").string)
 
+    def test_version_from_fields(self):
+        vs = fmt.Version.from_fields(major=1, minor=2, micro=3, pre="b4")
+        self.assertEqual(self.vs_p, vs)
+        self.assertEqual(self.vs_p.level, vs.level)
+        self.assertEqual("v1.2.3b4", vs.version)
+        with self.assertRaises(fmt.FormatterArgumentError) as context:
+            fmt.Version.from_fields(major=1, patch=2)
+        self.assertEqual(
+            "('patch'): The fields do not support for 'Version'.",
+            str(context.exception),
+        )
+
     def test_version_raise_for_pre_or_post_not_valid(self):
         with self.assertRaises(FormatterValueError) as context:
             fmt.Version(
@@ -65,6 +77,12 @@ class VersionTestCase(unittest.TestCase):
             str(context.exception),
         )
 
+    def test_version_infer_format(self):
+        values = [f"v{i % 3}_{i % 7}_{i}" for i in range(1, 60)]
+        rs = fmt.Version.infer_format(values, limit=2)
+        self.assertEqual(fmt.FormatCandidate("v%m_%n_%c", 1.0), rs[0])
+        self.assertEqual("%n", fmt.Serial.infer_format(["1", "23"])[0].fmt)
+
     def test_version_regex(self):
         self.assertDictEqual(
             {
@@ -165,6 +183,16 @@ class VersionTestCase(unittest.TestCase):
             in str(context.exception)
         )
 
+    def test_version_epoch(self):
+        for epoch in ("65534", "65535", "70000", "99999999999999999999"):
+            vs = fmt.Version.parse(f"{epoch}!1.2.3", "%e%m.%n.%c")
+            self.assertEqual(epoch, vs.epoch)
+            self.assertEqual(("1", "2", "3"), (vs.major, vs.minor, vs.micro))
+            self.assertEqual(f"{epoch}!1.2.3", vs.string)
+        vs = fmt.Version.parse("01_02_03", "%m_%n_%c")
+        self.assertEqual(("01", "02", "03"), (vs.major, vs.minor, vs.micro))
+        self.assertEqual("v01.02.03", str(vs))
+
     def test_version_properties(self):
         self.assertEqual(
             "<Version.parse('v8.1.0post2+local1.0', 'v%m.%n.%c%p%l')>",
@@ -200,6 +228,36 @@ class VersionTestCase(unittest.TestCase):
             "1!_4_8_12_1_local0.0.13", self.vs2.format("%e_%f_%d_%l")
         )
 
+    def test_version_translate(self):
+        self.assertEqual(
+            "1.2.3", fmt.Version.translate("v1_2_3", "v%m_%n_%c", "%m.%n.%c")
+        )
+        self.assertListEqual(
+            ["1.2.3", "4.0.12"],
+            list(
+                fmt.Version.translate_many(
+                    ["v1_2_3", "v4_0_12"], "v%m_%n_%c", "%m.%n.%c"
+                )
+            ),
+        )
+
+    def test_version_sort_key(self):
+        versions = [
+            fmt.Version.parse(v, f)
+            for v, f in (
+                ("1.2.3", "%m.%n.%c"),
+                ("1.2.3rc1", "%m.%n.%c%q"),
+                ("1.2.3a1", "%m.%n.%c%q"),
+                ("0.9.9", "%m.%n.%c"),
+            )
+        ]
+        self.assertListEqual(
+            ["v0.9.9", "v1.2.3a1", "v1.2.3rc1", "v1.2.3"],
+            [v.string for v in sorted(versions)],
+        )
+        self.assertIs(versions[0].sort_key, versions[0].sort_key)
+        self.assertEqual(versions[0].value.sort_key(), versions[0].sort_key)
+
     def test_version_order(self):
         self.assertTrue(self.vs <= self.vs2)
 